@@ -19,8 +19,13 @@ class UserData:
 
 # Abstract Handler
 class DataHandler(ABC):
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
         self._next_handler = None
+        self.verbose = verbose
+
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
 
     def set_next(self, handler):
         """Stelt de volgende handler in de keten in"""
@@ -50,7 +55,7 @@ class EmailValidationHandler(DataHandler):
         email = user_data.data.get("email", "")
         if "@" not in email or "." not in email:
             user_data.add_error("Ongeldig email adres")
-        print(f"✓ Email validatie uitgevoerd")
+        self._log(f"✓ Email validatie uitgevoerd")
 
 
 class AgeValidationHandler(DataHandler):
@@ -60,7 +65,7 @@ class AgeValidationHandler(DataHandler):
             user_data.add_error("Gebruiker moet minimaal 18 jaar zijn")
         elif age > 120:
             user_data.add_error("Leeftijd is niet realistisch")
-        print(f"✓ Leeftijd validatie uitgevoerd")
+        self._log(f"✓ Leeftijd validatie uitgevoerd")
 
 
 # Transformatie Handlers
@@ -69,7 +74,7 @@ class NameNormalizationHandler(DataHandler):
         if "name" in user_data.data:
             # Transformeer naam naar Title Case
             user_data.data["name"] = user_data.data["name"].strip().title()
-            print(f"✓ Naam genormaliseerd naar: {user_data.data['name']}")
+            self._log(f"✓ Naam genormaliseerd naar: {user_data.data['name']}")
 
 
 class EmailNormalizationHandler(DataHandler):
@@ -77,7 +82,7 @@ class EmailNormalizationHandler(DataHandler):
         if "email" in user_data.data:
             # Transformeer email naar lowercase
             user_data.data["email"] = user_data.data["email"].strip().lower()
-            print(f"✓ Email genormaliseerd naar: {user_data.data['email']}")
+            self._log(f"✓ Email genormaliseerd naar: {user_data.data['email']}")
 
 
 class DataEnrichmentHandler(DataHandler):
@@ -90,16 +95,24 @@ class DataEnrichmentHandler(DataHandler):
             user_data.data["category"] = "minderjarige"
 
         user_data.data["processed"] = True
-        print(f"✓ Data verrijkt met category: {user_data.data['category']}")
+        self._log(f"✓ Data verrijkt met category: {user_data.data['category']}")
+
+
+# De volledige verwerkingsketen
+def build_chain(verbose: bool = True) -> DataHandler:
+    chain = EmailValidationHandler(verbose)
+    chain.set_next(AgeValidationHandler(verbose)).set_next(
+        NameNormalizationHandler(verbose)
+    ).set_next(EmailNormalizationHandler(verbose)).set_next(
+        DataEnrichmentHandler(verbose)
+    )
+    return chain
 
 
 # Client code
 def main():
     # Bouw de verwerkingsketen
-    chain = EmailValidationHandler()
-    chain.set_next(AgeValidationHandler()).set_next(
-        NameNormalizationHandler()
-    ).set_next(EmailNormalizationHandler()).set_next(DataEnrichmentHandler())
+    chain = build_chain()
 
     # Test verschillende gebruikers
     test_users = [
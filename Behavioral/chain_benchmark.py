@@ -0,0 +1,53 @@
+import contextlib
+import os
+import time
+
+from Behavioral.chain_compiled import CompiledChain
+from Behavioral.chain_fixtures import make_users
+from Behavioral.Chain_of_respon_2 import UserData, build_chain
+
+RECORDS = 1_000_000
+PRINTING_RECORDS = 100_000  # Met prints is 1M records te traag om af te wachten
+
+
+def handle_each(handler, users: list[UserData]) -> None:
+    for user_data in users:
+        handler.handle(user_data)
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    variants = [
+        ("keten, met prints", PRINTING_RECORDS, handle_each, build_chain()),
+        ("keten, verbose=False", RECORDS, handle_each, build_chain(False)),
+        ("CompiledChain.handle()", RECORDS, handle_each, CompiledChain(build_chain())),
+        (
+            "CompiledChain.handle_all()",
+            RECORDS,
+            CompiledChain.handle_all,
+            CompiledChain(build_chain()),
+        ),
+        (
+            "idem, stop_on_error",
+            RECORDS,
+            CompiledChain.handle_all,
+            CompiledChain(build_chain(), stop_on_error=True),
+        ),
+    ]
+    print(f"{'variant':<30}{'records':>10}{'records/s':>14}")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = []
+        for name, count, function, handler in variants:
+            users = make_users(count)
+            results.append((name, count, count / timed(function, handler, users)))
+    for name, count, rate in results:
+        print(f"{name:<30}{count:>10,}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
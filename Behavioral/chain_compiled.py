@@ -0,0 +1,94 @@
+import copy
+from typing import Iterable
+
+from Behavioral.Chain_of_respon_2 import DataHandler, UserData
+
+
+def flatten(head: DataHandler) -> list[DataHandler]:
+    """De handlers van de keten in volgorde, door _next_handler te volgen"""
+    handlers = []
+    seen = set()
+    handler = head
+    while handler is not None:
+        # Een eigen handle() kan de keten anders doorlopen dan process() + door
+        if type(handler).handle is not DataHandler.handle:
+            raise TypeError(f"{type(handler).__name__} overschrijft handle()")
+        if id(handler) in seen:
+            raise ValueError("De keten bevat een lus")
+        seen.add(id(handler))
+        handlers.append(handler)
+        handler = handler._next_handler
+    return handlers
+
+
+# Keten als één lus over de process-methodes, zonder recursie
+class CompiledChain:
+    """
+    Zelfde resultaat als head.handle(), maar zonder een call frame per schakel
+    en standaard zonder prints: handlers met een andere verbose-stand worden
+    gekopieerd, de originele keten blijft ongemoeid. Met stop_on_error stopt
+    de verwerking van een record bij de eerste validatiefout. Wijzigingen
+    aan de keten na het compileren tellen niet mee.
+    """
+
+    def __init__(
+        self, head: DataHandler, verbose: bool = False, stop_on_error: bool = False
+    ):
+        self.handlers = flatten(head)
+        self.verbose = verbose
+        self.stop_on_error = stop_on_error
+        steps = []
+        for handler in self.handlers:
+            if handler.verbose != verbose:
+                handler = copy.copy(handler)
+                handler.verbose = verbose
+            steps.append(handler.process)
+        self._steps = tuple(steps)
+
+    def handle(self, user_data: UserData) -> UserData:
+        if self.stop_on_error:
+            for step in self._steps:
+                step(user_data)
+                if not user_data.is_valid:
+                    break
+        else:
+            for step in self._steps:
+                step(user_data)
+        return user_data
+
+    def handle_all(self, records: Iterable[UserData]) -> int:
+        """Verwerkt alle records in één lus; geeft het aantal geldige terug"""
+        steps = self._steps
+        valid = 0
+        if self.stop_on_error:
+            for user_data in records:
+                for step in steps:
+                    step(user_data)
+                    if not user_data.is_valid:
+                        break
+                else:
+                    valid += 1
+        else:
+            for user_data in records:
+                for step in steps:
+                    step(user_data)
+                valid += user_data.is_valid
+        return valid
+
+
+# Gebruik
+if __name__ == "__main__":
+    from Behavioral.Chain_of_respon_2 import build_chain
+
+    chain = build_chain()
+
+    users = [
+        {"name": "jan de vries", "email": "JAN@EXAMPLE.COM", "age": 25},
+        {"name": "piet bakker", "email": "piet.test.nl", "age": 15},
+    ]
+    for stop_on_error in (False, True):
+        compiled = CompiledChain(chain, stop_on_error=stop_on_error)
+        print(f"=== Gecompileerd, stop_on_error={stop_on_error} ===")
+        for user in users:
+            print(compiled.handle(UserData(dict(user))))
+        print()
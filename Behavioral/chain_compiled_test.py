@@ -0,0 +1,61 @@
+import contextlib
+import io
+import unittest
+from unittest import TestCase
+
+from Behavioral.chain_compiled import CompiledChain, flatten
+from Behavioral.chain_fixtures import make_users
+from Behavioral.Chain_of_respon_2 import (
+    AgeValidationHandler,
+    DataHandler,
+    EmailValidationHandler,
+    UserData,
+    build_chain,
+)
+
+
+class RoutingHandler(DataHandler):
+    def handle(self, user_data: UserData) -> UserData:
+        return user_data
+
+    def process(self, user_data: UserData):
+        pass
+
+
+class TestCompiledChain(TestCase):
+    def test_same_results_as_recursive_chain_without_output(self):
+        chain = build_chain()
+        expected, actual = make_users(500, seed=4), make_users(500, seed=4)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for user_data in expected:
+                chain.handle(user_data)
+            printed = output.tell()
+            valid = CompiledChain(chain).handle_all(actual)
+        self.assertEqual(output.tell(), printed)  # Gecompileerd: geen prints
+        self.assertTrue(chain.verbose)  # Originele keten niet aangepast
+        self.assertEqual([str(user) for user in actual], [str(u) for u in expected])
+        self.assertEqual(valid, sum(user.is_valid for user in expected))
+
+    def test_stop_on_error_skips_rest_of_chain(self):
+        compiled = CompiledChain(build_chain(False), stop_on_error=True)
+        user = UserData({"name": "an", "email": "geen-adres", "age": 12})
+        compiled.handle(user)
+        self.assertEqual(user.errors, ["Ongeldig email adres"])
+        self.assertNotIn("processed", user.data)
+        self.assertEqual(compiled.handle_all([UserData(dict(user.data))]), 0)
+
+    def test_flatten_rejects_custom_handle_and_cycles(self):
+        head = EmailValidationHandler()
+        head.set_next(RoutingHandler())
+        with self.assertRaises(TypeError):
+            flatten(head)
+
+        head = EmailValidationHandler()
+        head.set_next(AgeValidationHandler()).set_next(head)
+        with self.assertRaises(ValueError):
+            flatten(head)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+import random
+
+from Behavioral.Chain_of_respon_2 import UserData
+
+# Willekeurige gebruikers voor de tests en benchmarks van de keten
+_NAMES = ["jan de vries", "MARIA JANSEN", " piet bakker ", "an"]
+_EMAILS = ["JAN@EXAMPLE.COM", "maria.example.com", "piet@test.nl", " An@Mail.Be "]
+
+
+def make_users(count: int, seed: int = 1) -> list[UserData]:
+    """Ongeveer een kwart ongeldig email adres, een kwart te jong of te oud"""
+    rng = random.Random(seed)
+    return [
+        UserData(
+            {
+                "name": rng.choice(_NAMES),
+                "email": rng.choice(_EMAILS),
+                "age": rng.choice((15, 25, 40, 67, 130)),
+            }
+        )
+        for _ in range(count)
+    ]
@@ -0,0 +1,238 @@
+import asyncio
+import time
+from typing import Iterable
+
+from Behavioral.mediator_pattern import EMERGENCY_TOPIC, ScheduledControlTower
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+
+# Concrete Mediator: verwerkt aanvragen in een event loop
+class AsyncControlTower(ScheduledControlTower):
+    """
+    Aanvragen gaan via een begrensde wachtrij naar de toren (backpressure voor
+    wie te snel aanvraagt). request_landing/request_takeoff wachten tot er een
+    baan is toegewezen, zonder de toren op te houden. Berichten aan vliegtuigen
+    komen in hun eigen begrensde inbox; een volle inbox blokkeert de toren niet
+    (DROP_OLDEST) of remt de toren af tot er plaats is (BLOCK).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        runways: Iterable[str] = ("24R",),
+        request_queue_size: int = 1024,
+        overflow: str = DROP_OLDEST,
+        **options,
+    ):
+        super().__init__(name, runways, **options)
+        self.overflow = overflow
+        self._requests: asyncio.Queue = asyncio.Queue(request_queue_size)
+        self._outgoing: list[tuple["AsyncAircraft", str]] = []
+        # Een herhaalde aanvraag wacht mee op dezelfde toewijzing
+        self._waiting: dict["AsyncAircraft", list[asyncio.Future]] = {}
+        self.dropped_messages = 0
+        self.processed_requests = 0
+
+    def post(self, aircraft, message: str):
+        """Bericht voor een vliegtuig; wordt na de huidige aanvraag afgeleverd"""
+        self._outgoing.append((aircraft, message))
+
+    _deliver = post
+
+    def _assign(self, aircraft, action: str):
+        super()._assign(aircraft, action)
+        runway = self.assigned[aircraft][0]
+        for future in self._waiting.pop(aircraft, ()):
+            if not future.done():
+                future.set_result(runway)
+
+    def unregister_aircraft(self, aircraft):
+        super().unregister_aircraft(aircraft)
+        for future in self._waiting.pop(aircraft, ()):
+            future.cancel()  # Geen baan meer te verwachten
+
+    async def _submit(self, handler, aircraft, *args, wait: bool = False):
+        future = asyncio.get_running_loop().create_future()
+        await self._requests.put((handler, aircraft, args, wait, future))
+        return await future
+
+    async def request_landing(self, aircraft) -> str:
+        """Wacht tot er een baan is toegewezen en geeft die terug"""
+        return await self._submit(super().request_landing, aircraft, wait=True)
+
+    async def request_takeoff(self, aircraft) -> str:
+        return await self._submit(super().request_takeoff, aircraft, wait=True)
+
+    async def runway_cleared(self, aircraft) -> None:
+        await self._submit(super().runway_cleared, aircraft)
+
+    async def send_emergency_alert(self, aircraft, message) -> str | None:
+        """Geeft de baan terug als die meteen vrij is, anders None (eerst in rij)"""
+        return await self._submit(super().send_emergency_alert, aircraft, message)
+
+    async def run(self) -> None:
+        """Verwerk aanvragen tot stop() wordt aangeroepen"""
+        while True:
+            request = await self._requests.get()
+            if request is None:
+                break
+            handler, aircraft, args, wait, future = request
+            try:
+                handler(aircraft, *args)
+            except Exception as error:
+                if not future.done():  # Aanvrager kan al geannuleerd zijn
+                    future.set_exception(error)
+            else:
+                assignment = self.assigned.get(aircraft)
+                if assignment is None and wait:
+                    # _assign lost dit later in
+                    self._waiting.setdefault(aircraft, []).append(future)
+                elif not future.done():
+                    future.set_result(assignment[0] if assignment else None)
+            self.processed_requests += 1
+            await self._flush()
+
+    async def _flush(self) -> None:
+        outgoing, self._outgoing = self._outgoing, []
+        for aircraft, message in outgoing:
+            inbox = aircraft.inbox
+            if self.overflow == BLOCK:
+                await inbox.put(message)
+                continue
+            if inbox.full():
+                inbox.get_nowait()
+                self.dropped_messages += 1
+            inbox.put_nowait(message)
+
+    async def stop(self) -> None:
+        await self._requests.put(None)
+
+
+# Colleague: elk vliegtuig verwerkt zijn inbox in een eigen taak
+class AsyncAircraft:
+    def __init__(
+        self,
+        callsign: str,
+        control_tower: AsyncControlTower,
+        fuel: float = 100.0,
+        inbox_size: int = 16,
+        verbose: bool = True,
+    ):
+        self.callsign = callsign
+        self.control_tower = control_tower
+        self.fuel = fuel
+        self.verbose = verbose
+        self.inbox: asyncio.Queue = asyncio.Queue(inbox_size)
+        self.received = 0
+        self.control_tower.register_aircraft(self)
+
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+
+    def receive_message(self, message: str):
+        # Aangeroepen tijdens de planning van de toren: via de inbox afleveren
+        self.control_tower.post(self, message)
+
+    async def run(self) -> None:
+        while True:
+            message = await self.inbox.get()
+            if message is None:
+                break
+            await self.handle_message(message)
+
+    async def handle_message(self, message: str) -> None:
+        self.received += 1
+        self._log(f"  [{self.callsign}] 📩 Ontvangen: {message}")
+
+    async def request_landing(self) -> str:
+        return await self.control_tower.request_landing(self)
+
+    async def request_takeoff(self) -> str:
+        return await self.control_tower.request_takeoff(self)
+
+    async def landing_completed(self) -> None:
+        self._log(f"[{self.callsign}] ✓ Landing voltooid, verlaat landingsbaan")
+        await self.control_tower.runway_cleared(self)
+
+    async def takeoff_completed(self) -> None:
+        self._log(f"[{self.callsign}] ✓ Opstijgen voltooid, verlaat luchtruim")
+        await self.control_tower.runway_cleared(self)
+
+    async def stop(self) -> None:
+        await self.inbox.put(None)
+
+
+class AsyncPassengerAircraft(AsyncAircraft):
+    def __init__(self, callsign: str, control_tower, passengers: int, **options):
+        self.passengers = passengers
+        super().__init__(callsign, control_tower, **options)
+
+
+class AsyncCargoAircraft(AsyncAircraft):
+    def __init__(self, callsign: str, control_tower, cargo_weight: float, **options):
+        self.cargo_weight = cargo_weight
+        super().__init__(callsign, control_tower, **options)
+
+    async def declare_emergency(self, message: str) -> str | None:
+        self._log(f"[{self.callsign}] 🚨 NOODGEVAL: {message}")
+        return await self.control_tower.send_emergency_alert(self, message)
+
+
+async def fly(aircraft: AsyncAircraft) -> None:
+    """Landen zodra er een baan vrij is, even op de baan blijven en vrijgeven"""
+    await aircraft.request_landing()
+    await asyncio.sleep(0)
+    await aircraft.landing_completed()
+
+
+async def simulate(count: int, runways: Iterable[str] = ("24R", "24L")) -> float:
+    tower = AsyncControlTower(
+        "Async Tower", runways, default_topics=(EMERGENCY_TOPIC,), verbose=False
+    )
+    fleet = [
+        AsyncPassengerAircraft(f"KL{i}", tower, passengers=150, verbose=False)
+        for i in range(count)
+    ]
+    tower_task = asyncio.create_task(tower.run())
+    inbox_tasks = [asyncio.create_task(aircraft.run()) for aircraft in fleet]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fly(aircraft) for aircraft in fleet))
+    elapsed = time.perf_counter() - start
+
+    await tower.stop()
+    for aircraft in fleet:
+        await aircraft.stop()
+    await asyncio.gather(tower_task, *inbox_tasks)
+    return elapsed
+
+
+async def main():
+    tower = AsyncControlTower("Schiphol Async Tower", runways=("24R",))
+    tower_task = asyncio.create_task(tower.run())
+    kl1234 = AsyncPassengerAircraft("KL1234", tower, passengers=180)
+    cargo = AsyncCargoAircraft("CX8901", tower, cargo_weight=45.5, fuel=12.0)
+    inbox_tasks = [asyncio.create_task(a.run()) for a in (kl1234, cargo)]
+
+    print(f"KL1234 krijgt baan: {await kl1234.request_landing()}")
+    # CX8901 wacht op een baan; intussen kan de toren gewoon verder werken
+    cargo_landing = asyncio.create_task(cargo.request_landing())
+    await cargo.declare_emergency("Motorstoring")
+    await kl1234.landing_completed()
+    print(f"CX8901 krijgt baan: {await cargo_landing}")
+
+    await tower.stop()
+    for aircraft in (kl1234, cargo):
+        await aircraft.stop()
+    await asyncio.gather(tower_task, *inbox_tasks)
+
+    count = 20_000
+    elapsed = await simulate(count)
+    print(f"\n{count:,} vliegtuigen geland in {elapsed:.2f} s op één core")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
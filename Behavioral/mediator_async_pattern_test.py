@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+from unittest import TestCase
+
+from Behavioral.mediator_async_pattern import (
+    AsyncCargoAircraft,
+    AsyncControlTower,
+    AsyncPassengerAircraft,
+)
+from Behavioral.mediator_pattern import runway_topic
+
+
+class SlowAircraft(AsyncPassengerAircraft):
+    async def handle_message(self, message: str) -> None:
+        await asyncio.sleep(3600)  # Verwerkt nooit iets
+
+
+class TestAsyncControlTower(TestCase):
+    def test_queued_landing_resolves_when_runway_is_cleared(self):
+        async def scenario():
+            tower = AsyncControlTower("Test", ("A",), verbose=False)
+            tower_task = asyncio.create_task(tower.run())
+            first = AsyncPassengerAircraft("KL1", tower, passengers=1, verbose=False)
+            cargo = AsyncCargoAircraft("CX1", tower, cargo_weight=1.0, verbose=False)
+            self.assertEqual(await first.request_landing(), "A")
+            waiting = asyncio.create_task(cargo.request_landing())
+            await asyncio.sleep(0.01)
+            self.assertFalse(waiting.done())
+            await first.landing_completed()
+            self.assertEqual(await asyncio.wait_for(waiting, 1), "A")
+            await tower.stop()
+            await tower_task
+
+        asyncio.run(scenario())
+
+    def test_repeated_request_does_not_strand_the_first(self):
+        async def scenario():
+            tower = AsyncControlTower("Test", ("A",), verbose=False)
+            tower_task = asyncio.create_task(tower.run())
+            first = AsyncPassengerAircraft("KL1", tower, passengers=1, verbose=False)
+            cargo = AsyncCargoAircraft("CX1", tower, cargo_weight=1.0, verbose=False)
+            await first.request_landing()
+            waiting = [asyncio.create_task(cargo.request_landing()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            await first.landing_completed()
+            done = await asyncio.wait_for(asyncio.gather(*waiting), 1)
+            self.assertEqual(done, ["A", "A"])
+            await tower.stop()
+            await tower_task
+
+        asyncio.run(scenario())
+
+    def test_failed_request_of_cancelled_caller_keeps_tower_running(self):
+        async def scenario():
+            tower = AsyncControlTower("Test", ("A",), verbose=False)
+            started = asyncio.Event()
+
+            def failing(aircraft):
+                started.set()
+                raise RuntimeError("Storing")
+
+            # Aanvraag staat in de rij, maar de aanvrager geeft het al op
+            request = asyncio.create_task(tower._submit(failing, None))
+            await asyncio.sleep(0)
+            request.cancel()
+            tower_task = asyncio.create_task(tower.run())
+            aircraft = AsyncPassengerAircraft("KL1", tower, passengers=1, verbose=False)
+            self.assertEqual(await asyncio.wait_for(aircraft.request_landing(), 1), "A")
+            self.assertTrue(started.is_set())
+            await tower.stop()
+            await tower_task
+
+        asyncio.run(scenario())
+
+    def test_slow_aircraft_does_not_stall_tower(self):
+        async def scenario():
+            tower = AsyncControlTower(
+                "Test", ("A",), default_topics=(runway_topic("A"),), verbose=False
+            )
+            tower_task = asyncio.create_task(tower.run())
+            slow = SlowAircraft(
+                "SLOW", tower, passengers=1, inbox_size=2, verbose=False
+            )
+            slow_task = asyncio.create_task(slow.run())
+            fleet = [
+                AsyncPassengerAircraft(f"KL{i}", tower, passengers=1, verbose=False)
+                for i in range(20)
+            ]
+            for aircraft in fleet:
+                await asyncio.wait_for(aircraft.request_landing(), 1)
+                await aircraft.landing_completed()
+            self.assertGreater(tower.dropped_messages, 0)
+            await tower.stop()
+            await tower_task
+            slow_task.cancel()
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,28 @@
+import heapq
+import itertools
 from abc import ABC, abstractmethod
-from typing import List, Protocol, runtime_checkable
+from typing import Iterable, Protocol, runtime_checkable
+
+
+# Topics waarop vliegtuigen zich abonneren
+def runway_topic(runway: str) -> str:
+    return f"runway:{runway}"
+
+
+def sector_topic(sector: str) -> str:
+    return f"sector:{sector}"
+
+
+RUNWAY_TOPIC = runway_topic("24R")
+EMERGENCY_TOPIC = "emergency"
+DEFAULT_TOPICS = (RUNWAY_TOPIC, EMERGENCY_TOPIC)
 
 
 @runtime_checkable
 class Aircraft(Protocol):
     callsign: str
 
+    # Optioneel: receive_messages(messages) voor een batch, zie ControlTower.tick()
     def receive_message(self, message: str) -> None: ...
 
     def request_landing(self) -> None: ...
@@ -19,6 +36,9 @@ class AirTrafficControl(Protocol):
     def register_aircraft(self, aircraft: Aircraft):
         pass
 
+    def unregister_aircraft(self, aircraft: Aircraft):
+        pass
+
     def request_landing(self, aircraft):
         pass
 
@@ -37,74 +57,148 @@ class AirTrafficControl(Protocol):
 
 # Concrete Mediator
 class ControlTower(AirTrafficControl):
-    def __init__(self, name: str):
+    """
+    Vliegtuigen abonneren zich op topics (baan, sector, noodmeldingen), zodat
+    een melding alleen de betrokken vliegtuigen bereikt. Met batch_messages
+    worden berichten per vliegtuig verzameld en per tick() afgeleverd.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_messages: bool = False,
+        default_topics: Iterable[str] = DEFAULT_TOPICS,
+        verbose: bool = True,
+    ):
         self.name = name
-        self.aircraft: List["Aircraft"] = []
+        self.default_topics = tuple(default_topics)
+        self.verbose = verbose
+        # dicts als geordende sets: O(1) registratie en verwijdering
+        self.aircraft: dict["Aircraft", None] = {}
+        self._topics: dict[str, dict["Aircraft", None]] = {}
+        self._subscriptions: dict["Aircraft", set[str]] = {}
+        self.batch_messages = batch_messages
+        self._outbox: dict["Aircraft", list[str]] = {}
         self.runway_occupied = False
         self.runway_occupied_by = None
 
-    def register_aircraft(self, aircraft):
-        self.aircraft.append(aircraft)
-        print(f"[{self.name}] ✈️  {aircraft.callsign} geregistreerd bij verkeerstoren")
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+
+    def register_aircraft(self, aircraft, topics: Iterable[str] | None = None):
+        # Opnieuw registreren voegt topics toe; bestaande abonnementen blijven
+        self.aircraft[aircraft] = None
+        self._subscriptions.setdefault(aircraft, set())
+        for topic in self.default_topics if topics is None else topics:
+            self.subscribe(aircraft, topic)
+        self._log(
+            f"[{self.name}] ✈️  {aircraft.callsign} geregistreerd bij verkeerstoren"
+        )
+
+    def unregister_aircraft(self, aircraft):
+        for topic in self._subscriptions.pop(aircraft, ()):
+            subscribers = self._topics[topic]
+            del subscribers[aircraft]
+            if not subscribers:
+                del self._topics[topic]
+        self.aircraft.pop(aircraft, None)
+        self._outbox.pop(aircraft, None)
+
+    def subscribe(self, aircraft, topic: str):
+        self._topics.setdefault(topic, {})[aircraft] = None
+        self._subscriptions[aircraft].add(topic)
+
+    def unsubscribe(self, aircraft, topic: str):
+        subscribers = self._topics.get(topic)
+        if subscribers is not None and aircraft in subscribers:
+            del subscribers[aircraft]
+            if not subscribers:
+                del self._topics[topic]
+            self._subscriptions[aircraft].discard(topic)
+
+    def broadcast(self, topic: str, message: str, sender=None):
+        """Stuur een bericht naar alle abonnees van een topic behalve de afzender"""
+        # Kopie: een ontvanger mag tijdens receive_message (de)abonneren
+        for aircraft in tuple(self._topics.get(topic, ())):
+            if aircraft is not sender:
+                self._deliver(aircraft, message)
+
+    def _deliver(self, aircraft, message: str):
+        if self.batch_messages:
+            self._outbox.setdefault(aircraft, []).append(message)
+        else:
+            aircraft.receive_message(message)
+
+    def tick(self):
+        """Lever alle verzamelde berichten af, één batch per vliegtuig"""
+        outbox, self._outbox = self._outbox, {}
+        for aircraft, messages in outbox.items():
+            receive_messages = getattr(aircraft, "receive_messages", None)
+            if receive_messages is not None:
+                receive_messages(messages)
+            else:  # Alleen het protocol: bericht voor bericht
+                for message in messages:
+                    aircraft.receive_message(message)
 
     def request_landing(self, aircraft):
-        print(f"\n[{self.name}] 📻 {aircraft.callsign} vraagt toestemming om te landen")
+        self._log(
+            f"\n[{self.name}] 📻 {aircraft.callsign} vraagt toestemming om te landen"
+        )
 
         if self.runway_occupied:
-            print(
+            self._log(
                 f"[{self.name}] 🚫 {aircraft.callsign}, landingsbaan bezet door {self.runway_occupied_by.callsign}"
             )
-            print(f"[{self.name}] 🔄 {aircraft.callsign}, blijf in wachtpatroon")
-            aircraft.receive_message(f"Wacht in de lucht, landingsbaan bezet")
+            self._log(f"[{self.name}] 🔄 {aircraft.callsign}, blijf in wachtpatroon")
+            self._deliver(aircraft, f"Wacht in de lucht, landingsbaan bezet")
         else:
             self.runway_occupied = True
             self.runway_occupied_by = aircraft
-            print(
+            self._log(
                 f"[{self.name}] ✅ {aircraft.callsign}, toestemming verleend om te landen op baan 24R"
             )
-            aircraft.receive_message(f"Toestemming verleend voor landing")
+            self._deliver(aircraft, f"Toestemming verleend voor landing")
 
-            # Notificeer andere vliegtuigen
-            for other_aircraft in self.aircraft:
-                if other_aircraft != aircraft:
-                    other_aircraft.receive_message(
-                        f"{aircraft.callsign} is aan het landen"
-                    )
+            # Notificeer andere vliegtuigen op dezelfde baan
+            self.broadcast(
+                RUNWAY_TOPIC, f"{aircraft.callsign} is aan het landen", aircraft
+            )
 
     def request_takeoff(self, aircraft):
-        print(
+        self._log(
             f"\n[{self.name}] 📻 {aircraft.callsign} vraagt toestemming om op te stijgen"
         )
 
         if self.runway_occupied:
-            print(
+            self._log(
                 f"[{self.name}] 🚫 {aircraft.callsign}, wacht. Landingsbaan bezet door {self.runway_occupied_by.callsign}"
             )
-            aircraft.receive_message(f"Wacht op taxibaan, landingsbaan bezet")
+            self._deliver(aircraft, f"Wacht op taxibaan, landingsbaan bezet")
         else:
             self.runway_occupied = True
             self.runway_occupied_by = aircraft
-            print(
+            self._log(
                 f"[{self.name}] ✅ {aircraft.callsign}, toestemming verleend om op te stijgen, baan 24R"
             )
-            aircraft.receive_message(f"Toestemming verleend voor opstijgen")
+            self._deliver(aircraft, f"Toestemming verleend voor opstijgen")
 
-            # Notificeer andere vliegtuigen
-            for other_aircraft in self.aircraft:
-                if other_aircraft != aircraft:
-                    other_aircraft.receive_message(
-                        f"{aircraft.callsign} is aan het opstijgen"
-                    )
+            # Notificeer andere vliegtuigen op dezelfde baan
+            self.broadcast(
+                RUNWAY_TOPIC, f"{aircraft.callsign} is aan het opstijgen", aircraft
+            )
 
     def runway_cleared(self, aircraft):
         if self.runway_occupied_by == aircraft:
             self.runway_occupied = False
             self.runway_occupied_by = None
-            print(f"[{self.name}] ✓ Landingsbaan vrijgegeven door {aircraft.callsign}")
+            self._log(
+                f"[{self.name}] ✓ Landingsbaan vrijgegeven door {aircraft.callsign}"
+            )
 
     def send_emergency_alert(self, aircraft, message):
-        print(f"\n[{self.name}] 🚨 NOODMELDING van {aircraft.callsign}: {message}")
-        print(
+        self._log(f"\n[{self.name}] 🚨 NOODMELDING van {aircraft.callsign}: {message}")
+        self._log(
             f"[{self.name}] 🚨 Alle verkeer wijken! Prioriteit aan {aircraft.callsign}"
         )
 
@@ -112,15 +206,15 @@ class ControlTower(AirTrafficControl):
         self.runway_occupied = False
         self.runway_occupied_by = aircraft
 
-        # Waarschuw alle andere vliegtuigen
-        for other_aircraft in self.aircraft:
-            if other_aircraft != aircraft:
-                other_aircraft.receive_message(
-                    f"NOODMELDING: {aircraft.callsign} - {message}. Blijf weg van landingsbaan!"
-                )
+        # Waarschuw alle vliegtuigen die noodmeldingen volgen
+        self.broadcast(
+            EMERGENCY_TOPIC,
+            f"NOODMELDING: {aircraft.callsign} - {message}. Blijf weg van landingsbaan!",
+            aircraft,
+        )
 
-        aircraft.receive_message(
-            "Prioriteit verleend, direct toestemming voor noodlanding"
+        self._deliver(
+            aircraft, "Prioriteit verleend, direct toestemming voor noodlanding"
         )
 
     def request_runway_status(self, aircraft):
@@ -128,21 +222,168 @@ class ControlTower(AirTrafficControl):
         occupied_by = (
             f" door {self.runway_occupied_by.callsign}" if self.runway_occupied else ""
         )
-        print(
+        self._log(
             f"[{self.name}] 📊 {aircraft.callsign}, landingsbaan is {status}{occupied_by}"
         )
-        aircraft.receive_message(f"Landingsbaan status: {status}{occupied_by}")
+        self._deliver(aircraft, f"Landingsbaan status: {status}{occupied_by}")
+
+
+# Concrete Mediator 2: meerdere banen met een prioriteitswachtrij
+class ScheduledControlTower(ControlTower):
+    """
+    Verdeelt aanvragen over N banen. Wie geen baan krijgt, komt in een heap:
+    eerst noodgevallen, dan de minste brandstof, dan de zwaarste vracht, en bij
+    gelijke prioriteit wie eerst vroeg. Bij runway_cleared krijgt de volgende in
+    de wachtrij automatisch de vrijgekomen baan. Zonder default_topics volgen
+    vliegtuigen alle banen van deze toren en de noodmeldingen.
+    """
+
+    def __init__(self, name: str, runways: Iterable[str] = ("24R",), **options):
+        runways = tuple(runways)
+        options.setdefault(
+            "default_topics", (*map(runway_topic, runways), EMERGENCY_TOPIC)
+        )
+        super().__init__(name, **options)
+        self.runways = runways
+        self._free_runways = list(reversed(self.runways))
+        self.assigned: dict[Aircraft, tuple[str, str]] = {}  # (baan, actie)
+        self._queue: list[tuple] = []
+        self._queued: dict[Aircraft, int] = {}  # Geldig volgnummer per vliegtuig
+        self._emergencies: set[Aircraft] = set()
+        self._sequence = itertools.count()
+
+    def unregister_aircraft(self, aircraft):
+        # Een vertrokken vliegtuig houdt geen baan bezet en wacht niet meer
+        self._queued.pop(aircraft, None)
+        self._release_runway(aircraft)
+        self._emergencies.discard(aircraft)
+        super().unregister_aircraft(aircraft)
+
+    @property
+    def queue_length(self) -> int:
+        return len(self._queued)
+
+    def _priority(self, aircraft) -> tuple:
+        return (
+            0 if aircraft in self._emergencies else 1,
+            getattr(aircraft, "fuel", 100.0),
+            -getattr(aircraft, "cargo_weight", 0.0),
+        )
+
+    def request_landing(self, aircraft):
+        self._request(aircraft, "landen")
+
+    def request_takeoff(self, aircraft):
+        self._request(aircraft, "opstijgen")
+
+    def _request(self, aircraft, action: str):
+        self._log(
+            f"\n[{self.name}] 📻 {aircraft.callsign} vraagt toestemming om te {action}"
+        )
+        if aircraft in self.assigned:
+            return
+        if self._free_runways and not self._queued:
+            self._assign(aircraft, action)
+        else:
+            self._enqueue(aircraft, action)
+
+    def _enqueue(self, aircraft, action: str):
+        sequence = next(self._sequence)
+        self._queued[aircraft] = sequence
+        heapq.heappush(
+            self._queue, (*self._priority(aircraft), sequence, action, aircraft)
+        )
+        self._log(f"[{self.name}] 🔄 {aircraft.callsign}, in de wachtrij geplaatst")
+        self._deliver(aircraft, "Alle banen bezet, u staat in de wachtrij")
+
+    def _assign(self, aircraft, action: str):
+        runway = self._free_runways.pop()
+        self.assigned[aircraft] = (runway, action)
+        self._log(
+            f"[{self.name}] ✅ {aircraft.callsign}, toestemming verleend om te "
+            f"{action} op baan {runway}"
+        )
+        self._deliver(aircraft, f"Toestemming verleend om te {action}, baan {runway}")
+        self.broadcast(
+            runway_topic(runway), f"{aircraft.callsign} gaat {action}", aircraft
+        )
+
+    def runway_cleared(self, aircraft):
+        self._release_runway(aircraft)
+
+    def _release_runway(self, aircraft):
+        assignment = self.assigned.pop(aircraft, None)
+        if assignment is None:
+            return
+        self._emergencies.discard(aircraft)
+        self._free_runways.append(assignment[0])
+        self._log(
+            f"[{self.name}] ✓ Baan {assignment[0]} vrijgegeven door {aircraft.callsign}"
+        )
+
+        # Volgende geldige aanvraag uit de heap (vervallen items overslaan)
+        while self._queue and self._free_runways:
+            *_, sequence, action, waiting = heapq.heappop(self._queue)
+            if self._queued.get(waiting) == sequence:
+                del self._queued[waiting]
+                self._assign(waiting, action)
+
+    def send_emergency_alert(self, aircraft, message):
+        self._log(f"\n[{self.name}] 🚨 NOODMELDING van {aircraft.callsign}: {message}")
+        self._emergencies.add(aircraft)
+        self.broadcast(
+            EMERGENCY_TOPIC,
+            f"NOODMELDING: {aircraft.callsign} - {message}. Geef voorrang!",
+            aircraft,
+        )
+        if aircraft in self.assigned:
+            return
+        if self._free_runways:
+            self._queued.pop(aircraft, None)
+            self._assign(aircraft, "landen")
+        else:
+            # Opnieuw in de heap met noodprioriteit; het oude item vervalt
+            self._enqueue(aircraft, "landen")
+
+    def request_runway_status(self, aircraft):
+        free = len(self._free_runways)
+        self._log(
+            f"[{self.name}] 📊 {aircraft.callsign}, {free}/{len(self.runways)} banen "
+            f"vrij, {self.queue_length} in de wachtrij"
+        )
+        self._deliver(
+            aircraft,
+            f"{free} banen vrij, {self.queue_length} vliegtuigen in de wachtrij",
+        )
 
 
 # Colleague (Abstract)
 class Aircraft(ABC):
-    def __init__(self, callsign: str, control_tower: AirTrafficControl):
+    def __init__(
+        self,
+        callsign: str,
+        control_tower: AirTrafficControl,
+        fuel: float = 100.0,
+        verbose: bool = True,
+    ):
         self.callsign = callsign
         self.control_tower = control_tower
+        self.fuel = fuel  # Resterende brandstof in procent
+        self.verbose = verbose
         self.control_tower.register_aircraft(self)
 
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+
     def receive_message(self, message: str):
-        print(f"  [{self.callsign}] 📩 Ontvangen: {message}")
+        self._log(f"  [{self.callsign}] 📩 Ontvangen: {message}")
+
+    def receive_messages(self, messages: list[str]):
+        """Batch van berichten uit één tick"""
+        self._log(f"  [{self.callsign}] 📩 {len(messages)} bericht(en) ontvangen:")
+        for message in messages:
+            self._log(f"      • {message}")
 
     @abstractmethod
     def request_landing(self):
@@ -156,57 +397,65 @@ class Aircraft(ABC):
 # Concrete Colleagues
 class PassengerAircraft(Aircraft):
     def __init__(
-        self, callsign: str, control_tower: AirTrafficControl, passengers: int
+        self,
+        callsign: str,
+        control_tower: AirTrafficControl,
+        passengers: int,
+        **options,
     ):
-        super().__init__(callsign, control_tower)
         self.passengers = passengers
+        super().__init__(callsign, control_tower, **options)
 
     def request_landing(self):
-        print(
+        self._log(
             f"\n[{self.callsign}] Passagiersvliegtuig met {self.passengers} passagiers vraagt landing aan"
         )
         self.control_tower.request_landing(self)
 
     def request_takeoff(self):
-        print(
+        self._log(
             f"\n[{self.callsign}] Passagiersvliegtuig met {self.passengers} passagiers vraagt opstijgen aan"
         )
         self.control_tower.request_takeoff(self)
 
     def landing_completed(self):
-        print(f"[{self.callsign}] ✓ Landing voltooid, verlaat landingsbaan")
+        self._log(f"[{self.callsign}] ✓ Landing voltooid, verlaat landingsbaan")
         self.control_tower.runway_cleared(self)
 
     def takeoff_completed(self):
-        print(f"[{self.callsign}] ✓ Opstijgen voltooid, verlaat luchtruim")
+        self._log(f"[{self.callsign}] ✓ Opstijgen voltooid, verlaat luchtruim")
         self.control_tower.runway_cleared(self)
 
 
 class CargoAircraft(Aircraft):
     def __init__(
-        self, callsign: str, control_tower: AirTrafficControl, cargo_weight: float
+        self,
+        callsign: str,
+        control_tower: AirTrafficControl,
+        cargo_weight: float,
+        **options,
     ):
-        super().__init__(callsign, control_tower)
         self.cargo_weight = cargo_weight
+        super().__init__(callsign, control_tower, **options)
 
     def request_landing(self):
-        print(
+        self._log(
             f"\n[{self.callsign}] Vrachtvliegtuig ({self.cargo_weight} ton) vraagt landing aan"
         )
         self.control_tower.request_landing(self)
 
     def request_takeoff(self):
-        print(
+        self._log(
             f"\n[{self.callsign}] Vrachtvliegtuig ({self.cargo_weight} ton) vraagt opstijgen aan"
         )
         self.control_tower.request_takeoff(self)
 
     def landing_completed(self):
-        print(f"[{self.callsign}] ✓ Landing voltooid, verlaat landingsbaan")
+        self._log(f"[{self.callsign}] ✓ Landing voltooid, verlaat landingsbaan")
         self.control_tower.runway_cleared(self)
 
     def declare_emergency(self, message: str):
-        print(f"[{self.callsign}] 🚨 NOODGEVAL: {message}")
+        self._log(f"[{self.callsign}] 🚨 NOODGEVAL: {message}")
         self.control_tower.send_emergency_alert(self, message)
 
     def takeoff_completed(self):
@@ -259,6 +508,36 @@ def main():
     ba567.request_takeoff()
     cargo1.declare_emergency("Motorstoring, verzoek noodlanding")
 
+    # Scenario 4: Berichten per tick gebundeld
+    print("\n" + "=" * 60)
+    print("SCENARIO 4: Gebundelde berichten")
+    print("=" * 60)
+
+    tower.batch_messages = True
+    cargo1.landing_completed()
+    kl1234.request_landing()
+    kl1234.landing_completed()
+    ba567.request_takeoff()
+    tower.tick()
+
+    # Scenario 5: Meerdere banen met wachtrij
+    print("\n" + "=" * 60)
+    print("SCENARIO 5: Twee banen met prioriteitswachtrij")
+    print("=" * 60)
+
+    hub = ScheduledControlTower("Zaventem Tower", runways=("25R", "25L"))
+    sn100 = PassengerAircraft("SN100", hub, passengers=150)
+    fr200 = PassengerAircraft("FR200", hub, passengers=189, fuel=40.0)
+    low_fuel = PassengerAircraft("TB300", hub, passengers=120, fuel=8.0)
+    freighter = CargoAircraft("DHL400", hub, cargo_weight=60.0)
+
+    sn100.request_landing()
+    fr200.request_landing()
+    freighter.request_landing()  # Wachtrij
+    low_fuel.request_landing()  # Wachtrij, maar weinig brandstof: eerst
+    sn100.landing_completed()  # Baan gaat automatisch naar TB300
+    fr200.landing_completed()  # Baan gaat automatisch naar DHL400
+
 
 if __name__ == "__main__":
     main()
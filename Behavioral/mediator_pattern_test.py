@@ -0,0 +1,188 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.mediator_pattern import (
+    EMERGENCY_TOPIC,
+    RUNWAY_TOPIC,
+    CargoAircraft,
+    ControlTower,
+    PassengerAircraft,
+    ScheduledControlTower,
+    sector_topic,
+)
+
+
+class RecordingMixin:
+    def receive_message(self, message: str):
+        self.inbox.append(message)
+
+    def receive_messages(self, messages: list[str]):
+        self.batches.append(messages)
+
+
+class RecordingPassengerAircraft(RecordingMixin, PassengerAircraft):
+    def __init__(self, callsign, tower, fuel=100.0):
+        self.inbox, self.batches = [], []
+        super().__init__(callsign, tower, passengers=100, fuel=fuel, verbose=False)
+
+
+class RecordingCargoAircraft(RecordingMixin, CargoAircraft):
+    def __init__(self, callsign, tower, cargo_weight=10.0, fuel=100.0):
+        self.inbox, self.batches = [], []
+        super().__init__(
+            callsign, tower, cargo_weight=cargo_weight, fuel=fuel, verbose=False
+        )
+
+
+class TestControlTowerTopics(TestCase):
+    def setUp(self):
+        self.tower = ControlTower("Test Tower", verbose=False)
+        self.first = RecordingPassengerAircraft("KL1", self.tower)
+        self.second = RecordingPassengerAircraft("KL2", self.tower)
+        self.cargo = RecordingCargoAircraft("CX1", self.tower)
+
+    def test_broadcast_reaches_only_topic_subscribers(self):
+        self.tower.unsubscribe(self.second, EMERGENCY_TOPIC)
+        self.tower.subscribe(self.first, sector_topic("noord"))
+        self.cargo.declare_emergency("Motorstoring")
+        self.tower.broadcast(sector_topic("noord"), "Onweer in sector noord")
+
+        self.assertEqual(len(self.first.inbox), 2)
+        self.assertEqual(self.second.inbox, [])
+        self.assertEqual(len(self.cargo.inbox), 1)  # Alleen de eigen bevestiging
+
+    def test_unregistered_aircraft_receive_nothing(self):
+        self.tower.unregister_aircraft(self.second)
+        self.first.request_landing()
+        self.assertEqual(self.second.inbox, [])
+        self.assertEqual(self.cargo.inbox, ["KL1 is aan het landen"])
+
+    def test_messages_are_batched_per_tick(self):
+        self.tower.batch_messages = True
+        self.first.request_landing()
+        self.first.landing_completed()
+        self.second.request_landing()
+        self.assertEqual(self.cargo.batches, [])
+        self.tower.tick()
+        self.assertEqual(
+            self.cargo.batches, [["KL1 is aan het landen", "KL2 is aan het landen"]]
+        )
+
+        self.assertEqual(
+            self.first.batches,
+            [["Toestemming verleend voor landing", "KL2 is aan het landen"]],
+        )
+        self.assertEqual(self.first.inbox, [])
+
+    def test_batch_falls_back_to_receive_message(self):
+        class ProtocolAircraft:
+            def __init__(self, callsign: str):
+                self.callsign = callsign
+                self.inbox = []
+
+            def receive_message(self, message: str) -> None:
+                self.inbox.append(message)
+
+            def request_landing(self) -> None: ...
+
+            def request_takeoff(self) -> None: ...
+
+        plain = ProtocolAircraft("PH1")
+        self.tower.register_aircraft(plain)
+        self.tower.batch_messages = True
+        self.first.request_landing()
+        self.tower.broadcast(EMERGENCY_TOPIC, "Oefening")
+        self.tower.tick()
+        self.assertEqual(plain.inbox, ["KL1 is aan het landen", "Oefening"])
+
+    def test_register_twice_keeps_subscriptions_consistent(self):
+        self.tower.register_aircraft(self.first, [sector_topic("noord")])
+        self.tower.unregister_aircraft(self.first)
+        self.second.request_landing()
+        self.tower.broadcast(sector_topic("noord"), "Onweer in sector noord")
+        self.assertEqual(self.first.inbox, [])
+        self.assertEqual(self.tower._topics.keys(), {RUNWAY_TOPIC, EMERGENCY_TOPIC})
+
+    def test_unsubscribe_removes_empty_topic(self):
+        self.tower.subscribe(self.first, sector_topic("zuid"))
+        self.tower.unsubscribe(self.first, sector_topic("zuid"))
+        self.assertNotIn(sector_topic("zuid"), self.tower._topics)
+
+    def test_subscriber_may_unsubscribe_during_broadcast(self):
+        tower = self.tower
+
+        class LeavingAircraft(RecordingPassengerAircraft):
+            def receive_message(self, message: str):
+                super().receive_message(message)
+                tower.unsubscribe(self, EMERGENCY_TOPIC)
+
+        leaving = LeavingAircraft("KL3", tower)
+        tower.broadcast(EMERGENCY_TOPIC, "Oefening")
+        self.assertEqual(leaving.inbox, ["Oefening"])
+        self.assertEqual(self.first.inbox, ["Oefening"])
+
+
+class TestScheduledControlTower(TestCase):
+    def setUp(self):
+        self.tower = ScheduledControlTower("Test Tower", ("A", "B"), verbose=False)
+
+    def test_queue_order_emergency_fuel_cargo(self):
+        busy = [RecordingPassengerAircraft(f"BUSY{i}", self.tower) for i in range(2)]
+        for aircraft in busy:
+            aircraft.request_landing()
+
+        light = RecordingCargoAircraft("LIGHT", self.tower, cargo_weight=5, fuel=50)
+        heavy = RecordingCargoAircraft("HEAVY", self.tower, cargo_weight=90, fuel=50)
+        low_fuel = RecordingPassengerAircraft("LOWFUEL", self.tower, fuel=10)
+        emergency = RecordingCargoAircraft("SOS", self.tower)
+        for aircraft in (light, heavy, low_fuel, emergency):
+            aircraft.request_landing()
+        emergency.declare_emergency("Motorstoring")
+        self.assertEqual(self.tower.queue_length, 4)
+
+        order = []
+        while self.tower.queue_length:
+            cleared = next(iter(self.tower.assigned))
+            cleared.landing_completed()
+            order.extend(
+                aircraft.callsign
+                for aircraft in self.tower.assigned
+                if aircraft.callsign not in order and aircraft not in busy
+            )
+        self.assertEqual(order, ["SOS", "LOWFUEL", "HEAVY", "LIGHT"])
+
+    def test_free_runways_are_assigned_directly(self):
+        first = RecordingPassengerAircraft("KL1", self.tower)
+        second = RecordingPassengerAircraft("KL2", self.tower)
+        first.request_landing()
+        second.request_landing()
+        runways = {runway for runway, _ in self.tower.assigned.values()}
+        self.assertEqual(runways, {"A", "B"})
+        self.assertEqual(self.tower.queue_length, 0)
+
+    def test_aircraft_hear_about_this_towers_runways(self):
+        first = RecordingPassengerAircraft("KL1", self.tower)
+        second = RecordingPassengerAircraft("KL2", self.tower)
+        first.request_landing()
+        second.request_landing()
+        self.assertIn("KL1 gaat landen", second.inbox)
+        self.assertIn("KL2 gaat landen", first.inbox)
+
+    def test_unregister_leaves_queue_and_frees_runway(self):
+        busy = [RecordingPassengerAircraft(f"BUSY{i}", self.tower) for i in range(2)]
+        waiting = [RecordingPassengerAircraft(f"WAIT{i}", self.tower) for i in range(2)]
+        for aircraft in busy + waiting:
+            aircraft.request_landing()
+        self.assertEqual(self.tower.queue_length, 2)
+
+        self.tower.unregister_aircraft(waiting[0])
+        self.assertEqual(self.tower.queue_length, 1)
+        self.tower.unregister_aircraft(busy[0])
+        self.assertIn(waiting[1], self.tower.assigned)
+        self.assertNotIn(busy[0], self.tower.assigned)
+        self.assertNotIn(waiting[0], self.tower.assigned)
+        self.assertEqual(self.tower.queue_length, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
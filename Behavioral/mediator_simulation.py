@@ -0,0 +1,186 @@
+import heapq
+import itertools
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from Behavioral.mediator_pattern import (
+    CargoAircraft,
+    PassengerAircraft,
+    ScheduledControlTower,
+)
+
+_ARRIVAL = 0
+_CLEARED = 1
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Invoer voor één deterministische run; tijden in minuten"""
+
+    name: str
+    runways: int = 2
+    arrivals_per_hour: float = 60.0
+    duration_hours: float = 24.0
+    runway_minutes: float = 1.5  # Hoe lang een landing de baan bezet houdt
+    cargo_share: float = 0.3
+    emergency_rate: float = 0.001
+    seed: int = 1
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    scenario: str
+    landed: int
+    events: int
+    simulated_minutes: float
+    runway_utilisation: float
+    wait_p50: float
+    wait_p99: float
+    wait_max: float
+    wall_seconds: float
+    events_per_second: float
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentiel van een gesorteerde lijst"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+# De toren meldt elke baantoewijzing aan de simulatie
+class _SimulatedTower(ScheduledControlTower):
+    def __init__(self, simulation: "Simulation", runways: int):
+        super().__init__(
+            "Sim Tower",
+            [f"RW{i + 1}" for i in range(runways)],
+            default_topics=(),
+            verbose=False,
+        )
+        self.simulation = simulation
+
+    def _assign(self, aircraft, action: str):
+        super()._assign(aircraft, action)
+        self.simulation.on_assign(aircraft)
+
+
+# Discrete-event simulatie met een gesimuleerde klok (geen echte wachttijd)
+class Simulation:
+    def __init__(self, scenario: Scenario):
+        self.scenario = scenario
+        self.now = 0.0
+        self.tower = _SimulatedTower(self, scenario.runways)
+        self._rng = random.Random(scenario.seed)
+        self._events: list[tuple[float, int, int, object]] = []
+        self._sequence = itertools.count()
+        self._requested_at: dict[object, float] = {}
+        self.waits: list[float] = []
+        self.busy_minutes = 0.0
+        self.event_count = 0
+
+    def _schedule(self, moment: float, kind: int, payload=None):
+        heapq.heappush(self._events, (moment, next(self._sequence), kind, payload))
+
+    def _new_aircraft(self, number: int):
+        fuel = self._rng.uniform(5.0, 100.0)
+        if self._rng.random() < self.scenario.cargo_share:
+            weight = self._rng.uniform(5.0, 120.0)
+            return CargoAircraft(
+                f"CX{number}", self.tower, weight, fuel=fuel, verbose=False
+            )
+        passengers = self._rng.randint(50, 400)
+        return PassengerAircraft(
+            f"KL{number}", self.tower, passengers, fuel=fuel, verbose=False
+        )
+
+    def _generate_arrivals(self):
+        """Poisson aankomsten over de duur van het scenario"""
+        rate = self.scenario.arrivals_per_hour / 60.0
+        end = self.scenario.duration_hours * 60.0
+        moment = self._rng.expovariate(rate)
+        while moment < end:
+            self._schedule(moment, _ARRIVAL)
+            moment += self._rng.expovariate(rate)
+
+    def on_assign(self, aircraft):
+        self.waits.append(self.now - self._requested_at.pop(aircraft))
+        self.busy_minutes += self.scenario.runway_minutes
+        self._schedule(self.now + self.scenario.runway_minutes, _CLEARED, aircraft)
+
+    def run(self) -> SimulationResult:
+        self._generate_arrivals()
+        numbers = itertools.count(1)
+        start = time.perf_counter()
+        while self._events:
+            self.now, _, kind, aircraft = heapq.heappop(self._events)
+            self.event_count += 1
+            if kind == _ARRIVAL:
+                aircraft = self._new_aircraft(next(numbers))
+                self._requested_at[aircraft] = self.now
+                aircraft.request_landing()
+                if (
+                    isinstance(aircraft, CargoAircraft)
+                    and self._rng.random() < self.scenario.emergency_rate
+                ):
+                    aircraft.declare_emergency("Motorstoring")
+            else:
+                aircraft.landing_completed()
+                self.tower.unregister_aircraft(aircraft)
+        wall = time.perf_counter() - start
+
+        waits = sorted(self.waits)
+        capacity = self.scenario.runways * self.now if self.now else 1.0
+        return SimulationResult(
+            scenario=self.scenario.name,
+            landed=len(waits),
+            events=self.event_count,
+            simulated_minutes=self.now,
+            runway_utilisation=self.busy_minutes / capacity,
+            wait_p50=percentile(waits, 0.50),
+            wait_p99=percentile(waits, 0.99),
+            wait_max=waits[-1] if waits else 0.0,
+            wall_seconds=wall,
+            events_per_second=self.event_count / wall if wall else 0.0,
+        )
+
+
+def run_scenario(scenario: Scenario) -> SimulationResult:
+    return Simulation(scenario).run()
+
+
+def run_scenarios(
+    scenarios: list[Scenario], workers: int | None = None
+) -> list[SimulationResult]:
+    """Verdeel de scenario's over een process pool; volgorde blijft behouden"""
+    if workers == 1:
+        return [run_scenario(scenario) for scenario in scenarios]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_scenario, scenarios))
+
+
+def main():
+    scenarios = [
+        Scenario("rustig", runways=2, arrivals_per_hour=40),
+        Scenario("druk", runways=2, arrivals_per_hour=75),
+        Scenario("overbelast", runways=2, arrivals_per_hour=85, duration_hours=6),
+        Scenario("drie banen", runways=3, arrivals_per_hour=110),
+        Scenario("hub", runways=4, arrivals_per_hour=150, duration_hours=48),
+    ]
+    print(
+        f"{'scenario':<12} | {'geland':>7} | {'bezetting':>9} | {'p50 (min)':>9} | "
+        f"{'p99 (min)':>9} | {'events/s':>9}"
+    )
+    print("-" * 70)
+    for result in run_scenarios(scenarios):
+        print(
+            f"{result.scenario:<12} | {result.landed:>7,} | "
+            f"{result.runway_utilisation:>9.1%} | {result.wait_p50:>9.1f} | "
+            f"{result.wait_p99:>9.1f} | {result.events_per_second:>9,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
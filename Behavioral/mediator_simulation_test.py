@@ -0,0 +1,34 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.mediator_simulation import Scenario, percentile, run_scenarios
+
+
+class TestSimulation(TestCase):
+    def test_runs_are_deterministic_per_seed(self):
+        scenario = Scenario("test", runways=2, arrivals_per_hour=70, duration_hours=4)
+        first, second = run_scenarios([scenario, scenario], workers=1)
+        self.assertEqual(first.landed, second.landed)
+        self.assertEqual(first.wait_p99, second.wait_p99)
+        self.assertEqual(first.events, 2 * first.landed)
+        self.assertLessEqual(first.runway_utilisation, 1.0)
+
+    def test_more_runways_reduce_waiting(self):
+        busy, relaxed = run_scenarios(
+            [
+                Scenario("een", runways=1, arrivals_per_hour=35, duration_hours=8),
+                Scenario("twee", runways=2, arrivals_per_hour=35, duration_hours=8),
+            ],
+            workers=1,
+        )
+        self.assertGreater(busy.wait_p99, relaxed.wait_p99)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
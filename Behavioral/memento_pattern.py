@@ -1,6 +1,18 @@
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import weakref
+import zlib
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import Iterable, Protocol
 
 
 # Memento - slaat de state op
@@ -17,6 +29,74 @@ class EditorMemento:
         return f"[{self.timestamp.strftime('%H:%M:%S')}] Text: '{preview}' | Cursor: {self.cursor_position}"
 
 
+# Opgeslagen checkpoint: volledige tekst (keyframe) of verschil met de vorige
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """
+    Keyframe: text is de volledige tekst. Delta: de eerste `prefix` en laatste
+    `suffix` tekens komen uit de vorige checkpoint, text is het nieuwe midden.
+    """
+
+    text: str
+    cursor_position: int
+    timestamp: datetime
+    is_keyframe: bool
+    prefix: int = 0
+    suffix: int = 0
+    content: "StoredText | None" = None  # Gedeelde chunks i.p.v. eigen tekst
+
+    @property
+    def full_text(self) -> str:
+        """Volledige tekst van een keyframe"""
+        return self.content.text() if self.content is not None else self.text
+
+    def apply(self, previous: str) -> str:
+        if self.is_keyframe:
+            return self.full_text
+        end = len(previous) - self.suffix
+        return previous[: self.prefix] + self.text + previous[end:]
+
+    @staticmethod
+    def delta(previous: str, memento: EditorMemento) -> "Checkpoint":
+        current = memento.text
+        prefix = _common_length(previous, current, from_end=False)
+        limit = min(len(previous), len(current)) - prefix
+        suffix = min(_common_length(previous, current, from_end=True), limit)
+        return Checkpoint(
+            text=current[prefix : len(current) - suffix],
+            cursor_position=memento.cursor_position,
+            timestamp=memento.timestamp,
+            is_keyframe=False,
+            prefix=prefix,
+            suffix=suffix,
+        )
+
+    @staticmethod
+    def keyframe(memento: EditorMemento) -> "Checkpoint":
+        return Checkpoint(
+            text=memento.text,
+            cursor_position=memento.cursor_position,
+            timestamp=memento.timestamp,
+            is_keyframe=True,
+        )
+
+
+def _common_length(a: str, b: str, from_end: bool) -> int:
+    """Lengte van het gemeenschappelijke begin (of einde) via binair zoeken"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if from_end:
+            same = a[len(a) - middle :] == b[len(b) - middle :]
+        else:
+            same = a[:middle] == b[:middle]
+        if same:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
 # Originator Protocol - object waarvan we state willen opslaan
 class Originator(Protocol):
     def save(self) -> EditorMemento:
@@ -65,7 +145,7 @@ class TextEditor:
         return EditorMemento(
             text=self.text,
             cursor_position=self.cursor_position,
-            timestamp=datetime.now(),
+            timestamp=datetime.now().astimezone(),  # Met tijdzone, eenduidig
         )
 
     def restore(self, memento: EditorMemento) -> None:
@@ -82,28 +162,381 @@ class TextEditor:
         print(f"       {cursor_visual}")
 
 
+# Content-addressed opslag: identieke teksten en chunks worden gedeeld
+class _Chunk:
+    __slots__ = ("text", "__weakref__")
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StoredText:
+    """Tekst als tuple van gedeelde chunks; verdwijnt zodra niemand ernaar verwijst"""
+
+    __slots__ = ("chunks", "length", "__weakref__")
+
+    def __init__(self, chunks: tuple[_Chunk, ...], length: int):
+        self.chunks = chunks
+        self.length = length
+
+    def text(self) -> str:
+        return "".join(chunk.text for chunk in self.chunks)
+
+
+class ContentStore:
+    """
+    Deelt identieke teksten via een hash van de hele tekst, en bijna identieke
+    teksten via chunks. Chunkgrenzen liggen op regeleinden die door hun inhoud
+    gekozen worden, zodat een invoeging alleen de eigen chunk verandert.
+    """
+
+    def __init__(self, average_lines: int = 16, max_chunk: int = 4096):
+        # De grens-mask werkt alleen als average_lines een macht van 2 is
+        if average_lines < 1 or average_lines & (average_lines - 1):
+            raise ValueError("average_lines moet een macht van 2 zijn")
+        self._boundary_mask = average_lines - 1
+        self.max_chunk = max_chunk
+        self._texts: weakref.WeakValueDictionary[bytes, StoredText] = (
+            weakref.WeakValueDictionary()
+        )
+        self._chunks: weakref.WeakValueDictionary[bytes, _Chunk] = (
+            weakref.WeakValueDictionary()
+        )
+        # Meetgegevens over de opgenomen sessie
+        self.logical_bytes = 0
+        self.stored_bytes = 0
+        self.text_hits = 0
+        self.chunk_hits = 0
+        self.chunk_count = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def _split(self, text: str) -> list[str]:
+        chunks = []
+        current: list[str] = []
+        size = 0
+        for line in text.splitlines(keepends=True):
+            # Lange regels in vaste stukken opdelen, na de regels ervoor
+            if len(line) > self.max_chunk:
+                if current:
+                    chunks.append("".join(current))
+                    current.clear()
+                    size = 0
+                while len(line) > self.max_chunk:
+                    chunks.append(line[: self.max_chunk])
+                    line = line[self.max_chunk :]
+            current.append(line)
+            size += len(line)
+            if (
+                zlib.crc32(line.encode()) & self._boundary_mask == 0
+                or size >= self.max_chunk
+            ):
+                chunks.append("".join(current))
+                current.clear()
+                size = 0
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
+    def put(self, text: str) -> StoredText:
+        self.logical_bytes += len(text)
+        key = self._key(text)
+        stored = self._texts.get(key)
+        if stored is not None:
+            self.text_hits += 1
+            return stored
+
+        chunks = []
+        for piece in self._split(text):
+            chunk_key = self._key(piece)
+            chunk = self._chunks.get(chunk_key)
+            if chunk is None:
+                chunk = _Chunk(piece)
+                self._chunks[chunk_key] = chunk
+                self.stored_bytes += len(piece)
+            else:
+                self.chunk_hits += 1
+            chunks.append(chunk)
+            self.chunk_count += 1
+        stored = StoredText(tuple(chunks), len(text))
+        self._texts[key] = stored
+        return stored
+
+    def get_statistics(self) -> dict:
+        live_bytes = sum(len(chunk.text) for chunk in self._chunks.values())
+        return {
+            "logical_bytes": self.logical_bytes,
+            "stored_bytes": self.stored_bytes,
+            "live_bytes": live_bytes,
+            "dedup_ratio": self.logical_bytes / max(1, self.stored_bytes),
+            "identical_texts": self.text_hits,
+            "shared_chunks": self.chunk_hits,
+            "chunks": self.chunk_count,
+        }
+
+
+def measure_dedup(texts: Iterable[str], **store_options) -> dict:
+    """Meetmodus: bepaal de dedup ratio van een opgenomen reeks teksten"""
+    store = ContentStore(**store_options)
+    kept = [store.put(text) for text in texts]
+    statistics = store.get_statistics()
+    del kept
+    return statistics
+
+
+# Checkpoint opslag die boven een RAM budget oude checkpoints naar schijf schrijft
+class SpillingCheckpointStore:
+    """
+    Gedraagt zich als een lijst van checkpoints. Zodra de checkpoints in het
+    geheugen meer dan `ram_budget` bytes innemen, worden de oudste gecomprimeerd
+    naar een segmentbestand geschreven en bij gebruik via mmap teruggelezen.
+    Het tijdstip gaat als ISO-tekst mee, dus exact en met tijdzone. Een
+    segmentbestand dat de store zelf aanmaakte, verdwijnt bij close().
+    """
+
+    # keyframe, cursor, prefix, suffix, lengte van het ISO-tijdstip
+    _RECORD = struct.Struct("<?qqqB")
+
+    def __init__(
+        self,
+        ram_budget: int,
+        path: str | None = None,
+        page_cache_size: int = 64,
+        compression_level: int = 1,
+    ):
+        self.ram_budget = ram_budget
+        self.compression_level = compression_level
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".checkpoints")
+            os.close(fd)
+        self.path = path
+        self._file = open(path, "w+b")
+        self._file.truncate()
+        self._map: mmap.mmap | None = None
+        # Checkpoint in geheugen of (offset, lengte) in het segmentbestand
+        self._entries: list[Checkpoint | tuple[int, int]] = []
+        self._sizes: list[int] = []
+        self._oldest_resident = 0
+        self._page_cache: OrderedDict[int, Checkpoint] = OrderedDict()
+        self._page_cache_size = page_cache_size
+
+        self.resident_bytes = 0
+        self.spilled_bytes = 0
+        self.spilled_count = 0
+
+    @staticmethod
+    def _size(checkpoint: Checkpoint) -> int:
+        return (
+            sys.getsizeof(checkpoint)
+            + sys.getsizeof(checkpoint.text)
+            + (sys.getsizeof(checkpoint.content) if checkpoint.content else 0)
+            + sys.getsizeof(checkpoint.timestamp)
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, checkpoint: Checkpoint) -> None:
+        size = self._size(checkpoint)
+        self._entries.append(checkpoint)
+        self._sizes.append(size)
+        self.resident_bytes += size
+        self._spill()
+
+    def __getitem__(self, index: int) -> Checkpoint:
+        entry = self._entries[index]
+        if isinstance(entry, Checkpoint):
+            return entry
+        if index < 0:
+            index += len(self._entries)
+        checkpoint = self._page_cache.get(index)
+        if checkpoint is None:
+            checkpoint = self._page_in(*entry)
+            self._page_cache[index] = checkpoint
+            if len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+        else:
+            self._page_cache.move_to_end(index)
+        return checkpoint
+
+    def __delitem__(self, key: slice) -> None:
+        """Alleen het afkappen van het einde wordt ondersteund (nieuwe branch)"""
+        start = key.indices(len(self._entries))[0]
+        for index in range(start, len(self._entries)):
+            entry = self._entries[index]
+            if isinstance(entry, Checkpoint):
+                self.resident_bytes -= self._sizes[index]
+            else:
+                self.spilled_bytes -= entry[1]
+                self.spilled_count -= 1
+                self._page_cache.pop(index, None)
+        del self._entries[start:]
+        del self._sizes[start:]
+        self._oldest_resident = min(self._oldest_resident, start)
+
+        # Alles vóór _oldest_resident staat op schijf, in volgorde: het bestand
+        # kan terug tot het einde van het laatste overgebleven record
+        end = 0
+        if self._oldest_resident:
+            offset, length = self._entries[self._oldest_resident - 1]
+            end = offset + length
+        if self._map is not None and len(self._map) > end:
+            self._map.close()
+            self._map = None
+        self._file.truncate(end)
+
+    def _spill(self) -> None:
+        """Schrijf de oudste checkpoints weg tot het budget weer klopt"""
+        while (
+            self.resident_bytes > self.ram_budget
+            and self._oldest_resident < len(self._entries) - 1
+        ):
+            index = self._oldest_resident
+            checkpoint = self._entries[index]
+            self._oldest_resident += 1
+            if not isinstance(checkpoint, Checkpoint):
+                continue
+            timestamp = checkpoint.timestamp.isoformat().encode()
+            record = self._RECORD.pack(
+                checkpoint.is_keyframe,
+                checkpoint.cursor_position,
+                checkpoint.prefix,
+                checkpoint.suffix,
+                len(timestamp),
+            )
+            data = zlib.compress(
+                record + timestamp + checkpoint.full_text.encode(),
+                self.compression_level,
+            )
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(data)
+            self._entries[index] = (offset, len(data))
+            self.resident_bytes -= self._sizes[index]
+            self.spilled_bytes += len(data)
+            self.spilled_count += 1
+
+    def _page_in(self, offset: int, length: int) -> Checkpoint:
+        if self._map is None or offset + length > len(self._map):
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = zlib.decompress(self._map[offset : offset + length])
+        is_keyframe, cursor, prefix, suffix, size = self._RECORD.unpack_from(data)
+        text_start = self._RECORD.size + size
+        timestamp = data[self._RECORD.size : text_start].decode()
+        return Checkpoint(
+            text=data[text_start:].decode(),
+            cursor_position=cursor,
+            timestamp=datetime.fromisoformat(timestamp),
+            is_keyframe=is_keyframe,
+            prefix=prefix,
+            suffix=suffix,
+        )
+
+    def get_statistics(self) -> dict:
+        self._file.flush()
+        return {
+            "resident_entries": len(self._entries) - self.spilled_count,
+            "resident_bytes": self.resident_bytes,
+            "spilled_entries": self.spilled_count,
+            "spilled_bytes": self.spilled_bytes,
+            "segment_file_bytes": os.path.getsize(self.path),
+        }
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+        if self._owns_file:
+            os.remove(self.path)
+
+
 # Caretaker - beheert de mementos
 class EditorHistory:
-    def __init__(self, editor: TextEditor):
+    """
+    Slaat checkpoints op als verschil met de vorige checkpoint; elke
+    `keyframe_interval` checkpoints wordt de volledige tekst bewaard.
+    """
+
+    def __init__(
+        self,
+        editor: TextEditor,
+        keyframe_interval: int = 32,
+        store: SpillingCheckpointStore | None = None,
+        content_store: ContentStore | None = None,
+    ):
         self.editor = editor
-        self.history: list[EditorMemento] = []
+        self.keyframe_interval = keyframe_interval
+        self.history: list[Checkpoint] | SpillingCheckpointStore = (
+            store if store is not None else []
+        )
+        self.content_store = content_store
         self.current_index = -1
+        # Laatst opgebouwde tekst, zodat opeenvolgende stappen goedkoop zijn
+        self._cached_index = -1
+        self._cached_text = ""
 
     def save_checkpoint(self) -> None:
         """Sla huidige state op als checkpoint"""
-        # Verwijder alle states na huidige index (voor nieuwe branch)
-        self.history = self.history[: self.current_index + 1]
+        # Verwijder alle states na huidige index (voor nieuwe branch), zonder kopie
+        del self.history[self.current_index + 1 :]
 
         memento = self.editor.save()
-        self.history.append(memento)
-        self.current_index += 1
+        index = self.current_index + 1
+        if self.content_store is not None:
+            # Elke checkpoint is een keyframe, maar de tekst wordt gedeeld
+            checkpoint = Checkpoint(
+                text="",
+                cursor_position=memento.cursor_position,
+                timestamp=memento.timestamp,
+                is_keyframe=True,
+                content=self.content_store.put(memento.text),
+            )
+        elif index % self.keyframe_interval == 0:
+            checkpoint = Checkpoint.keyframe(memento)
+        else:
+            checkpoint = Checkpoint.delta(self._text_at(self.current_index), memento)
+        self.history.append(checkpoint)
+        self.current_index = index
+        self._cached_index, self._cached_text = index, memento.text
         print(f"💾 Checkpoint opgeslagen (#{len(self.history)})")
 
+    def _text_at(self, index: int) -> str:
+        """Bouw de tekst op vanaf de dichtstbijzijnde keyframe (of de cache)"""
+        if index == self._cached_index:
+            return self._cached_text
+        checkpoint = self.history[index]
+        if checkpoint.is_keyframe:
+            self._cached_index, self._cached_text = index, checkpoint.full_text
+            return self._cached_text
+        keyframe = index - index % self.keyframe_interval
+        if keyframe <= self._cached_index < index:
+            start, text = self._cached_index + 1, self._cached_text
+        else:
+            start, text = keyframe, ""
+        for i in range(start, index + 1):
+            text = self.history[i].apply(text)
+        self._cached_index, self._cached_text = index, text
+        return text
+
+    def memento_at(self, index: int) -> EditorMemento:
+        checkpoint = self.history[index]
+        return EditorMemento(
+            text=self._text_at(index),
+            cursor_position=checkpoint.cursor_position,
+            timestamp=checkpoint.timestamp,
+        )
+
     def undo(self) -> None:
         """Ga terug naar vorige state"""
         if self.current_index > 0:
             self.current_index -= 1
-            self.editor.restore(self.history[self.current_index])
+            self.editor.restore(self.memento_at(self.current_index))
             print(f"⎌ Undo naar checkpoint #{self.current_index + 1}")
         else:
             print("✗ Geen eerdere checkpoints om naar terug te gaan")
@@ -112,7 +545,7 @@ class EditorHistory:
         """Ga vooruit naar volgende state"""
         if self.current_index < len(self.history) - 1:
             self.current_index += 1
-            self.editor.restore(self.history[self.current_index])
+            self.editor.restore(self.memento_at(self.current_index))
             print(f"⎌ Redo naar checkpoint #{self.current_index + 1}")
         else:
             print("✗ Geen latere checkpoints om naartoe te gaan")
@@ -120,20 +553,224 @@ class EditorHistory:
     def show_history(self) -> None:
         """Toon alle opgeslagen checkpoints"""
         print("\n📋 Checkpoint History:")
-        for i, memento in enumerate(self.history):
+        for i in range(len(self.history)):
             marker = "→" if i == self.current_index else " "
-            print(f"  {marker} #{i + 1}: {memento.get_info()}")
+            print(f"  {marker} #{i + 1}: {self.memento_at(i).get_info()}")
 
     def restore_checkpoint(self, index: int) -> None:
         """Spring naar specifieke checkpoint"""
         if 0 <= index < len(self.history):
             self.current_index = index
-            self.editor.restore(self.history[index])
+            self.editor.restore(self.memento_at(index))
             print(f"↺ Gesprongen naar checkpoint #{index + 1}")
         else:
             print("✗ Ongeldige checkpoint index")
 
 
+# Caretaker als boom: elke branch blijft bewaard
+class UndoTree:
+    """
+    Elke knoop bewaart alleen het verschil met zijn ouder, dus broers delen de
+    tekst van hun ouder. Knopen zijn kolommen in arrays in plaats van objecten,
+    en omdat knopen in tijdsvolgorde ontstaan is de tijdkolom gesorteerd.
+    Elke wissel van huidige knoop (opslaan, undo, redo, springen) komt met
+    een tijdstip van `clock` in een bezoeklog, zodat restore_to_time de knoop
+    terugvindt die op dat moment actief was.
+    """
+
+    _KEYFRAME = -1
+
+    def __init__(
+        self,
+        editor: TextEditor,
+        keyframe_interval: int = 32,
+        verbose: bool = True,
+        clock=time.time,
+    ):
+        self.editor = editor
+        self.keyframe_interval = keyframe_interval
+        self.verbose = verbose
+        self._clock = clock
+        self.current = -1
+
+        # Kolommen per knoop
+        self._parent = array("q")
+        self._depth = array("q")
+        self._first_child = array("q")
+        self._next_sibling = array("q")
+        self._preferred_child = array("q")  # Branch die redo volgt
+        self._prefix = array("q")  # _KEYFRAME: _texts bevat de volledige tekst
+        self._suffix = array("q")
+        self._cursor = array("q")
+        self._timestamp = array("d")
+        self._texts: list[str] = []
+
+        # Bezoeklog: vanaf _visit_time[i] was _visit_node[i] de huidige knoop
+        self._visit_time = array("d")
+        self._visit_node = array("q")
+
+        self._cached_node = -1
+        self._cached_text = ""
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def save_checkpoint(self) -> int:
+        """Voeg de huidige state toe als kind van de huidige knoop"""
+        memento = self.editor.save()
+        node = len(self._parent)
+        parent = self.current
+        depth = self._depth[parent] + 1 if parent >= 0 else 0
+        timestamp = memento.timestamp.timestamp()
+        if node:
+            timestamp = max(timestamp, self._timestamp[-1])  # Gesorteerd houden
+
+        if depth % self.keyframe_interval == 0:
+            prefix, suffix, text = self._KEYFRAME, 0, memento.text
+        else:
+            previous = self._text_at(parent)
+            current = memento.text
+            prefix = _common_length(previous, current, from_end=False)
+            limit = min(len(previous), len(current)) - prefix
+            suffix = min(_common_length(previous, current, from_end=True), limit)
+            text = current[prefix : len(current) - suffix]
+
+        self._parent.append(parent)
+        self._depth.append(depth)
+        self._first_child.append(-1)
+        self._next_sibling.append(self._first_child[parent] if parent >= 0 else -1)
+        self._preferred_child.append(-1)
+        self._prefix.append(prefix)
+        self._suffix.append(suffix)
+        self._cursor.append(memento.cursor_position)
+        self._timestamp.append(timestamp)
+        self._texts.append(text)
+        if parent >= 0:
+            self._first_child[parent] = node
+            self._preferred_child[parent] = node
+
+        self._visit(node)
+        self._cached_node, self._cached_text = node, memento.text
+        if self.verbose:
+            print(f"💾 Knoop #{node} opgeslagen (ouder #{parent})")
+        return node
+
+    def _visit(self, node: int) -> None:
+        moment = self._clock()
+        if self._visit_time:
+            moment = max(moment, self._visit_time[-1])  # Gesorteerd houden
+        self._visit_time.append(moment)
+        self._visit_node.append(node)
+        self.current = node
+
+    def _text_at(self, node: int) -> str:
+        """Pad omhoog tot een keyframe of de cache, daarna deltas omlaag"""
+        path = []
+        text = ""
+        while node >= 0:
+            if node == self._cached_node:
+                text = self._cached_text
+                break
+            path.append(node)
+            if self._prefix[node] == self._KEYFRAME:
+                break
+            node = self._parent[node]
+        for step in reversed(path):
+            prefix = self._prefix[step]
+            if prefix == self._KEYFRAME:
+                text = self._texts[step]
+            else:
+                end = len(text) - self._suffix[step]
+                text = text[:prefix] + self._texts[step] + text[end:]
+        if path:
+            self._cached_node, self._cached_text = path[0], text
+        return text
+
+    def memento_at(self, node: int) -> EditorMemento:
+        return EditorMemento(
+            text=self._text_at(node),
+            cursor_position=self._cursor[node],
+            timestamp=datetime.fromtimestamp(self._timestamp[node]).astimezone(),
+        )
+
+    def children(self, node: int) -> list[int]:
+        """Alle branches vanaf een knoop, nieuwste eerst"""
+        result = []
+        child = self._first_child[node]
+        while child >= 0:
+            result.append(child)
+            child = self._next_sibling[child]
+        return result
+
+    def restore_node(self, node: int) -> None:
+        """Spring naar een willekeurige knoop, ook in een andere branch"""
+        if not 0 <= node < len(self._parent):
+            print("✗ Ongeldige knoop")
+            return
+        self._visit(node)
+        # Redo volgt voortaan de branch naar deze knoop
+        child, parent = node, self._parent[node]
+        while parent >= 0 and self._preferred_child[parent] != child:
+            self._preferred_child[parent] = child
+            child, parent = parent, self._parent[parent]
+        self.editor.restore(self.memento_at(node))
+
+    def undo(self) -> None:
+        if self.current >= 0 and self._parent[self.current] >= 0:
+            self._visit(self._parent[self.current])
+            self.editor.restore(self.memento_at(self.current))
+        else:
+            print("✗ Geen eerdere knoop om naar terug te gaan")
+
+    def redo(self) -> None:
+        child = self._preferred_child[self.current] if self.current >= 0 else -1
+        if child >= 0:
+            self._visit(child)
+            self.editor.restore(self.memento_at(child))
+        else:
+            print("✗ Geen latere knoop om naartoe te gaan")
+
+    def node_at_time(self, moment: datetime) -> int:
+        """Knoop die op `moment` de huidige was (-1 als er nog geen was)"""
+        if moment.utcoffset() is None:
+            # Net als save(): zonder tijdzone is een tijdstip niet eenduidig
+            raise ValueError("Tijdstip zonder tijdzone, gebruik bv. .astimezone()")
+        index = bisect.bisect_right(self._visit_time, moment.timestamp()) - 1
+        return self._visit_node[index] if index >= 0 else -1
+
+    def restore_to_time(self, moment: datetime) -> None:
+        """Zet de editor terug zoals die op `moment` was, ook na undo of redo"""
+        node = self.node_at_time(moment)
+        if node >= 0:
+            self.restore_node(node)
+        else:
+            print("✗ Geen knoop op of voor dat tijdstip")
+
+    def memory_per_node(self) -> float:
+        """Bytes per knoop voor de kolommen en teksten"""
+        if not self._parent:
+            return 0.0
+        columns = (
+            self._parent,
+            self._depth,
+            self._first_child,
+            self._next_sibling,
+            self._preferred_child,
+            self._prefix,
+            self._suffix,
+            self._cursor,
+            self._timestamp,
+        )
+        total = sum(sys.getsizeof(column) for column in columns)
+        total += sys.getsizeof(self._texts)
+        seen = set()
+        for text in self._texts:
+            if id(text) not in seen:
+                seen.add(id(text))
+                total += sys.getsizeof(text)
+        return total / len(self._parent)
+
+
 # Gebruik
 if __name__ == "__main__":
     editor = TextEditor()
@@ -173,3 +810,34 @@ if __name__ == "__main__":
 
     print("\n=== Spring naar specifiek checkpoint ===")
     history.restore_checkpoint(1)  # Terug naar "Hello"
+
+    print("\n=== Checkpoints boven RAM budget naar schijf ===")
+    store = SpillingCheckpointStore(ram_budget=1_000)
+    spilling_history = EditorHistory(editor, store=store)
+    for word in ["een", "twee", "drie", "vier", "vijf", "zes", "zeven", "acht"]:
+        editor.type(f" {word}")
+        spilling_history.save_checkpoint()
+    spilling_history.restore_checkpoint(0)
+    print(f"📊 {store.get_statistics()}")
+    store.close()
+
+    print("\n=== Gedeelde opslag voor identieke checkpoints ===")
+    content_store = ContentStore()
+    dedup_history = EditorHistory(editor, content_store=content_store)
+    for _ in range(3):
+        dedup_history.save_checkpoint()  # Geen wijzigingen: zelfde tekst
+        editor.type("!")
+        dedup_history.save_checkpoint()
+        dedup_history.undo()
+    print(f"📊 {content_store.get_statistics()}")
+
+    print("\n=== Undo tree: branches blijven bewaard ===")
+    tree = UndoTree(editor)
+    tree.save_checkpoint()
+    editor.type(" (versie A)")
+    version_a = tree.save_checkpoint()
+    tree.undo()
+    editor.type(" (versie B)")
+    tree.save_checkpoint()
+    tree.restore_node(version_a)  # Terug naar de andere branch
+    print(f"📊 {len(tree)} knopen, {tree.memory_per_node():.0f} bytes per knoop")
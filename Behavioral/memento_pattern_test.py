@@ -0,0 +1,217 @@
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from Behavioral.memento_pattern import (
+    Checkpoint,
+    ContentStore,
+    EditorHistory,
+    SpillingCheckpointStore,
+    TextEditor,
+    UndoTree,
+)
+
+
+class TestEditorHistory(TestCase):
+    def test_restore_matches_saved_text(self):
+        self.check_history(None)
+
+    def test_restore_from_spilled_checkpoints(self):
+        store = SpillingCheckpointStore(ram_budget=2_000, page_cache_size=2)
+        try:
+            self.check_history(store)
+            statistics = store.get_statistics()
+            self.assertGreater(statistics["spilled_entries"], 0)
+            self.assertLessEqual(statistics["resident_bytes"], 2_000)
+        finally:
+            store.close()
+
+    def test_restore_from_content_store(self):
+        content_store = ContentStore(average_lines=2)
+        self.check_history(None, content_store)
+        self.assertGreater(content_store.get_statistics()["dedup_ratio"], 1)
+
+    def check_history(self, store, content_store=None):
+        rng = random.Random(5)
+        editor = TextEditor()
+        history = EditorHistory(
+            editor, keyframe_interval=4, store=store, content_store=content_store
+        )
+        expected: list[str] = []
+        for _ in range(60):
+            action = rng.random()
+            if action < 0.5:
+                editor.move_cursor(rng.randint(0, len(editor.text)))
+                editor.type(rng.choice(["ab", "c", " def ", "\n"]))
+            elif action < 0.7:
+                editor.delete(rng.randint(1, 3))
+            elif action < 0.85 and history.current_index > 0:
+                history.undo()
+                continue
+            del expected[history.current_index + 1 :]
+            history.save_checkpoint()
+            expected.append(editor.text)
+
+        self.assertEqual(len(history.history), len(expected))
+        for index in [*range(len(expected)), *reversed(range(len(expected)))]:
+            history.restore_checkpoint(index)
+            self.assertEqual(editor.text, expected[index])
+
+
+class TestSpillingCheckpointStore(TestCase):
+    def make_checkpoint(self, number: int) -> Checkpoint:
+        zone = timezone(timedelta(hours=2))
+        moment = datetime(2024, 10, 27, 2, 30, number, 123456, zone)
+        return Checkpoint(f"tekst {number} " * 20, number, moment, is_keyframe=True)
+
+    def test_timestamps_round_trip_exactly(self):
+        store = SpillingCheckpointStore(ram_budget=0)
+        self.addCleanup(store.close)
+        checkpoints = [self.make_checkpoint(number) for number in range(5)]
+        for checkpoint in checkpoints:
+            store.append(checkpoint)
+        self.assertGreater(store.spilled_count, 0)
+        for index, checkpoint in enumerate(checkpoints):
+            self.assertEqual(store[index].timestamp, checkpoint.timestamp)
+            self.assertEqual(store[index].timestamp.utcoffset(), timedelta(hours=2))
+
+    def test_truncation_shrinks_segment_file(self):
+        store = SpillingCheckpointStore(ram_budget=0)
+        self.addCleanup(store.close)
+        for number in range(10):
+            store.append(self.make_checkpoint(number))
+        store[8]  # Houdt een mmap open over het hele bestand
+        full_size = store.get_statistics()["segment_file_bytes"]
+        del store[4:]
+        statistics = store.get_statistics()
+        self.assertLess(statistics["segment_file_bytes"], full_size)
+        self.assertEqual(statistics["segment_file_bytes"], statistics["spilled_bytes"])
+        for number in range(10, 16):
+            store.append(self.make_checkpoint(number))
+        statistics = store.get_statistics()
+        self.assertEqual(statistics["segment_file_bytes"], statistics["spilled_bytes"])
+        self.assertEqual(store[3].text, self.make_checkpoint(3).text)
+        self.assertEqual(store[5].text, self.make_checkpoint(11).text)
+
+    def test_close_keeps_caller_supplied_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "segment.checkpoints")
+        store = SpillingCheckpointStore(ram_budget=0, path=path)
+        store.append(self.make_checkpoint(0))
+        store.append(self.make_checkpoint(1))
+        store.close()
+        self.assertTrue(os.path.exists(path))
+
+        own = SpillingCheckpointStore(ram_budget=0)
+        own.close()
+        self.assertFalse(os.path.exists(own.path))
+
+
+class TestUndoTree(TestCase):
+    def test_branches_are_kept(self):
+        editor = TextEditor()
+        tree = UndoTree(editor, keyframe_interval=3, verbose=False)
+        tree.save_checkpoint()
+        expected = {}
+        for word in ["a", "b", "c", "d"]:
+            editor.type(word)
+            expected[tree.save_checkpoint()] = editor.text
+        tree.undo()
+        tree.undo()
+        editor.type("X")
+        branch = tree.save_checkpoint()
+        expected[branch] = editor.text
+
+        self.assertEqual(len(tree.children(2)), 2)
+        for node, text in [*expected.items(), *reversed(expected.items())]:
+            tree.restore_node(node)
+            self.assertEqual(editor.text, text)
+
+        # Redo volgt de laatst bezochte branch
+        tree.restore_node(branch)
+        tree.restore_node(2)
+        tree.redo()
+        self.assertEqual(editor.text, expected[branch])
+
+    def test_restore_to_time(self):
+        now = [0.0]
+        editor = TextEditor()
+        tree = UndoTree(editor, verbose=False, clock=lambda: now[0])
+
+        def at(seconds: float) -> datetime:
+            return datetime.fromtimestamp(seconds, timezone.utc)
+
+        for seconds, word in ((10, ""), (20, "first"), (30, " second")):
+            editor.type(word)
+            now[0] = seconds
+            tree.save_checkpoint()
+        now[0] = 40
+        tree.undo()
+        editor.type(" other")
+        now[0] = 50
+        tree.save_checkpoint()
+
+        self.assertEqual(tree.node_at_time(at(5)), -1)
+        self.assertEqual(tree.node_at_time(at(35)), 2)
+        self.assertEqual(tree.node_at_time(at(45)), 1)  # Na de undo, niet knoop 2
+        self.assertEqual(tree.node_at_time(at(55)), 3)
+        tree.restore_to_time(at(45))
+        self.assertEqual(tree.current, 1)
+        self.assertEqual(editor.text, "first")
+        tree.restore_to_time(at(35))
+        self.assertEqual(tree.current, 2)
+        self.assertEqual(editor.text, "first second")
+
+        self.assertIsNotNone(tree.memento_at(2).timestamp.utcoffset())
+        naive = datetime(1970, 1, 1, 0, 0, 45)
+        with self.assertRaises(ValueError):
+            tree.node_at_time(naive)
+        with self.assertRaises(ValueError):
+            tree.restore_to_time(naive)
+        self.assertEqual(tree.current, 2)
+
+
+class TestContentStore(TestCase):
+    def test_identical_texts_share_storage(self):
+        store = ContentStore()
+        first = store.put("line\n" * 100)
+        self.assertIs(store.put("line\n" * 100), first)
+        self.assertEqual(first.text(), "line\n" * 100)
+
+    def test_long_line_after_short_lines_round_trips(self):
+        store = ContentStore(max_chunk=64)
+        text = "a\nb\n" + "c" * 500 + "\nd\n" + "e" * 64
+        self.assertEqual(store.put(text).text(), text)
+        text = "a\n" + "b" * 5000
+        self.assertEqual(ContentStore().put(text).text(), text)
+
+        editor = TextEditor()
+        history = EditorHistory(editor, content_store=ContentStore(max_chunk=16))
+        editor.type("kort\n")
+        history.save_checkpoint()
+        editor.type("x" * 100)
+        history.save_checkpoint()
+        history.restore_checkpoint(0)
+        history.restore_checkpoint(1)
+        self.assertEqual(editor.text, "kort\n" + "x" * 100)
+
+    def test_average_lines_must_be_power_of_two(self):
+        with self.assertRaises(ValueError):
+            ContentStore(average_lines=12)
+
+    def test_near_identical_texts_share_chunks(self):
+        store = ContentStore(average_lines=4)
+        lines = [f"regel {i}\n" for i in range(1_000)]
+        original = store.put("".join(lines))
+        lines[500] = "gewijzigd\n"
+        changed = store.put("".join(lines))
+        shared = set(map(id, original.chunks)) & set(map(id, changed.chunks))
+        self.assertGreater(len(shared), len(changed.chunks) * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,51 @@
+from contextlib import contextmanager
 from typing import Protocol
 
+from Behavioral.observer_set import ObserverSet
+
 
 class Subject:
-    def __init__(self):
-        self._observers = []
+    """
+    Standaard krijgt elke observer bij elke toewijzing aan state een update.
+    Binnen `with subject.batch():` of met deferred=True (afleveren bij tick())
+    worden toewijzingen samengevoegd: observers krijgen één update met de
+    laatste state, en met collect_changes=True staan alle waarden in `changes`.
+    Loopt een batch-blok op een exception, dan wordt de state van vóór het
+    blok teruggezet en krijgen observers niets: geen halve update.
+    """
+
+    def __init__(
+        self,
+        weak_observers: bool = False,
+        deferred: bool = False,
+        collect_changes: bool = False,
+    ):
+        self._observers = ObserverSet(weak=weak_observers)
         self._state = None
+        self.deferred = deferred
+        self.collect_changes = collect_changes
+        self._changes: list = []  # Verzameld, nog niet afgeleverd
+        self._delivering: list | None = None
+        self._batch_depth = 0
+        self._dirty = False
+        self.suppressed_notifications = 0
 
     def attach(self, observer):
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._observers.add(observer)
 
     def detach(self, observer):
-        self._observers.remove(observer)
+        if not self._observers.discard(observer):
+            raise ValueError("Observer is niet geregistreerd")
 
     def notify(self):
         for observer in self._observers:
             observer.update(self)
 
+    @property
+    def changes(self) -> list:
+        """Tijdens een notificatie de afgeleverde waarden, anders wat nog wacht"""
+        return self._changes if self._delivering is None else self._delivering
+
     @property
     def state(self):
         return self._state
@@ -24,7 +53,48 @@ class Subject:
     @state.setter
     def state(self, value):
         self._state = value
-        self.notify()
+        if not self.deferred and not self._batch_depth:
+            self.notify()
+            return
+        if self._dirty:
+            self.suppressed_notifications += 1
+        self._dirty = True
+        if self.collect_changes:
+            self._changes.append(value)
+
+    @contextmanager
+    def batch(self):
+        """Stel notificaties uit tot het einde van het (buitenste) blok"""
+        saved = (
+            self._state,
+            self._dirty,
+            self.suppressed_notifications,
+            len(self._changes),
+        )
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._state, self._dirty, self.suppressed_notifications, count = saved
+            del self._changes[count:]
+            raise
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self.tick()
+
+    def tick(self):
+        """Lever uitgestelde wijzigingen af als één notificatie"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Eerst leegmaken: wat een observer nu toewijst, hoort bij de volgende
+        delivering, self._changes = self._changes, []
+        previous, self._delivering = self._delivering, delivering
+        try:
+            self.notify()
+        finally:
+            self._delivering = previous
 
 
 class Observer(Protocol):
@@ -43,20 +113,29 @@ class ConcreteObserverB(Observer):
 
 
 # Gebruik
-subject = Subject()
-
-observer_a = ConcreteObserverA()
-observer_b = ConcreteObserverB()
-
-subject.attach(observer_a)
-subject.attach(observer_b)
-
-subject.state = "State 1"
-# Output:
-# ObserverA: Reacted to state change -> State 1
-# ObserverB: Received update -> State 1
-
-subject.state = "State 2"
-# Output:
-# ObserverA: Reacted to state change -> State 2
-# ObserverB: Received update -> State 2
+if __name__ == "__main__":
+    subject = Subject()
+
+    observer_a = ConcreteObserverA()
+    observer_b = ConcreteObserverB()
+
+    subject.attach(observer_a)
+    subject.attach(observer_b)
+
+    subject.state = "State 1"
+    # Output:
+    # ObserverA: Reacted to state change -> State 1
+    # ObserverB: Received update -> State 1
+
+    subject.state = "State 2"
+    # Output:
+    # ObserverA: Reacted to state change -> State 2
+    # ObserverB: Received update -> State 2
+
+    with subject.batch():
+        for i in range(1_000):
+            subject.state = f"State {i}"
+    # Output: één update per observer
+    # ObserverA: Reacted to state change -> State 999
+    # ObserverB: Received update -> State 999
+    print(f"Onderdrukte notificaties: {subject.suppressed_notifications}")
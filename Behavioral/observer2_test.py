@@ -0,0 +1,90 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.observer2 import Subject
+
+
+class Recorder:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, subject):
+        self.updates.append((subject.state, list(subject.changes)))
+
+
+class TestSubjectBatching(TestCase):
+    def setUp(self):
+        self.observer = Recorder()
+
+    def test_batch_delivers_only_latest_state(self):
+        subject = Subject()
+        subject.attach(self.observer)
+        with subject.batch():
+            for value in range(1_000):
+                subject.state = value
+            with subject.batch():  # Genest blok levert niets af
+                subject.state = "laatste"
+            self.assertEqual(self.observer.updates, [])
+        self.assertEqual(self.observer.updates, [("laatste", [])])
+        self.assertEqual(subject.suppressed_notifications, 1_000)
+
+    def test_collect_changes(self):
+        subject = Subject(collect_changes=True)
+        subject.attach(self.observer)
+        with subject.batch():
+            subject.state = 1
+            subject.state = 2
+        self.assertEqual(self.observer.updates, [(2, [1, 2])])
+        self.assertEqual(subject.changes, [])
+
+    def test_failed_batch_notifies_nobody_and_restores_state(self):
+        subject = Subject(collect_changes=True)
+        subject.state = "voor"
+        subject.attach(self.observer)
+        with self.assertRaises(RuntimeError):
+            with subject.batch():
+                subject.state = "half"
+                subject.state = "bijna"
+                raise RuntimeError("mislukt")
+        self.assertEqual(self.observer.updates, [])
+        self.assertEqual(subject.state, "voor")
+        self.assertEqual(subject.suppressed_notifications, 0)
+        self.assertEqual(subject.changes, [])
+        subject.tick()  # Niets blijft hangen voor later
+        self.assertEqual(self.observer.updates, [])
+
+    def test_assignment_during_flush_is_kept(self):
+        subject = Subject(deferred=True, collect_changes=True)
+
+        class Normalizer(Recorder):
+            def update(self, subject):
+                super().update(subject)
+                if subject.state != subject.state.strip():
+                    subject.state = subject.state.strip()
+
+        observer = Normalizer()
+        subject.attach(observer)
+        subject.state = " a "
+        subject.tick()
+        subject.tick()
+        self.assertEqual(observer.updates, [(" a ", [" a "]), ("a", ["a"])])
+
+    def test_deferred_subject_notifies_on_tick(self):
+        subject = Subject(deferred=True)
+        subject.attach(self.observer)
+        subject.state = "a"
+        subject.state = "b"
+        subject.tick()
+        subject.tick()  # Niets gewijzigd: geen notificatie
+        self.assertEqual(self.observer.updates, [("b", [])])
+
+    def test_without_batch_every_assignment_notifies(self):
+        subject = Subject()
+        subject.attach(self.observer)
+        subject.state = 1
+        subject.state = 2
+        self.assertEqual(len(self.observer.updates), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import time
+
+from Behavioral.observer2 import Subject
+
+SIZES = [1_000, 10_000, 100_000]
+LIST_LIMIT = 10_000  # De lijstversie is kwadratisch; daarboven duurt het te lang
+
+
+class ListSubject:
+    """De oorspronkelijke lijst-implementatie, als referentie"""
+
+    def __init__(self):
+        self._observers = []
+
+    def attach(self, observer):
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def detach(self, observer):
+        self._observers.remove(observer)
+
+
+class NullObserver:
+    def update(self, subject):
+        pass
+
+
+def churn(subject, observers: list, seed: int) -> float:
+    """Iedereen inschrijven en in willekeurige volgorde weer uitschrijven"""
+    order = observers[:]
+    random.Random(seed).shuffle(order)
+    start = time.perf_counter()
+    for observer in observers:
+        subject.attach(observer)
+    for observer in order:
+        subject.detach(observer)
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'observers':>10} | {'lijst (s)':>10} | {'set (s)':>9} | "
+        f"{'zwak (s)':>9} | {'(af)meldingen/s':>15}"
+    )
+    print("-" * 66)
+    for size in SIZES:
+        observers = [NullObserver() for _ in range(size)]
+        list_time = None
+        if size <= LIST_LIMIT:
+            list_time = churn(ListSubject(), observers, seed=size)
+        set_time = churn(Subject(), observers, seed=size)
+        weak_time = churn(Subject(weak_observers=True), observers, seed=size)
+        list_text = f"{list_time:>10.4f}" if list_time is not None else f"{'-':>10}"
+        print(
+            f"{size:>10,} | {list_text} | {set_time:>9.4f} | {weak_time:>9.4f} | "
+            f"{2 * size / set_time:>15,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+import asyncio
+import inspect
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+DROP = "drop"  # Vol: het nieuwe bericht vervalt
+BLOCK = "block"  # Vol: de publisher wacht (maximaal `block_timeout` seconden)
+
+
+# Basis voor alle dispatchers: tellers en de gedeelde instellingen
+class Dispatcher(ABC):
+    """
+    block_timeout: hoe lang de publisher bij BLOCK op plaats in een volle
+    mailbox wacht; daarna vervalt het bericht en telt het als timeout.
+    delivery_timeout: hoe lang één aflevering mag duren. Wordt die afgebroken,
+    dan telt dat als timeout; een aflevering die niet af te breken is en te
+    lang duurde, telt als `late`.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 1024,
+        policy: str = DROP,
+        block_timeout: float | None = None,
+        delivery_timeout: float | None = None,
+    ):
+        if policy not in (DROP, BLOCK):
+            raise ValueError(f"Onbekende policy: {policy}")
+        self.queue_size = queue_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.delivery_timeout = delivery_timeout
+        self._lock = threading.Lock()
+        self.delivered = 0
+        self.dropped = 0
+        self.timeouts = 0
+        self.late = 0
+        self.errors = 0
+
+    @abstractmethod
+    def dispatch(self, subscribers, news) -> None: ...
+
+    def remove(self, subscriber) -> None:
+        """Subscriber is uitgeschreven; nog onderweg zijnde berichten blijven"""
+
+    def flush(self) -> None:
+        """Wacht tot alle berichten afgeleverd zijn"""
+
+    def close(self) -> None:
+        self.flush()
+
+    def _late(self, start: float) -> bool:
+        return (
+            self.delivery_timeout is not None
+            and time.perf_counter() - start > self.delivery_timeout
+        )
+
+    def _admit(self, condition, pending: dict[int, int], subscribers) -> list:
+        """Met `condition` vast: de subscribers waarvan de mailbox plaats heeft"""
+        accepted = []
+        dropped = 0
+        for subscriber in subscribers:
+            key = id(subscriber)
+            if pending.get(key, 0) >= self.queue_size and not self._wait_for_room(
+                condition, pending, key
+            ):
+                dropped += 1
+                continue
+            pending[key] = pending.get(key, 0) + 1
+            accepted.append(subscriber)
+        if dropped:
+            self._count(dropped=dropped)
+        return accepted
+
+    def _wait_for_room(self, condition, pending: dict[int, int], key: int) -> bool:
+        if self.policy == DROP:
+            return False
+        has_room = condition.wait_for(
+            lambda: pending.get(key, 0) < self.queue_size, self.block_timeout
+        )
+        if not has_room:
+            self._count(timeouts=1)
+        return has_room
+
+    @staticmethod
+    def _release(pending: dict[int, int], key: int, count: int = 1) -> None:
+        """Met de condition vast: `count` berichten van `key` zijn afgehandeld"""
+        if pending[key] == count:
+            del pending[key]
+        else:
+            pending[key] -= count
+
+    def _count(self, **counters: int) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def get_statistics(self) -> dict:
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "timeouts": self.timeouts,
+            "late": self.late,
+            "errors": self.errors,
+        }
+
+
+# Dispatcher 1: serieel in de thread van de publisher (het oorspronkelijke gedrag)
+class InlineDispatcher(Dispatcher):
+    """Een timeout kan hier niet onderbreken; trage aflevering wordt geteld"""
+
+    def dispatch(self, subscribers, news) -> None:
+        for subscriber in subscribers:
+            start = time.perf_counter()
+            subscriber.receive_news(news)
+            if self._late(start):
+                self.late += 1
+            self.delivered += 1
+
+
+class _Shard:
+    """Eén worker thread met zijn eigen wachtrij van (subscribers, nieuws)"""
+
+    def __init__(self):
+        self.batches: deque = deque()
+        self.pending: dict[int, int] = {}  # id(subscriber) -> berichten onderweg
+        self.condition = threading.Condition()
+        self.busy = False
+        self.closing = False
+
+
+# Dispatcher 2: vaste pool van worker threads, subscribers verdeeld in shards
+class ThreadPoolDispatcher(Dispatcher):
+    """
+    Elke subscriber hoort vast bij één worker, dus berichten komen per
+    subscriber in volgorde aan terwijl de workers parallel werken. Per publicatie
+    gaat er één batch per worker in de wachtrij, niet één taak per subscriber.
+    De mailbox van een subscriber is begrensd op `queue_size` berichten
+    onderweg. Een trage subscriber houdt wel de andere in zijn shard op.
+    """
+
+    def __init__(self, workers: int = 8, **options):
+        super().__init__(**options)
+        self._shards = [_Shard() for _ in range(workers)]
+        self._threads = [
+            threading.Thread(target=self._work, args=(shard,), daemon=True)
+            for shard in self._shards
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def dispatch(self, subscribers, news) -> None:
+        groups = [[] for _ in self._shards]
+        for subscriber in subscribers:
+            # Adressen liggen op vaste afstanden; vermenigvuldigen spreidt ze
+            groups[(id(subscriber) * 0x9E3779B1 >> 20) % len(groups)].append(subscriber)
+        for shard, group in zip(self._shards, groups):
+            if group:
+                self._post(shard, group, news)
+
+    def _post(self, shard: _Shard, group: list, news) -> None:
+        with shard.condition:
+            accepted = self._admit(shard.condition, shard.pending, group)
+            if accepted:
+                shard.batches.append((accepted, news))
+                shard.condition.notify_all()
+
+    def _work(self, shard: _Shard) -> None:
+        while True:
+            with shard.condition:
+                shard.condition.wait_for(lambda: shard.batches or shard.closing)
+                if not shard.batches:
+                    return
+                subscribers, news = shard.batches.popleft()
+                shard.busy = True
+            delivered = errors = late = 0
+            for subscriber in subscribers:
+                start = time.perf_counter()
+                try:
+                    subscriber.receive_news(news)
+                except Exception:
+                    errors += 1
+                    continue
+                delivered += 1
+                late += self._late(start)
+            self._count(delivered=delivered, errors=errors, late=late)
+            with shard.condition:
+                for subscriber in subscribers:
+                    self._release(shard.pending, id(subscriber))
+                shard.busy = False
+                shard.condition.notify_all()
+
+    def flush(self) -> None:
+        for shard in self._shards:
+            with shard.condition:
+                shard.condition.wait_for(lambda: not shard.batches and not shard.busy)
+
+    def close(self) -> None:
+        self.flush()
+        for shard in self._shards:
+            with shard.condition:
+                shard.closing = True
+                shard.condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+
+_STOP = object()  # Laatste item in de wachtrij van een uitgeschreven subscriber
+
+
+class _Mailbox:
+    """Wachtrij van één subscriber; de taak die ze leegt loopt tot _STOP"""
+
+    def __init__(self, subscriber):
+        # Zwak waar het kan: de dispatcher houdt een subscriber niet in leven
+        try:
+            self.subscriber = weakref.ref(subscriber)
+        except TypeError:
+            self.subscriber = lambda: subscriber
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+
+# Dispatcher 3: asyncio event loop in een eigen thread
+class AsyncioDispatcher(Dispatcher):
+    """
+    Elke subscriber krijgt een wachtrij en één taak die ze leegt tot remove()
+    of close(), zodat berichten per subscriber in volgorde aankomen. Zoals bij
+    ThreadPoolDispatcher telt de publisher berichten onderweg per subscriber
+    en wacht of laat vallen in zijn eigen thread; een publicatie is daardoor
+    één call_soon_threadsafe, zonder op de loop te wachten.
+    Een `async def receive_news` wordt met asyncio.wait_for afgebroken na
+    `delivery_timeout`. Een gewone receive_news kan blokkeren en loopt daarom
+    in een executor van `workers` threads, met alles wat in de wachtrij staat
+    in één keer: één sprong per batch, niet per bericht.
+    """
+
+    def __init__(self, workers: int = 8, **options):
+        super().__init__(**options)
+        self._executor = ThreadPoolExecutor(workers)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._room = threading.Condition()
+        self._pending: dict[int, int] = {}  # id(subscriber) -> berichten onderweg
+        self._mailboxes: dict[int, _Mailbox] = {}  # Alleen in de loop thread
+        self._tasks: set[asyncio.Task] = set()
+
+    def dispatch(self, subscribers, news) -> None:
+        with self._room:
+            accepted = self._admit(self._room, self._pending, subscribers)
+        if accepted:
+            self._loop.call_soon_threadsafe(self._enqueue, accepted, news)
+
+    def remove(self, subscriber) -> None:
+        self._loop.call_soon_threadsafe(self._retire, id(subscriber))
+
+    def _retire(self, key: int) -> None:
+        mailbox = self._mailboxes.pop(key, None)
+        if mailbox is not None:
+            mailbox.queue.put_nowait(_STOP)
+
+    def _enqueue(self, subscribers, news) -> None:
+        for subscriber in subscribers:
+            key = id(subscriber)
+            mailbox = self._mailboxes.get(key)
+            if mailbox is None or mailbox.subscriber() is not subscriber:
+                if mailbox is not None:  # id hergebruikt na een verdwenen subscriber
+                    self._retire(key)
+                mailbox = self._mailboxes[key] = _Mailbox(subscriber)
+                task = self._loop.create_task(self._consume(key, mailbox))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            mailbox.queue.put_nowait(news)
+
+    def _receive_all(self, subscriber, batch: list) -> None:
+        """In de executor: een batch voor één gewone subscriber"""
+        delivered = errors = late = 0
+        for news in batch:
+            start = time.perf_counter()
+            try:
+                subscriber.receive_news(news)
+            except Exception:
+                errors += 1
+                continue
+            delivered += 1
+            late += self._late(start)
+        self._count(delivered=delivered, errors=errors, late=late)
+
+    async def _receive_all_async(self, subscriber, batch: list) -> None:
+        for news in batch:
+            try:
+                await asyncio.wait_for(
+                    subscriber.receive_news(news), self.delivery_timeout
+                )
+            except asyncio.TimeoutError:
+                self._count(timeouts=1)
+            except Exception:
+                self._count(errors=1)
+            else:
+                self._count(delivered=1)
+
+    async def _consume(self, key: int, mailbox: _Mailbox) -> None:
+        queue = mailbox.queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            news = [item for item in batch if item is not _STOP]
+            subscriber = mailbox.subscriber()
+            if subscriber is None:
+                self._count(dropped=len(news))
+            elif news and inspect.iscoroutinefunction(subscriber.receive_news):
+                await self._receive_all_async(subscriber, news)
+            elif news:
+                await self._loop.run_in_executor(
+                    self._executor, self._receive_all, subscriber, news
+                )
+            if news:
+                with self._room:
+                    self._release(self._pending, key, len(news))
+                    self._room.notify_all()
+            if subscriber is None or len(news) < len(batch):
+                if self._mailboxes.get(key) is mailbox:
+                    del self._mailboxes[key]
+                return
+
+    async def _stop_consumers(self) -> None:
+        for key in list(self._mailboxes):
+            self._retire(key)
+        await asyncio.gather(*self._tasks)
+
+    def flush(self) -> None:
+        with self._room:
+            self._room.wait_for(lambda: not self._pending)
+
+    def close(self) -> None:
+        self.flush()
+        asyncio.run_coroutine_threadsafe(self._stop_consumers(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._executor.shutdown()
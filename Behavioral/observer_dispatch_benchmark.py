@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+from Behavioral.observer_dispatch import (
+    BLOCK,
+    AsyncioDispatcher,
+    InlineDispatcher,
+    ThreadPoolDispatcher,
+)
+from Behavioral.observer_pattern import NewsAgency
+
+SUBSCRIBER_COUNTS = [1, 10, 100, 1_000]
+DELIVERIES = 200_000  # Per meting ongeveer evenveel afleveringen
+IO_DELIVERIES = 2_000
+IO_SECONDS = 0.0002  # Gesimuleerde I/O per aflevering
+
+
+class CountingSubscriber:
+    def __init__(self):
+        self.count = 0
+
+    def receive_news(self, news):
+        self.count += 1
+
+
+class BlockingIOSubscriber(CountingSubscriber):
+    def receive_news(self, news):
+        time.sleep(IO_SECONDS)
+        self.count += 1
+
+
+class AsyncIOSubscriber(CountingSubscriber):
+    async def receive_news(self, news):
+        await asyncio.sleep(IO_SECONDS)
+        self.count += 1
+
+
+DISPATCHERS = {
+    "inline": InlineDispatcher,
+    "threads": lambda: ThreadPoolDispatcher(workers=8, policy=BLOCK),
+    "asyncio": lambda: AsyncioDispatcher(policy=BLOCK),
+}
+
+
+def measure(
+    make_dispatcher,
+    subscriber_count: int,
+    subscriber_type=CountingSubscriber,
+    deliveries: int = DELIVERIES,
+) -> float:
+    """Geeft publicaties per seconde, inclusief wachten op de laatste aflevering"""
+    agency = NewsAgency(dispatcher=make_dispatcher())
+    subscribers = [subscriber_type() for _ in range(subscriber_count)]
+    for subscriber in subscribers:
+        agency.subscribe(subscriber)
+    messages = max(1, deliveries // subscriber_count)
+
+    start = time.perf_counter()
+    for number in range(messages):
+        agency.publish_news(number)
+    agency.flush()
+    elapsed = time.perf_counter() - start
+    agency.close()
+
+    assert all(subscriber.count == messages for subscriber in subscribers)
+    return messages / elapsed
+
+
+def print_table(title: str, rows: list[tuple[int, list[float]]]):
+    header = " | ".join(f"{name:>12}" for name in DISPATCHERS)
+    print(f"\n{title}")
+    print(f"{'subscribers':>11} | {header}   (publicaties/s)")
+    print("-" * (14 + 15 * len(DISPATCHERS)))
+    for count, rates in rows:
+        print(f"{count:>11,} | " + " | ".join(f"{rate:>12,.0f}" for rate in rates))
+
+
+def main():
+    rows = [
+        (count, [measure(make, count) for make in DISPATCHERS.values()])
+        for count in SUBSCRIBER_COUNTS
+    ]
+    print_table("Subscribers zonder werk (alleen dispatch overhead)", rows)
+
+    # Met I/O wint parallel afleveren; asyncio krijgt de async variant
+    io_rows = []
+    for count in SUBSCRIBER_COUNTS[:3]:
+        rates = []
+        for name, make in DISPATCHERS.items():
+            kind = AsyncIOSubscriber if name == "asyncio" else BlockingIOSubscriber
+            rates.append(measure(make, count, kind, IO_DELIVERIES))
+        io_rows.append((count, rates))
+    print_table(f"Subscribers met {IO_SECONDS * 1000:.1f} ms I/O", io_rows)
+
+
+if __name__ == "__main__":
+    main()
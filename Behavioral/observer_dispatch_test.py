@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import TestCase
+
+from Behavioral.observer_dispatch import (
+    BLOCK,
+    AsyncioDispatcher,
+    Dispatcher,
+    InlineDispatcher,
+    ThreadPoolDispatcher,
+)
+from Behavioral.observer_pattern import NewsAgency
+
+
+class Recorder:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = []
+
+    def receive_news(self, news):
+        if self.delay:
+            time.sleep(self.delay)
+        self.received.append(news)
+
+
+class GatedRecorder(Recorder):
+    """Blijft in het eerste bericht hangen tot de test de poort opent"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def receive_news(self, news):
+        self.started.set()
+        self.gate.wait()
+        super().receive_news(news)
+
+
+class AsyncRecorder:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received = []
+
+    async def receive_news(self, news):
+        await asyncio.sleep(self.delay)
+        self.received.append(news)
+
+
+class TestDispatchers(TestCase):
+    def publish(self, dispatcher, subscribers, count):
+        agency = NewsAgency(dispatcher=dispatcher)
+        for subscriber in subscribers:
+            agency.subscribe(subscriber)
+        for number in range(count):
+            agency.publish_news(number)
+        agency.close()
+        return dispatcher.get_statistics()
+
+    def test_every_dispatcher_preserves_order_per_subscriber(self):
+        for dispatcher in (
+            InlineDispatcher(),
+            ThreadPoolDispatcher(workers=4, policy=BLOCK),
+            AsyncioDispatcher(policy=BLOCK),
+        ):
+            with self.subTest(dispatcher=type(dispatcher).__name__):
+                subscribers = [Recorder() for _ in range(20)]
+                statistics = self.publish(dispatcher, subscribers, 200)
+                self.assertEqual(statistics["delivered"], 20 * 200)
+                for subscriber in subscribers:
+                    self.assertEqual(subscriber.received, list(range(200)))
+
+    def test_full_mailbox_drops_new_messages(self):
+        slow = GatedRecorder()
+        dispatcher = ThreadPoolDispatcher(workers=2, queue_size=3)
+        agency = NewsAgency(dispatcher=dispatcher)
+        agency.subscribe(slow)
+        for number in range(10):
+            agency.publish_news(number)
+        slow.started.wait()
+        slow.gate.set()
+        agency.close()
+        self.assertEqual(slow.received, [0, 1, 2])
+        self.assertEqual(dispatcher.dropped, 7)
+
+    def test_block_policy_gives_up_after_timeout(self):
+        dispatcher = ThreadPoolDispatcher(
+            workers=1, queue_size=2, policy=BLOCK, block_timeout=0.01
+        )
+        slow = Recorder(delay=0.1)
+        statistics = self.publish(dispatcher, [slow], 3)
+        self.assertEqual(statistics["dropped"], 1)
+        self.assertEqual(slow.received, [0, 1])
+
+    def test_slow_coroutine_subscriber_is_cut_off(self):
+        fast, slow = AsyncRecorder(), AsyncRecorder(delay=1.0)
+        dispatcher = AsyncioDispatcher(delivery_timeout=0.01)
+        statistics = self.publish(dispatcher, [fast, slow], 2)
+        self.assertEqual(fast.received, [0, 1])
+        self.assertEqual(slow.received, [])
+        self.assertEqual(statistics["timeouts"], 2)
+
+    def test_blocking_sync_subscriber_does_not_hold_up_the_loop(self):
+        gated, fast = GatedRecorder(), AsyncRecorder()
+        dispatcher = AsyncioDispatcher(delivery_timeout=0.01)
+        agency = NewsAgency(dispatcher=dispatcher)
+        agency.subscribe(gated)
+        agency.subscribe(fast)
+        agency.publish_news("eerste")
+        gated.started.wait(1)
+        agency.publish_news("tweede")
+        deadline = time.monotonic() + 2
+        while len(fast.received) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(fast.received, ["eerste", "tweede"])  # Loop liep door
+        time.sleep(10 * dispatcher.delivery_timeout)  # Zeker te laat
+        gated.gate.set()
+        agency.close()
+        self.assertEqual(gated.received, ["eerste", "tweede"])
+        self.assertGreaterEqual(dispatcher.late, 1)  # Geteld, niet afgebroken
+        self.assertEqual(dispatcher.timeouts, 0)
+
+    def test_block_wait_and_delivery_time_are_separate_limits(self):
+        dispatcher = ThreadPoolDispatcher(
+            workers=1,
+            queue_size=1,
+            policy=BLOCK,
+            block_timeout=5,
+            delivery_timeout=0.01,
+        )
+        slow = Recorder(delay=0.05)
+        statistics = self.publish(dispatcher, [slow], 3)
+        self.assertEqual(slow.received, [0, 1, 2])  # Publisher wachtte lang genoeg
+        self.assertEqual(statistics["dropped"], 0)
+        self.assertEqual(statistics["timeouts"], 0)
+        self.assertEqual(statistics["late"], 3)
+
+    def test_asyncio_mailbox_lives_until_unsubscribe(self):
+        dispatcher = AsyncioDispatcher()
+        agency = NewsAgency(dispatcher=dispatcher)
+        subscribers = [Recorder(), Recorder()]
+        for subscriber in subscribers:
+            agency.subscribe(subscriber)
+        agency.publish_news(0)
+        agency.flush()
+        tasks = set(dispatcher._tasks)
+        self.assertEqual(len(tasks), 2)
+        agency.publish_news(1)
+        agency.flush()
+        self.assertEqual(dispatcher._tasks, tasks)  # Geen nieuwe taak per bericht
+
+        agency.unsubscribe(subscribers[0])
+        agency.publish_news(2)
+        agency.close()
+        self.assertEqual(dispatcher._tasks, set())
+        self.assertEqual(subscribers[0].received, [0, 1])
+        self.assertEqual(subscribers[1].received, [0, 1, 2])
+
+    def test_dispatcher_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Dispatcher()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,41 @@
+from Behavioral.observer_dispatch import Dispatcher, InlineDispatcher
+from Behavioral.observer_set import ObserverSet
+
+
 class NewsAgency:
-    def __init__(self):
-        self._subscribers = []
+    """
+    Het afleveren zelf is uitbesteed aan een dispatcher: inline (standaard),
+    via een thread pool of via een asyncio event loop.
+    """
+
+    def __init__(
+        self, weak_subscribers: bool = False, dispatcher: Dispatcher | None = None
+    ):
+        self._subscribers = ObserverSet(weak=weak_subscribers)
+        self.dispatcher = dispatcher if dispatcher is not None else InlineDispatcher()
         self._news = None
 
     def subscribe(self, subscriber):
-        self._subscribers.append(subscriber)
+        self._subscribers.add(subscriber)
 
     def unsubscribe(self, subscriber):
-        self._subscribers.remove(subscriber)
+        if not self._subscribers.discard(subscriber):
+            raise ValueError("Subscriber is niet ingeschreven")
+        self.dispatcher.remove(subscriber)
 
     def publish_news(self, news):
         self._news = news
         self._notify_subscribers()
 
     def _notify_subscribers(self):
-        for subscriber in self._subscribers:
-            subscriber.receive_news(self._news)
+        self.dispatcher.dispatch(self._subscribers, self._news)
+
+    def flush(self):
+        """Wacht tot alle subscribers het gepubliceerde nieuws ontvangen hebben"""
+        self.dispatcher.flush()
+
+    def close(self):
+        self.dispatcher.close()
 
 
 class NewsSubscriber:
@@ -27,15 +47,27 @@ class NewsSubscriber:
 
 
 # Gebruik
-agency = NewsAgency()
+if __name__ == "__main__":
+    agency = NewsAgency()
+
+    subscriber1 = NewsSubscriber("Alice")
+    subscriber2 = NewsSubscriber("Bob")
+
+    agency.subscribe(subscriber1)
+    agency.subscribe(subscriber2)
 
-subscriber1 = NewsSubscriber("Alice")
-subscriber2 = NewsSubscriber("Bob")
+    agency.publish_news("Breaking: Python 4.0 released!")
+    # Output:
+    # Alice received: Breaking: Python 4.0 released!
+    # Bob received: Breaking: Python 4.0 released!
 
-agency.subscribe(subscriber1)
-agency.subscribe(subscriber2)
+    # Parallel afleveren: per subscriber blijft de volgorde behouden
+    from Behavioral.observer_dispatch import ThreadPoolDispatcher
 
-agency.publish_news("Breaking: Python 4.0 released!")
-# Output:
-# Alice received: Breaking: Python 4.0 released!
-# Bob received: Breaking: Python 4.0 released!
+    parallel = NewsAgency(dispatcher=ThreadPoolDispatcher(workers=4, queue_size=8))
+    parallel.subscribe(subscriber1)
+    parallel.subscribe(subscriber2)
+    for number in range(1, 4):
+        parallel.publish_news(f"Update {number}")
+    parallel.close()
+    print(parallel.dispatcher.get_statistics())
@@ -0,0 +1,56 @@
+import weakref
+
+
+# Geordende set van observers: O(1) toevoegen/verwijderen, optioneel zwak
+class ObserverSet:
+    """
+    Dict van id(observer) naar observer (of weakref), dus insertievolgorde blijft
+    behouden en observers hoeven niet hashable te zijn. Met weak=True verdwijnt
+    een observer vanzelf zodra niemand anders er nog naar verwijst. Objecten die
+    geen weakref toelaten worden in dat geval gewoon sterk bewaard.
+    """
+
+    def __init__(self, weak: bool = False):
+        self.weak = weak
+        self._items: dict[int, object] = {}
+
+    def _reference(self, key: int, observer):
+        if not self.weak:
+            return observer
+        try:
+            return weakref.ref(observer, lambda ref: self._forget(key, ref))
+        except TypeError:
+            return observer
+
+    def _forget(self, key: int, ref) -> None:
+        if self._items.get(key) is ref:
+            del self._items[key]
+
+    def add(self, observer) -> bool:
+        key = id(observer)
+        if key in self._items:
+            return False
+        self._items[key] = self._reference(key, observer)
+        return True
+
+    def discard(self, observer) -> bool:
+        return self._items.pop(id(observer), None) is not None
+
+    def __contains__(self, observer) -> bool:
+        return id(observer) in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        # Kopie, zodat observers zich tijdens een notify mogen (af)melden
+        items = list(self._items.values())
+        if not self.weak:
+            return iter(items)
+        return (
+            observer
+            for observer in (
+                item() if isinstance(item, weakref.ref) else item for item in items
+            )
+            if observer is not None
+        )
@@ -0,0 +1,56 @@
+import gc
+import unittest
+from unittest import TestCase
+
+from Behavioral.observer2 import Subject
+from Behavioral.observer_pattern import NewsAgency
+
+
+class Recorder:
+    def __init__(self):
+        self.states = []
+
+    def update(self, subject):
+        self.states.append(subject.state)
+
+    def receive_news(self, news):
+        self.states.append(news)
+
+
+class TestSubjectObservers(TestCase):
+    def test_attach_is_idempotent_and_ordered(self):
+        subject = Subject()
+        first, second = Recorder(), Recorder()
+        subject.attach(first)
+        subject.attach(second)
+        subject.attach(first)
+        subject.state = "A"
+        self.assertEqual(first.states, ["A"])
+        self.assertEqual(list(subject._observers), [first, second])
+
+    def test_detach_unknown_observer_raises(self):
+        with self.assertRaises(ValueError):
+            Subject().detach(Recorder())
+
+    def test_weak_observers_are_dropped(self):
+        subject = Subject(weak_observers=True)
+        kept = Recorder()
+        subject.attach(kept)
+        subject.attach(Recorder())
+        gc.collect()
+        self.assertEqual(len(subject._observers), 1)
+        subject.state = "B"
+        self.assertEqual(kept.states, ["B"])
+
+    def test_news_agency_unsubscribe(self):
+        agency = NewsAgency()
+        reader = Recorder()
+        agency.subscribe(reader)
+        agency.publish_news("een")
+        agency.unsubscribe(reader)
+        agency.publish_news("twee")
+        self.assertEqual(reader.states, ["een"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,349 @@
+import os
+import pickle
+import socket
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+# Een frame is een batch berichten: per bericht (soort, lengte) + payload
+_ENTRY = struct.Struct("<BI")
+_LENGTH = struct.Struct("<I")
+_RAW = 0  # bytes-achtig: ongewijzigd verstuurd, als memoryview ontvangen
+_PICKLE = 1
+
+_MAX_BUFFERS = 512  # sendmsg accepteert maar een beperkt aantal buffers
+
+
+def encode_batch(messages) -> tuple[list, int]:
+    """Geeft (buffers, totale lengte); bytes payloads worden niet gekopieerd"""
+    buffers = []
+    total = 0
+    for message in messages:
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            payload, kind = message, _RAW
+        else:
+            payload, kind = pickle.dumps(message, pickle.HIGHEST_PROTOCOL), _PICKLE
+        size = memoryview(payload).nbytes
+        buffers.append(_ENTRY.pack(kind, size))
+        buffers.append(payload)
+        total += _ENTRY.size + size
+    return buffers, total
+
+
+def decode_batch(frame: memoryview):
+    """
+    Levert de berichten van een frame op. Bytes payloads komen terug als
+    memoryview in de ontvangstbuffer: alleen geldig tot het volgende frame.
+    """
+    offset = 0
+    end = len(frame)
+    while offset < end:
+        kind, size = _ENTRY.unpack_from(frame, offset)
+        offset += _ENTRY.size
+        payload = frame[offset : offset + size]
+        offset += size
+        yield payload if kind == _RAW else pickle.loads(payload)
+
+
+# Transport 1: Unix-domain socket, één verbinding per ontvangend proces
+class UnixSocketSender:
+    def __init__(self, path: str, backlog: int = 16):
+        self.path = path
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen(backlog)
+        self._connections: list[socket.socket] = []
+
+    def accept(self, count: int = 1) -> None:
+        """Wacht tot `count` ontvangers verbonden zijn"""
+        for _ in range(count):
+            connection, _ = self._server.accept()
+            self._connections.append(connection)
+
+    def send(self, buffers: list, total: int) -> None:
+        buffers = [_LENGTH.pack(total), *buffers]
+        if len(buffers) > _MAX_BUFFERS:
+            buffers = [b"".join(buffers)]
+        for connection in self._connections:
+            sent = connection.sendmsg(buffers)
+            if sent < total + _LENGTH.size:
+                # Zelden: een gedeeltelijke write, de rest gaat alsnog mee
+                connection.sendall(b"".join(buffers)[sent:])
+
+    def send_end(self) -> None:
+        """Ontvangers lezen EOF; alles wat al verstuurd is komt nog aan"""
+        for connection in self._connections:
+            connection.shutdown(socket.SHUT_WR)
+
+    def close(self) -> None:
+        for connection in self._connections:
+            connection.close()
+        self._server.close()
+        os.unlink(self.path)
+
+
+class UnixSocketReceiver:
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+        self._file = self._socket.makefile("rb", buffering=buffer_size)
+        self._frame = bytearray(buffer_size)
+        self._header = bytearray(_LENGTH.size)
+
+    def receive(self) -> memoryview | None:
+        """Het volgende frame, of None als de zender gesloten is"""
+        if self._file.readinto(self._header) < _LENGTH.size:
+            return None
+        (size,) = _LENGTH.unpack(self._header)
+        if size > len(self._frame):
+            self._frame = bytearray(size)
+        view = memoryview(self._frame)[:size]
+        if self._file.readinto(view) < size:
+            return None
+        return view
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+
+# Transport 2: ringbuffer in gedeeld geheugen, één zender en één ontvanger
+class SharedMemoryRing:
+    """
+    Schrijf- en leespositie lopen alleen op en staan elk in een eigen cache
+    line. De zender schrijft eerst het frame en pas daarna de nieuwe
+    schrijfpositie; de ontvanger geeft een frame pas vrij bij de volgende
+    receive(), zodat de teruggegeven memoryview tot dan geldig blijft.
+    Posities gaan via een native "Q" view: één uitgelijnde 8-byte store, dus
+    het andere proces ziet nooit een half geschreven waarde (struct met "<Q"
+    schrijft byte voor byte).
+    """
+
+    _WRITE = 0  # Indexen in de "Q" view van de header
+    _READ = 8
+    _CAPACITY = 15
+    _DATA = 128
+    _WRAP = 0xFFFFFFFF
+    _END = 0xFFFFFFFE
+
+    def __init__(self, name: str | None = None, capacity: int = 1 << 20):
+        self.owner = name is None
+        if self.owner:
+            capacity = (capacity + 7) & ~7
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=self._DATA + capacity
+            )
+        else:
+            try:
+                self._shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:  # Python < 3.13
+                self._shm = shared_memory.SharedMemory(name=name)
+        self.name = self._shm.name
+        self._buffer = self._shm.buf
+        self._positions = self._buffer[: self._DATA].cast("Q")
+        if self.owner:
+            self.capacity = capacity
+            self._store(self._CAPACITY, capacity)
+        else:
+            # Het OS kan de grootte afronden; de aanmaker bewaart de echte
+            self.capacity = self._load(self._CAPACITY)
+        self._next_read: int | None = None
+
+    def _load(self, index: int) -> int:
+        return self._positions[index]
+
+    def _store(self, index: int, value: int) -> None:
+        self._positions[index] = value
+
+    @staticmethod
+    def _wait(spins: int) -> None:
+        time.sleep(0 if spins < 100 else 0.00005)
+
+    def send(self, buffers: list, total: int) -> None:
+        self._send(buffers, total, total)
+
+    def _send(self, buffers: list, total: int, length: int) -> None:
+        record = (_LENGTH.size + total + 7) & ~7
+        if record > self.capacity:
+            raise ValueError("Frame is groter dan de ringbuffer")
+        position = self._load(self._WRITE)
+        index = position % self.capacity
+        padding = self.capacity - index if index + record > self.capacity else 0
+        spins = 0
+        while self.capacity - (position - self._load(self._READ)) < padding + record:
+            self._wait(spins)
+            spins += 1
+        if padding:
+            _LENGTH.pack_into(self._buffer, self._DATA + index, self._WRAP)
+            position += padding
+            index = 0
+        offset = self._DATA + index
+        _LENGTH.pack_into(self._buffer, offset, length)
+        offset += _LENGTH.size
+        for buffer in buffers:
+            size = memoryview(buffer).nbytes
+            self._buffer[offset : offset + size] = buffer
+            offset += size
+        self._store(self._WRITE, position + record)
+
+    def send_end(self) -> None:
+        """Laat de ontvanger weten dat er niets meer komt"""
+        self._send([], 0, self._END)
+
+    def receive(self, timeout: float | None = None) -> memoryview | None:
+        """Het volgende frame, of None na send_end() (of bij een timeout)"""
+        if self._next_read is not None:
+            self._store(self._READ, self._next_read)  # Vorig frame vrijgeven
+        position = self._load(self._READ)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        spins = 0
+        while True:
+            while self._load(self._WRITE) == position:
+                if deadline is not None and time.monotonic() > deadline:
+                    self._next_read = None
+                    return None
+                self._wait(spins)
+                spins += 1
+            index = position % self.capacity
+            (length,) = _LENGTH.unpack_from(self._buffer, self._DATA + index)
+            if length != self._WRAP:
+                break
+            position += self.capacity - index
+            self._store(self._READ, position)
+        start = self._DATA + index + _LENGTH.size
+        if length == self._END:
+            self._store(self._READ, position + 8)
+            self._next_read = None
+            return None
+        self._next_read = position + ((_LENGTH.size + length + 7) & ~7)
+        return self._buffer[start : start + length]
+
+    def close(self) -> None:
+        self._positions.release()
+        self._buffer = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
+# Proxy observer: schrijft zich in zoals elke andere subscriber/observer
+class RemoteSubscriber:
+    """
+    Verzamelt berichten tot `batch_size` en verstuurt ze als één frame. Een
+    bericht wacht hooguit `max_latency` seconden: daarna verstuurt een timer
+    de halve batch (None: alleen bij een volle batch, flush() of close()).
+    Werkt als NewsAgency subscriber (receive_news) en als Subject observer
+    (update, stuurt subject.state door).
+    """
+
+    def __init__(self, channel, batch_size: int = 64, max_latency: float | None = 0.05):
+        self.channel = channel
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self._pending: list = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self.sent_messages = 0
+        self.sent_frames = 0
+
+    def receive_news(self, news) -> None:
+        with self._lock:
+            self._pending.append(news)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+            elif self.max_latency is not None and self._timer is None:
+                self._timer = threading.Timer(self.max_latency, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def update(self, subject) -> None:
+        self.receive_news(subject.state)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        buffers, total = encode_batch(self._pending)
+        self.channel.send(buffers, total)
+        self.sent_messages += len(self._pending)
+        self.sent_frames += 1
+        self._pending = []
+
+    def close(self) -> None:
+        """Laatste batch versturen en het einde melden; het kanaal blijft open"""
+        with self._lock:
+            self._flush()
+            self.channel.send_end()
+
+
+def relay(channel, publish) -> int:
+    """
+    Ontvangende kant: elk bericht gaat naar `publish`, bijvoorbeeld
+    agency.publish_news van een lokale NewsAgency. Geeft het aantal berichten.
+    """
+    count = 0
+    while (frame := channel.receive()) is not None:
+        for message in decode_batch(frame):
+            publish(message)
+            count += 1
+    return count
+
+
+def _demo_receiver(transport: str, address: str, name: str):
+    from Behavioral.observer_pattern import NewsAgency, NewsSubscriber
+
+    agency = NewsAgency()
+    agency.subscribe(NewsSubscriber(name))
+    if transport == "ring":
+        channel = SharedMemoryRing(address)
+    else:
+        channel = UnixSocketReceiver(address)
+    relay(channel, agency.publish_news)
+    channel.close()
+
+
+# Gebruik
+if __name__ == "__main__":
+    import multiprocessing
+    import tempfile
+
+    from Behavioral.observer_pattern import NewsAgency, NewsSubscriber
+
+    agency = NewsAgency()
+    agency.subscribe(NewsSubscriber("Alice"))
+
+    # Carol luistert in een ander proces via gedeeld geheugen
+    ring = SharedMemoryRing(capacity=1 << 16)
+    carol = multiprocessing.Process(
+        target=_demo_receiver, args=("ring", ring.name, "Carol (ringbuffer)")
+    )
+    carol.start()
+    carol_link = RemoteSubscriber(ring, batch_size=8)
+    agency.subscribe(carol_link)
+
+    # Dave via een Unix-domain socket
+    path = os.path.join(tempfile.mkdtemp(), "news.sock")
+    sender = UnixSocketSender(path)
+    dave = multiprocessing.Process(
+        target=_demo_receiver, args=("socket", path, "Dave (socket)")
+    )
+    dave.start()
+    sender.accept()
+    dave_link = RemoteSubscriber(sender, batch_size=8)
+    agency.subscribe(dave_link)
+
+    agency.publish_news("Breaking: Python 4.0 released!")
+    agency.publish_news("Weer: zonnig")
+    carol_link.close()  # Verstuurt de laatste (halve) batch
+    dave_link.close()
+    carol.join()
+    dave.join()
+    ring.close()  # Pas opruimen als de ontvanger klaar is
+    sender.close()
@@ -0,0 +1,107 @@
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+
+from Behavioral.mediator_simulation import percentile
+from Behavioral.observer_pattern import NewsAgency
+from Behavioral.observer_transport import (
+    RemoteSubscriber,
+    SharedMemoryRing,
+    UnixSocketReceiver,
+    UnixSocketSender,
+    decode_batch,
+)
+
+MESSAGES = 200_000
+PAYLOAD_SIZE = 64
+_STAMP = struct.Struct("<Q")
+
+
+def _latencies(channel) -> list[int]:
+    latencies = []
+    while (frame := channel.receive()) is not None:
+        now = time.monotonic_ns()
+        for message in decode_batch(frame):
+            if isinstance(message, memoryview):
+                sent = _STAMP.unpack_from(message)[0]  # Zonder kopie gelezen
+            else:
+                sent = message["t"]
+            latencies.append(now - sent)
+    return latencies
+
+
+def _receive(transport: str, address: str, results) -> None:
+    """Kind proces: meet de latentie van elk bericht via het tijdstempel erin"""
+    if transport == "ring":
+        channel = SharedMemoryRing(address)
+    else:
+        channel = UnixSocketReceiver(address)
+    latencies = _latencies(channel)
+    finished = time.monotonic_ns()
+    channel.close()
+    latencies.sort()
+    results.put(
+        (
+            len(latencies),
+            finished,
+            percentile(latencies, 0.50) / 1000,
+            percentile(latencies, 0.99) / 1000,
+        )
+    )
+
+
+def run(transport: str, batch_size: int, pickled: bool) -> tuple:
+    results = multiprocessing.Queue()
+    if transport == "ring":
+        channel = SharedMemoryRing(capacity=1 << 20)
+        address = channel.name
+    else:
+        address = os.path.join(tempfile.mkdtemp(), "bench.sock")
+        channel = UnixSocketSender(address)
+    receiver = multiprocessing.Process(
+        target=_receive, args=(transport, address, results)
+    )
+    receiver.start()
+    if transport == "socket":
+        channel.accept()
+
+    # De publisher ziet alleen een gewone subscriber
+    agency = NewsAgency()
+    link = RemoteSubscriber(channel, batch_size=batch_size)
+    agency.subscribe(link)
+    padding = bytes(PAYLOAD_SIZE - _STAMP.size)
+
+    start = time.monotonic_ns()
+    for _ in range(MESSAGES):
+        if pickled:
+            agency.publish_news({"t": time.monotonic_ns(), "text": "nieuws"})
+        else:
+            agency.publish_news(_STAMP.pack(time.monotonic_ns()) + padding)
+    link.close()
+    count, finished, p50, p99 = results.get()
+    receiver.join()
+    channel.close()
+    assert count == MESSAGES
+    return count / ((finished - start) / 1e9), p50, p99
+
+
+def main():
+    print(
+        f"{'transport':<9} | {'batch':>5} | {'payload':<7} | {'berichten/s':>12} | "
+        f"{'p50 (µs)':>9} | {'p99 (µs)':>9}"
+    )
+    print("-" * 68)
+    for transport in ("socket", "ring"):
+        for batch_size, pickled in ((1, False), (64, False), (64, True)):
+            rate, p50, p99 = run(transport, batch_size, pickled)
+            payload = "pickle" if pickled else "bytes"
+            print(
+                f"{transport:<9} | {batch_size:>5} | {payload:<7} | {rate:>12,.0f} | "
+                f"{p50:>9,.1f} | {p99:>9,.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import TestCase
+
+from Behavioral.observer2 import Subject
+from Behavioral.observer_pattern import NewsAgency
+from Behavioral.observer_transport import (
+    RemoteSubscriber,
+    SharedMemoryRing,
+    UnixSocketReceiver,
+    UnixSocketSender,
+    decode_batch,
+    encode_batch,
+    relay,
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.received = []
+
+    def receive_news(self, news):
+        # Bytes komen binnen als memoryview in de ontvangstbuffer: kopiëren
+        self.received.append(bytes(news) if isinstance(news, memoryview) else news)
+
+
+class TestTransport(TestCase):
+    def relay_in_thread(self, channel):
+        agency = NewsAgency()
+        recorder = Recorder()
+        agency.subscribe(recorder)
+        thread = threading.Thread(target=relay, args=(channel, agency.publish_news))
+        thread.start()
+        return thread, recorder
+
+    def test_batch_round_trip_keeps_bytes_unpickled(self):
+        payload = bytearray(b"ruwe bytes")
+        buffers, total = encode_batch([payload, {"a": 1}, "tekst"])
+        self.assertIs(buffers[1], payload)  # Niet gekopieerd
+        frame = memoryview(b"".join(buffers))
+        self.assertEqual(total, len(frame))
+        messages = list(decode_batch(frame))
+        self.assertIsInstance(messages[0], memoryview)
+        self.assertEqual(bytes(messages[0]), b"ruwe bytes")
+        self.assertEqual(messages[1:], [{"a": 1}, "tekst"])
+
+    def test_ring_delivers_in_order_across_wraparound(self):
+        ring = SharedMemoryRing(capacity=256)
+        receiver = SharedMemoryRing(ring.name)
+        thread, recorder = self.relay_in_thread(receiver)
+
+        agency = NewsAgency()
+        link = RemoteSubscriber(ring, batch_size=3, max_latency=None)
+        agency.subscribe(link)
+        expected = [f"bericht {i}".encode() * (i % 4 + 1) for i in range(500)]
+        for news in expected:
+            agency.publish_news(news)
+        link.close()
+        thread.join()
+        receiver.close()
+        ring.close()
+        self.assertEqual(recorder.received, expected)
+        self.assertEqual(link.sent_frames, 167)
+
+    def test_socket_forwards_subject_state(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "test.sock")
+        sender = UnixSocketSender(path)
+        receiver = UnixSocketReceiver(path)
+        sender.accept()
+        thread, recorder = self.relay_in_thread(receiver)
+
+        subject = Subject()
+        link = RemoteSubscriber(sender, batch_size=2)
+        subject.attach(link)
+        for state in range(5):
+            subject.state = state
+        link.close()
+        thread.join()
+        receiver.close()
+        sender.close()
+        self.assertEqual(recorder.received, [0, 1, 2, 3, 4])
+
+    def test_half_batch_is_sent_after_max_latency(self):
+        ring = SharedMemoryRing(capacity=1 << 12)
+        receiver = SharedMemoryRing(ring.name)
+        thread, recorder = self.relay_in_thread(receiver)
+
+        link = RemoteSubscriber(ring, batch_size=100, max_latency=0.05)
+        for news in ("a", "b", "c"):
+            link.receive_news(news)
+        deadline = time.monotonic() + 2
+        while len(recorder.received) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(recorder.received, ["a", "b", "c"])  # Zonder close()
+        self.assertEqual(link.sent_frames, 1)
+        link.close()
+        thread.join()
+        receiver.close()
+        ring.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
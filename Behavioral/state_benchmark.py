@@ -0,0 +1,71 @@
+import time
+
+from Behavioral.state_compiled import CompiledVendingMachine
+from Behavioral.state_fixtures import make_events
+from Behavioral.state_pattern import VendingMachine
+
+EVENTS = 1_000_000
+# Genoeg voorraad zodat de mix niet na een paar aankopen omslaat naar uitverkocht
+INVENTORY = {
+    "Cola": {"price": 250, "stock": EVENTS},
+    "Water": {"price": 150, "stock": EVENTS},
+    "Sap": {"price": 200, "stock": 0},
+}
+
+
+# Zoals vóór de gedeelde state-instanties: elke overgang maakt een nieuw object
+class FreshStateMachine(VendingMachine):
+    def set_state(self, state) -> None:
+        super().set_state(type(state)())
+
+
+def call_methods(machine, events) -> None:
+    """Zoals een klant de automaat bedient: één methode-aanroep per gebeurtenis"""
+    handlers = (
+        machine.insert_money,
+        machine.select_product,
+        lambda argument: machine.dispense(),
+        lambda argument: machine.cancel(),
+    )
+    for event, argument in events:
+        handlers[event](argument)
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    events = make_events(EVENTS)
+    fresh = FreshStateMachine(INVENTORY, verbose=False)
+    objects = VendingMachine(INVENTORY, verbose=False)
+    compiled = CompiledVendingMachine(INVENTORY)
+    batch = CompiledVendingMachine(INVENTORY)
+
+    # Alles zonder prints (verbose=False); het origineel printte altijd
+    results = {
+        "nieuw object/overgang": timed(call_methods, fresh, events),
+        "gedeelde states": timed(call_methods, objects, events),
+        "tabel, per methode": timed(call_methods, compiled, events),
+        "tabel, run()": timed(batch.run, events),
+    }
+    machines = (fresh, objects, compiled, batch)
+    assert all(machine.inventory == objects.inventory for machine in machines)
+    assert all(machine.balance == objects.balance for machine in machines)
+
+    baseline = results["nieuw object/overgang"]
+    print(f"{EVENTS:,} gebeurtenissen, versnelling t.o.v. een nieuw state-object")
+    print("per overgang zoals in het oorspronkelijke state_pattern.py")
+    print(f"{'variant':<22} | {'tijd (s)':>8} | {'events/s':>11} | {'versnelling':>11}")
+    print("-" * 62)
+    for name, elapsed in results.items():
+        print(
+            f"{name:<22} | {elapsed:>8.3f} | {EVENTS / elapsed:>11,.0f} | "
+            f"{baseline / elapsed:>10.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
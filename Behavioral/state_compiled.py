@@ -0,0 +1,188 @@
+from enum import IntEnum
+from typing import Iterable
+
+from Behavioral.state_pattern import (
+    HAS_MONEY,
+    NO_MONEY,
+    OUT_OF_STOCK,
+    PRODUCT_SELECTED,
+    VendingMachine,
+)
+
+
+class State(IntEnum):
+    NO_MONEY = 0
+    HAS_MONEY = 1
+    PRODUCT_SELECTED = 2
+    OUT_OF_STOCK = 3
+
+
+class Event(IntEnum):
+    INSERT_MONEY = 0
+    SELECT_PRODUCT = 1
+    DISPENSE = 2
+    CANCEL = 3
+
+
+# Van de state objecten naar hun code, bv. om beide modellen te vergelijken
+STATE_CODES = {
+    NO_MONEY: State.NO_MONEY,
+    HAS_MONEY: State.HAS_MONEY,
+    PRODUCT_SELECTED: State.PRODUCT_SELECTED,
+    OUT_OF_STOCK: State.OUT_OF_STOCK,
+}
+STATE_OBJECTS = {code: state for state, code in STATE_CODES.items()}
+
+
+# Gewone ints in de tabel: indexeren met een IntEnum is merkbaar trager
+_NO_MONEY, _HAS_MONEY, _PRODUCT_SELECTED, _OUT_OF_STOCK = map(int, State)
+_INSERT_MONEY, _SELECT_PRODUCT, _DISPENSE, _CANCEL = map(int, Event)
+
+
+# Handlers: (machine, argument) -> nieuwe state; zelfde regels als de state
+# klassen in state_pattern.py, maar zonder meldingen
+def _stay(state: int):
+    def handler(machine, argument) -> int:
+        return state
+
+    return handler
+
+
+def _add_money(next_state: int):
+    def handler(machine, amount) -> int:
+        machine.balance += amount
+        return next_state
+
+    return handler
+
+
+def _return_money(machine, argument) -> int:
+    machine.balance = 0
+    return _NO_MONEY
+
+
+def _select_with_money(machine, product) -> int:
+    info = machine.inventory.get(product)
+    if info is None:
+        return _HAS_MONEY
+    if info["stock"] == 0:
+        return _OUT_OF_STOCK
+    if machine.balance < info["price"]:
+        return _HAS_MONEY
+    machine.selected_product = product
+    return _PRODUCT_SELECTED
+
+
+def _select_out_of_stock(machine, product) -> int:
+    info = machine.inventory.get(product)
+    if info is None or info["stock"] == 0:
+        return _OUT_OF_STOCK
+    if machine.balance < info["price"]:
+        return _HAS_MONEY
+    machine.selected_product = product
+    return _PRODUCT_SELECTED
+
+
+def _dispense(machine, argument) -> int:
+    if not machine.take_product(machine.selected_product):
+        machine.selected_product = None  # Intussen uitverkocht, saldo blijft
+        return _OUT_OF_STOCK
+    machine.balance = 0  # Het wisselgeld gaat terug naar de klant
+    machine.selected_product = None
+    return _NO_MONEY
+
+
+def _deselect(machine, argument) -> int:
+    machine.selected_product = None
+    return _HAS_MONEY
+
+
+# (state, event) -> handler, rij per state in de volgorde van Event
+TRANSITIONS: tuple[tuple, ...] = (
+    (  # NO_MONEY
+        _add_money(_HAS_MONEY),
+        _stay(_NO_MONEY),
+        _stay(_NO_MONEY),
+        _stay(_NO_MONEY),
+    ),
+    (  # HAS_MONEY
+        _add_money(_HAS_MONEY),
+        _select_with_money,
+        _stay(_HAS_MONEY),
+        _return_money,
+    ),
+    (  # PRODUCT_SELECTED
+        _add_money(_PRODUCT_SELECTED),
+        _stay(_PRODUCT_SELECTED),
+        _dispense,
+        _deselect,
+    ),
+    (  # OUT_OF_STOCK
+        _add_money(_OUT_OF_STOCK),
+        _select_out_of_stock,
+        _stay(_OUT_OF_STOCK),
+        _return_money,
+    ),
+)
+
+
+# Context met een state code en een vaste transitietabel i.p.v. state objecten
+class CompiledVendingMachine(VendingMachine):
+    """
+    Zelfde gedrag als VendingMachine, zonder meldingen. Elke gebeurtenis is
+    één opzoeking in TRANSITIONS; run() verwerkt een hele reeks (event,
+    argument) paren in één lus zonder methode-aanroepen per gebeurtenis.
+    """
+
+    def __init__(self, inventory: dict | None = None):
+        self._code = _NO_MONEY
+        super().__init__(inventory, verbose=False)
+
+    @property
+    def state(self) -> State:
+        return State(self._code)
+
+    # Zo blijven set_state() en code die _state leest gewoon werken
+    @property
+    def _state(self):
+        return STATE_OBJECTS[self._code]
+
+    @_state.setter
+    def _state(self, state) -> None:
+        self._code = int(STATE_CODES[state])
+
+    def insert_money(self, amount: int) -> None:
+        self._code = TRANSITIONS[self._code][_INSERT_MONEY](self, amount)
+
+    def select_product(self, product: str) -> None:
+        self._code = TRANSITIONS[self._code][_SELECT_PRODUCT](self, product)
+
+    def dispense(self) -> None:
+        self._code = TRANSITIONS[self._code][_DISPENSE](self, None)
+
+    def cancel(self) -> None:
+        self._code = TRANSITIONS[self._code][_CANCEL](self, None)
+
+    def run(self, events: Iterable[tuple[int, object]]) -> None:
+        """Events mogen Event leden zijn; gewone ints zijn het snelst"""
+        table = TRANSITIONS
+        state = self._code
+        for event, argument in events:
+            state = table[state][event](self, argument)
+        self._code = state
+
+
+# Gebruik
+if __name__ == "__main__":
+    machine = CompiledVendingMachine()
+    machine.run(
+        [
+            (Event.INSERT_MONEY, 300),
+            (Event.SELECT_PRODUCT, "Cola"),
+            (Event.DISPENSE, None),
+            (Event.INSERT_MONEY, 300),
+            (Event.SELECT_PRODUCT, "Sap"),
+        ]
+    )
+    print(f"State: {machine.state.name}, saldo: {machine.balance} cent")
+    print(f"Cola over: {machine.inventory['Cola']['stock']}")
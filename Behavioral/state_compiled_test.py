@@ -0,0 +1,52 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.state_compiled import (
+    STATE_CODES,
+    CompiledVendingMachine,
+    Event,
+    State,
+)
+from Behavioral.state_fixtures import make_events
+from Behavioral.state_pattern import HAS_MONEY, VendingMachine
+
+
+class TestCompiledVendingMachine(TestCase):
+    def test_matches_state_objects_event_by_event(self):
+        reference = VendingMachine(verbose=False)
+        compiled = CompiledVendingMachine()
+        for event, argument in make_events(5_000, seed=7):
+            if event == Event.INSERT_MONEY:
+                reference.insert_money(argument)
+            elif event == Event.SELECT_PRODUCT:
+                reference.select_product(argument)
+            elif event == Event.DISPENSE:
+                reference.dispense()
+            else:
+                reference.cancel()
+            compiled.run([(event, argument)])
+            self.assertEqual(compiled.state, STATE_CODES[reference._state])
+            self.assertEqual(compiled.balance, reference.balance)
+            self.assertEqual(compiled.selected_product, reference.selected_product)
+        self.assertEqual(compiled.inventory, reference.inventory)
+
+    def test_methods_and_set_state_use_the_same_table(self):
+        machine = CompiledVendingMachine()
+        machine.insert_money(100)
+        machine.select_product("Water")
+        self.assertIs(machine.state, State.HAS_MONEY)  # Nog 50 cent tekort
+        machine.insert_money(100)
+        machine.select_product("Water")
+        machine.dispense()
+        self.assertEqual(machine.inventory["Water"]["stock"], 2)
+        self.assertIs(machine.state, State.NO_MONEY)
+
+        machine.balance = 500
+        machine.set_state(HAS_MONEY)
+        self.assertIs(machine._state, HAS_MONEY)
+        machine.cancel()
+        self.assertEqual(machine.balance, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import random
+from typing import Sequence
+
+from Behavioral.state_compiled import Event
+
+
+# Willekeurige gebeurtenissen voor de tests en benchmarks van de automaat
+def make_events(
+    count: int,
+    seed: int = 1,
+    products: Sequence[str] = ("Cola", "Water", "Sap", "Koffie"),
+) -> list[tuple[int, object]]:
+    """
+    Willekeurige reeks (event, argument) paren voor run(); Koffie staat niet
+    in DEFAULT_INVENTORY (onbekend product).
+    """
+    rng = random.Random(seed)
+    events = []
+    for _ in range(count):
+        kind = rng.choices(range(len(Event)), weights=(4, 3, 2, 1))[0]
+        if kind == Event.INSERT_MONEY:
+            argument = rng.choice((50, 100, 200))
+        elif kind == Event.SELECT_PRODUCT:
+            argument = rng.choice(products)
+        else:
+            argument = None
+        events.append((kind, argument))
+    return events
@@ -0,0 +1,135 @@
+import numpy as np
+
+from Behavioral.state_compiled import Event, State
+from Behavioral.state_pattern import DEFAULT_INVENTORY
+
+NO_EVENT = -1  # Deze machine krijgt in deze stap niets
+NO_PRODUCT = -1  # Niet geselecteerd, of een product dat niet bestaat
+
+_NO_MONEY = int(State.NO_MONEY)
+_HAS_MONEY = int(State.HAS_MONEY)
+_PRODUCT_SELECTED = int(State.PRODUCT_SELECTED)
+_OUT_OF_STOCK = int(State.OUT_OF_STOCK)
+
+
+# Duizenden automaten als kolommen: één rij per machine, geen object per machine
+class VendingFleet:
+    """
+    Zelfde regels als VendingMachine, maar balance, state en selectie zijn
+    arrays van lengte `size` en de voorraad is een (size, producten) matrix.
+    step() past per machine hooguit één gebeurtenis toe, voor alle machines
+    tegelijk; producten worden aangeduid met hun index in `products`.
+    """
+
+    def __init__(self, size: int, inventory: dict | None = None):
+        if inventory is None:
+            inventory = DEFAULT_INVENTORY
+        self.size = size
+        self.products = list(inventory)
+        self.prices = np.array([info["price"] for info in inventory.values()])
+        initial_stock = np.array([info["stock"] for info in inventory.values()])
+        self.stock = np.tile(initial_stock, (size, 1))
+        self.balance = np.zeros(size, dtype=np.int64)
+        self.state = np.full(size, _NO_MONEY, dtype=np.int8)
+        self.selected = np.full(size, NO_PRODUCT, dtype=np.int64)
+
+    def product_index(self, product: str) -> int:
+        """Index van een product, of NO_PRODUCT als het niet bestaat"""
+        try:
+            return self.products.index(product)
+        except ValueError:
+            return NO_PRODUCT
+
+    def step(self, events: np.ndarray, arguments: np.ndarray) -> None:
+        """
+        events[i] is een Event code (of NO_EVENT) voor machine i; arguments[i]
+        is het bedrag bij INSERT_MONEY en de productindex bij SELECT_PRODUCT.
+        """
+        state = self.state
+        # Alle maskers op de state van vóór deze stap
+        insert = np.flatnonzero(events == Event.INSERT_MONEY)
+        select = np.flatnonzero(
+            (events == Event.SELECT_PRODUCT)
+            & ((state == _HAS_MONEY) | (state == _OUT_OF_STOCK))
+        )
+        dispense = np.flatnonzero(
+            (events == Event.DISPENSE) & (state == _PRODUCT_SELECTED)
+        )
+        cancel = np.flatnonzero(events == Event.CANCEL)
+
+        self.balance[insert] += arguments[insert]
+        state[insert[state[insert] == _NO_MONEY]] = _HAS_MONEY
+
+        self._select(select, arguments[select])
+
+        # Intussen uitverkocht (voorraad van buitenaf gewijzigd): saldo blijft
+        available = self.stock[dispense, self.selected[dispense]] > 0
+        sold_out = dispense[~available]
+        dispense = dispense[available]
+        self.selected[sold_out] = NO_PRODUCT
+        state[sold_out] = _OUT_OF_STOCK
+
+        self.stock[dispense, self.selected[dispense]] -= 1
+        self.balance[dispense] = 0  # Wisselgeld terug
+        self.selected[dispense] = NO_PRODUCT
+        state[dispense] = _NO_MONEY
+
+        cancel_state = state[cancel]
+        deselect = cancel[cancel_state == _PRODUCT_SELECTED]
+        refund = cancel[(cancel_state == _HAS_MONEY) | (cancel_state == _OUT_OF_STOCK)]
+        self.selected[deselect] = NO_PRODUCT
+        state[deselect] = _HAS_MONEY
+        self.balance[refund] = 0
+        state[refund] = _NO_MONEY
+
+    def _select(self, rows: np.ndarray, products: np.ndarray) -> None:
+        state = self.state
+        known = products >= 0
+        column = np.where(known, products, 0)
+        in_stock = known & (self.stock[rows, column] > 0)
+        affordable = self.balance[rows] >= self.prices[column]
+        was_out_of_stock = state[rows] == _OUT_OF_STOCK
+
+        chosen = in_stock & affordable
+        self.selected[rows[chosen]] = products[chosen]
+        # Te weinig saldo -> HAS_MONEY; uitverkocht -> OUT_OF_STOCK; een
+        # onbekend product laat de state ongemoeid
+        not_available = np.where(known | was_out_of_stock, _OUT_OF_STOCK, _HAS_MONEY)
+        state[rows] = np.where(
+            chosen, _PRODUCT_SELECTED, np.where(in_stock, _HAS_MONEY, not_available)
+        )
+
+    def run(self, events: np.ndarray, arguments: np.ndarray) -> None:
+        """events en arguments zijn (stappen, size) matrices"""
+        for step_events, step_arguments in zip(events, arguments):
+            self.step(step_events, step_arguments)
+
+
+# Gebruik
+if __name__ == "__main__":
+    import time
+
+    fleet = VendingFleet(3)
+    cola, sap = fleet.product_index("Cola"), fleet.product_index("Sap")
+    insert, select = Event.INSERT_MONEY, Event.SELECT_PRODUCT
+    fleet.step(np.array([insert, insert, NO_EVENT]), np.array([300, 100, 0]))
+    fleet.step(np.array([select, select, select]), np.array([cola, sap, cola]))
+    fleet.step(np.array([Event.DISPENSE] * 3), np.zeros(3, dtype=np.int64))
+    for machine in range(fleet.size):
+        print(
+            f"Machine {machine}: {State(fleet.state[machine]).name}, "
+            f"saldo {fleet.balance[machine]}, Cola {fleet.stock[machine, cola]}"
+        )
+
+    size, steps = 100_000, 100
+    rng = np.random.default_rng(1)
+    events = rng.integers(NO_EVENT, len(Event), size=(steps, size))
+    amounts = rng.choice([50, 100, 200], size=(steps, size))
+    products = rng.integers(NO_PRODUCT, len(fleet.products), size=(steps, size))
+    arguments = np.where(events == Event.SELECT_PRODUCT, products, amounts)
+    fleet = VendingFleet(size)
+    start = time.perf_counter()
+    fleet.run(events, arguments)
+    elapsed = time.perf_counter() - start
+    print(f"\n{size * steps:,} gebeurtenissen in {elapsed:.2f} s")
+    print(f"{size * steps / elapsed:,.0f} gebeurtenissen/s")
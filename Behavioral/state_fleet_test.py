@@ -0,0 +1,89 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from Behavioral.state_compiled import STATE_CODES, CompiledVendingMachine, Event, State
+from Behavioral.state_fleet import NO_EVENT, NO_PRODUCT, VendingFleet
+from Behavioral.state_pattern import VendingMachine
+
+INVENTORY = {
+    "Cola": {"price": 250, "stock": 5},
+    "Water": {"price": 150, "stock": 3},
+    "Sap": {"price": 200, "stock": 0},
+    "Thee": {"price": 100, "stock": 1},
+}
+
+
+class TestVendingFleet(TestCase):
+    def test_matches_vending_machine_objects(self):
+        size, steps = 40, 300
+        rng = np.random.default_rng(3)
+        events = rng.integers(NO_EVENT, len(Event), size=(steps, size))
+        amounts = rng.choice([50, 100, 200], size=(steps, size))
+        products = rng.integers(NO_PRODUCT, len(INVENTORY), size=(steps, size))
+        arguments = np.where(events == Event.SELECT_PRODUCT, products, amounts)
+
+        fleet = VendingFleet(size, INVENTORY)
+        fleet.run(events, arguments)
+
+        names = list(INVENTORY)
+        for machine_index in range(size):
+            machine = VendingMachine(INVENTORY, verbose=False)
+            for event, argument in zip(
+                events[:, machine_index], arguments[:, machine_index]
+            ):
+                if event == Event.INSERT_MONEY:
+                    machine.insert_money(int(argument))
+                elif event == Event.SELECT_PRODUCT:
+                    product = names[argument] if argument >= 0 else "Koffie"
+                    machine.select_product(product)
+                elif event == Event.DISPENSE:
+                    machine.dispense()
+                elif event == Event.CANCEL:
+                    machine.cancel()
+
+            self.assertEqual(fleet.state[machine_index], STATE_CODES[machine._state])
+            self.assertEqual(fleet.balance[machine_index], machine.balance)
+            expected = NO_PRODUCT
+            if machine.selected_product is not None:
+                expected = names.index(machine.selected_product)
+            self.assertEqual(fleet.selected[machine_index], expected)
+            self.assertEqual(
+                fleet.stock[machine_index].tolist(),
+                [machine.inventory[name]["stock"] for name in names],
+            )
+        # De willekeurige reeks moet alle states en een uitverkocht product raken
+        self.assertGreater(len(np.unique(fleet.state)), 2)
+        self.assertTrue((fleet.stock[:, names.index("Thee")] == 0).any())
+
+    def test_all_models_agree_when_product_sells_out_before_dispense(self):
+        # Een andere automaat met dezelfde voorraad verkoopt het laatste stuk
+        machine = VendingMachine(INVENTORY, verbose=False)
+        compiled = CompiledVendingMachine(INVENTORY)
+        fleet = VendingFleet(1, INVENTORY)
+        thee = list(INVENTORY).index("Thee")
+        for model in (machine, compiled):
+            model.insert_money(200)
+            model.select_product("Thee")
+            model.inventory["Thee"]["stock"] = 0
+            model.dispense()
+        fleet.step(np.array([Event.INSERT_MONEY]), np.array([200]))
+        fleet.step(np.array([Event.SELECT_PRODUCT]), np.array([thee]))
+        fleet.stock[0, thee] = 0
+        fleet.step(np.array([Event.DISPENSE]), np.array([0]))
+
+        self.assertEqual(STATE_CODES[machine._state], State.OUT_OF_STOCK)
+        self.assertEqual(compiled.state, State.OUT_OF_STOCK)
+        self.assertEqual(fleet.state[0], State.OUT_OF_STOCK)
+        for balance in (machine.balance, compiled.balance, fleet.balance[0]):
+            self.assertEqual(balance, 200)  # Niet afgeschreven
+        self.assertIsNone(machine.selected_product)
+        self.assertIsNone(compiled.selected_product)
+        self.assertEqual(fleet.selected[0], NO_PRODUCT)
+        self.assertEqual(compiled.inventory["Thee"]["stock"], 0)
+        self.assertEqual(fleet.stock[0, thee], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
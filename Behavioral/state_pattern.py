@@ -12,20 +12,31 @@ class VendingMachineState(Protocol):
     def cancel(self, machine: "VendingMachine") -> None: ...
 
 
+DEFAULT_INVENTORY = {
+    "Cola": {"price": 250, "stock": 5},
+    "Water": {"price": 150, "stock": 3},
+    "Sap": {"price": 200, "stock": 0},  # Uitverkocht
+}
+
+
 # Context - de Frisdrankenautomaat
 class VendingMachine:
-    def __init__(self):
+    def __init__(self, inventory: dict | None = None, verbose: bool = True):
         self.balance = 0
         self.selected_product = None
-        self.inventory = {
-            "Cola": {"price": 250, "stock": 5},
-            "Water": {"price": 150, "stock": 3},
-            "Sap": {"price": 200, "stock": 0},  # Uitverkocht
-        }
+        if inventory is None:
+            inventory = DEFAULT_INVENTORY
+        self.inventory = {product: dict(info) for product, info in inventory.items()}
+        self.verbose = verbose
         # Start in NoMoney state
-        self._state: VendingMachineState = NoMoneyState()
-        print("🤖 Frisdrankenautomaat gestart")
-        self._show_inventory()
+        self._state: VendingMachineState = NO_MONEY
+        self._log("🤖 Frisdrankenautomaat gestart")
+        if verbose:
+            self._show_inventory()
+
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
 
     def set_state(self, state: VendingMachineState) -> None:
         """Wijzig de huidige state"""
@@ -33,28 +44,36 @@ class VendingMachine:
 
     def insert_money(self, amount: int) -> None:
         """Geld invoeren"""
-        print(f"\n💰 {amount} cent ingevoerd")
+        self._log(f"\n💰 {amount} cent ingevoerd")
         self._state.insert_money(self, amount)
 
     def select_product(self, product: str) -> None:
         """Product selecteren"""
-        print(f"\n🥤 Product geselecteerd: {product}")
+        self._log(f"\n🥤 Product geselecteerd: {product}")
         self._state.select_product(self, product)
 
     def dispense(self) -> None:
         """Product uitgeven"""
-        print(f"\n📦 Dispense knop ingedrukt")
+        self._log(f"\n📦 Dispense knop ingedrukt")
         self._state.dispense(self)
 
     def cancel(self) -> None:
         """Transactie annuleren"""
-        print(f"\n❌ Cancel knop ingedrukt")
+        self._log(f"\n❌ Cancel knop ingedrukt")
         self._state.cancel(self)
 
+    def take_product(self, product: str) -> bool:
+        """Haal één stuk uit de voorraad; False als er niets meer is"""
+        info = self.inventory[product]
+        if info["stock"] == 0:
+            return False
+        info["stock"] -= 1
+        return True
+
     def return_money(self) -> None:
         """Geef geld terug"""
         if self.balance > 0:
-            print(f"💵 {self.balance} cent teruggestort")
+            self._log(f"💵 {self.balance} cent teruggestort")
             self.balance = 0
 
     def _show_inventory(self) -> None:
@@ -69,127 +88,139 @@ class VendingMachine:
 class NoMoneyState:
     def insert_money(self, machine: VendingMachine, amount: int) -> None:
         machine.balance += amount
-        print(f"✓ Saldo: {machine.balance} cent")
-        machine.set_state(HasMoneyState())
+        machine._log(f"✓ Saldo: {machine.balance} cent")
+        machine.set_state(HAS_MONEY)
 
     def select_product(self, machine: VendingMachine, product: str) -> None:
-        print("✗ Voer eerst geld in!")
+        machine._log("✗ Voer eerst geld in!")
 
     def dispense(self, machine: VendingMachine) -> None:
-        print("✗ Voer eerst geld in!")
+        machine._log("✗ Voer eerst geld in!")
 
     def cancel(self, machine: VendingMachine) -> None:
-        print("✗ Geen actieve transactie om te annuleren")
+        machine._log("✗ Geen actieve transactie om te annuleren")
 
 
 # Concrete State 2: Geld ingevoerd
 class HasMoneyState:
     def insert_money(self, machine: VendingMachine, amount: int) -> None:
         machine.balance += amount
-        print(f"✓ Saldo verhoogd naar: {machine.balance} cent")
+        machine._log(f"✓ Saldo verhoogd naar: {machine.balance} cent")
 
     def select_product(self, machine: VendingMachine, product: str) -> None:
         if product not in machine.inventory:
-            print(f"✗ Product '{product}' bestaat niet")
+            machine._log(f"✗ Product '{product}' bestaat niet")
             return
 
         product_info = machine.inventory[product]
 
         if product_info["stock"] == 0:
-            print(f"✗ {product} is uitverkocht")
-            machine.set_state(OutOfStockState())
+            machine._log(f"✗ {product} is uitverkocht")
+            machine.set_state(OUT_OF_STOCK)
             return
 
         if machine.balance < product_info["price"]:
             shortage = product_info["price"] - machine.balance
-            print(f"✗ Onvoldoende saldo. Nog {shortage} cent nodig")
+            machine._log(f"✗ Onvoldoende saldo. Nog {shortage} cent nodig")
             return
 
         machine.selected_product = product
-        print(f"✓ {product} geselecteerd (prijs: {product_info['price']} cent)")
-        machine.set_state(ProductSelectedState())
+        machine._log(f"✓ {product} geselecteerd (prijs: {product_info['price']} cent)")
+        machine.set_state(PRODUCT_SELECTED)
 
     def dispense(self, machine: VendingMachine) -> None:
-        print("✗ Selecteer eerst een product")
+        machine._log("✗ Selecteer eerst een product")
 
     def cancel(self, machine: VendingMachine) -> None:
-        print("✓ Transactie geannuleerd")
+        machine._log("✓ Transactie geannuleerd")
         machine.return_money()
-        machine.set_state(NoMoneyState())
+        machine.set_state(NO_MONEY)
 
 
 # Concrete State 3: Product geselecteerd
 class ProductSelectedState:
     def insert_money(self, machine: VendingMachine, amount: int) -> None:
         machine.balance += amount
-        print(f"✓ Extra geld toegevoegd. Nieuw saldo: {machine.balance} cent")
+        machine._log(f"✓ Extra geld toegevoegd. Nieuw saldo: {machine.balance} cent")
 
     def select_product(self, machine: VendingMachine, product: str) -> None:
-        print(f"✗ Product al geselecteerd: {machine.selected_product}")
-        print("   Druk op dispense of cancel")
+        machine._log(f"✗ Product al geselecteerd: {machine.selected_product}")
+        machine._log("   Druk op dispense of cancel")
 
     def dispense(self, machine: VendingMachine) -> None:
         product = machine.selected_product
         product_info = machine.inventory[product]
 
-        print(f"🎁 {product} wordt uitgegeven...")
+        # Verminder voorraad; kan mislukken als een andere automaat met dezelfde
+        # voorraad het laatste stuk net verkocht heeft
+        if not machine.take_product(product):
+            machine._log(f"✗ {product} is net uitverkocht")
+            machine.selected_product = None
+            machine.set_state(OUT_OF_STOCK)
+            return
 
-        # Verminder voorraad
-        machine.inventory[product]["stock"] -= 1
+        machine._log(f"🎁 {product} wordt uitgegeven...")
 
         # Bereken wisselgeld
         change = machine.balance - product_info["price"]
         machine.balance = 0
 
         if change > 0:
-            print(f"💵 Wisselgeld: {change} cent")
+            machine._log(f"💵 Wisselgeld: {change} cent")
 
-        print(f"✓ Geniet van je {product}!")
+        machine._log(f"✓ Geniet van je {product}!")
 
         machine.selected_product = None
-        machine.set_state(NoMoneyState())
+        machine.set_state(NO_MONEY)
 
     def cancel(self, machine: VendingMachine) -> None:
-        print(f"✓ Selectie geannuleerd: {machine.selected_product}")
+        machine._log(f"✓ Selectie geannuleerd: {machine.selected_product}")
         machine.selected_product = None
-        machine.set_state(HasMoneyState())
+        machine.set_state(HAS_MONEY)
 
 
 # Concrete State 4: Uitverkocht
 class OutOfStockState:
     def insert_money(self, machine: VendingMachine, amount: int) -> None:
         machine.balance += amount
-        print(f"✓ Geld toegevoegd, maar geselecteerd product is uitverkocht")
-        print("   Selecteer een ander product of annuleer")
+        machine._log(f"✓ Geld toegevoegd, maar geselecteerd product is uitverkocht")
+        machine._log("   Selecteer een ander product of annuleer")
 
     def select_product(self, machine: VendingMachine, product: str) -> None:
         if product not in machine.inventory:
-            print(f"✗ Product '{product}' bestaat niet")
+            machine._log(f"✗ Product '{product}' bestaat niet")
             return
 
         product_info = machine.inventory[product]
 
         if product_info["stock"] == 0:
-            print(f"✗ {product} is ook uitverkocht")
+            machine._log(f"✗ {product} is ook uitverkocht")
             return
 
         if machine.balance < product_info["price"]:
             shortage = product_info["price"] - machine.balance
-            print(f"✗ Onvoldoende saldo. Nog {shortage} cent nodig")
-            machine.set_state(HasMoneyState())
+            machine._log(f"✗ Onvoldoende saldo. Nog {shortage} cent nodig")
+            machine.set_state(HAS_MONEY)
             return
 
         machine.selected_product = product
-        print(f"✓ {product} geselecteerd")
-        machine.set_state(ProductSelectedState())
+        machine._log(f"✓ {product} geselecteerd")
+        machine.set_state(PRODUCT_SELECTED)
 
     def dispense(self, machine: VendingMachine) -> None:
-        print("✗ Geselecteerd product is uitverkocht")
+        machine._log("✗ Geselecteerd product is uitverkocht")
 
     def cancel(self, machine: VendingMachine) -> None:
-        print("✓ Transactie geannuleerd")
+        machine._log("✓ Transactie geannuleerd")
         machine.return_money()
-        machine.set_state(NoMoneyState())
+        machine.set_state(NO_MONEY)
+
+
+# States bewaren zelf niets: één gedeelde instantie per state volstaat
+NO_MONEY = NoMoneyState()
+HAS_MONEY = HasMoneyState()
+PRODUCT_SELECTED = ProductSelectedState()
+OUT_OF_STOCK = OutOfStockState()
 
 
 # Gebruik
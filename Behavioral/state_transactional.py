@@ -0,0 +1,272 @@
+import json
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from append_log import AppendLog, scan
+from append_log import valid_end as _valid_frames_end
+from Behavioral.state_compiled import STATE_CODES, STATE_OBJECTS, Event, State
+from Behavioral.state_pattern import DEFAULT_INVENTORY, VendingMachine
+
+# Record: machine, event, nieuwe state, selectie, uitgegeven product, bedrag,
+# saldo na de transactie; producten als index, -1 = geen
+_RECORD = struct.Struct("<IBBhhqq")
+_NONE = -1
+
+
+# Voorraad die meerdere automaten delen, met één lock per product
+class SharedInventory:
+    """
+    Lezen (prijs, voorraad bekijken) gaat zonder lock; alleen take() moet
+    atomair zijn. Met fine_grained=False delen alle producten één lock.
+    """
+
+    def __init__(self, inventory: dict | None = None, fine_grained: bool = True):
+        if inventory is None:
+            inventory = DEFAULT_INVENTORY
+        self.products = list(inventory)
+        self._items = {product: dict(info) for product, info in inventory.items()}
+        shared_lock = threading.Lock()
+        self._locks = {
+            product: threading.Lock() if fine_grained else shared_lock
+            for product in inventory
+        }
+
+    def __contains__(self, product: str) -> bool:
+        return product in self._items
+
+    def __getitem__(self, product: str) -> dict:
+        return self._items[product]
+
+    def items(self):
+        return self._items.items()
+
+    def take(self, product: str) -> bool:
+        with self._locks[product]:
+            info = self._items[product]
+            if info["stock"] == 0:
+                return False
+            info["stock"] -= 1
+            return True
+
+
+# Append-only log van transacties, gedeeld door alle automaten
+class TransactionLog(AppendLog):
+    """
+    Eén frame per transactie; fsync in batches en het afkappen van een half
+    geschreven staartje komen uit AppendLog.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sync_every: int = 256,
+        sync_interval: float = 0.05,
+        offset: int | None = None,
+    ):
+        # offset: einde van het laatste geldige record, bv. Recovery.offset
+        if offset is None:
+            offset = valid_end(path)
+        super().__init__(path, sync_every, sync_interval, offset)
+
+    def append(self, *fields) -> None:
+        super().append(_RECORD.pack(*fields))
+
+
+class MachineState(NamedTuple):
+    state: State
+    balance: int
+    selected_product: str | None
+
+
+@dataclass
+class Recovery:
+    inventory: dict  # Zelfde vorm als VendingMachine.inventory
+    machines: dict[int, MachineState]
+    offset: int  # Tot hier is het log verwerkt
+    records: int
+
+
+# Context die elke gebeurtenis atomair uitvoert en als transactie logt
+class TransactionalVendingMachine(VendingMachine):
+    """
+    Een lock per automaat maakt elke gebeurtenis (saldo, selectie, state)
+    atomair; de voorraad zit in een SharedInventory met een lock per product.
+    Het log bevat de gevolgen van een gebeurtenis, niet alleen de gebeurtenis:
+    herstellen hoeft de volgorde tussen automaten dan niet na te spelen.
+    """
+
+    def __init__(
+        self,
+        machine_id: int,
+        inventory: SharedInventory,
+        log: TransactionLog | None = None,
+        restored: MachineState | None = None,
+        verbose: bool = False,
+    ):
+        super().__init__(dict(inventory.items()), verbose)
+        self.machine_id = machine_id
+        self.inventory = inventory
+        self.log = log
+        self._lock = threading.RLock()
+        self._taken = _NONE
+        if restored is not None:
+            self._state = STATE_OBJECTS[restored.state]
+            self.balance = restored.balance
+            self.selected_product = restored.selected_product
+
+    def take_product(self, product: str) -> bool:
+        if not self.inventory.take(product):
+            return False
+        self._taken = self.inventory.products.index(product)
+        return True
+
+    def _record(self, event: Event, amount: int = 0) -> None:
+        if self.log is not None:
+            selected = self.selected_product
+            self.log.append(
+                self.machine_id,
+                event,
+                STATE_CODES[self._state],
+                _NONE if selected is None else self.inventory.products.index(selected),
+                self._taken,
+                amount,
+                self.balance,
+            )
+        self._taken = _NONE
+
+    def insert_money(self, amount: int) -> None:
+        with self._lock:
+            super().insert_money(amount)
+            self._record(Event.INSERT_MONEY, amount)
+
+    def select_product(self, product: str) -> None:
+        with self._lock:
+            super().select_product(product)
+            self._record(Event.SELECT_PRODUCT)
+
+    def dispense(self) -> None:
+        with self._lock:
+            super().dispense()
+            self._record(Event.DISPENSE)
+
+    def cancel(self) -> None:
+        with self._lock:
+            super().cancel()
+            self._record(Event.CANCEL)
+
+
+def _snapshot_path(path: str) -> str:
+    return path + ".snap"
+
+
+def _snapshot_offset(path: str) -> int:
+    try:
+        with open(_snapshot_path(path)) as f:
+            return json.load(f)["offset"]
+    except FileNotFoundError:
+        return 0
+
+
+def valid_end(path: str) -> int:
+    """Einde van het laatste geldige record na de snapshot (op een recordgrens)"""
+    return _valid_frames_end(path, _snapshot_offset(path))
+
+
+def recover(path: str, inventory: dict | None = None) -> Recovery:
+    """
+    Snapshot (als die er is) + staart van het log. `inventory` geeft
+    prijzen en beginvoorraad; een half geschreven laatste record telt niet.
+    """
+    if inventory is None:
+        inventory = DEFAULT_INVENTORY
+    products = list(inventory)
+    stock = [info["stock"] for info in inventory.values()]
+    machines: dict[int, MachineState] = {}
+    offset = records = 0
+    try:
+        with open(_snapshot_path(path)) as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        pass
+    else:
+        stock = snapshot["stock"]
+        offset = snapshot["offset"]
+        records = snapshot["records"]
+        for machine_id, (code, balance, selected) in snapshot["machines"].items():
+            machines[int(machine_id)] = MachineState(State(code), balance, selected)
+
+    # Per automaat alleen de laatste stand; voorraad als som van de deltas
+    latest: dict[int, tuple] = {}
+    taken = [0] * len(products)
+    for offset, record in scan(path, offset):
+        fields = _RECORD.unpack(record)
+        latest[fields[0]] = fields
+        if fields[4] != _NONE:
+            taken[fields[4]] += 1
+        records += 1
+
+    for machine_id, (_, _, code, selected, _, _, balance) in latest.items():
+        product = None if selected == _NONE else products[selected]
+        machines[machine_id] = MachineState(State(code), balance, product)
+    recovered = {
+        product: {"price": info["price"], "stock": stock[index] - taken[index]}
+        for index, (product, info) in enumerate(inventory.items())
+    }
+    return Recovery(recovered, machines, offset, records)
+
+
+def checkpoint(path: str, inventory: dict | None = None) -> Recovery:
+    """Herstelde stand als snapshot; een volgende start leest alleen de staart"""
+    recovery = recover(path, inventory)
+    snapshot = {
+        "offset": recovery.offset,
+        "records": recovery.records,
+        "stock": [info["stock"] for info in recovery.inventory.values()],
+        "machines": {
+            machine_id: [int(saved.state), saved.balance, saved.selected_product]
+            for machine_id, saved in recovery.machines.items()
+        },
+    }
+    tmp_path = _snapshot_path(path) + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, _snapshot_path(path))
+    return recovery
+
+
+# Gebruik
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "automaten.log")
+    shared = SharedInventory()
+    log = TransactionLog(path)
+    hall = TransactionalVendingMachine(1, shared, log)
+    station = TransactionalVendingMachine(2, shared, log)
+
+    for _ in range(2):
+        hall.insert_money(200)
+        hall.select_product("Water")
+        hall.dispense()
+
+    # Beide automaten zien nog één Water; wie als tweede dispense doet, grijpt mis
+    for machine in (hall, station):
+        machine.insert_money(200)
+        machine.select_product("Water")
+    hall.dispense()
+    station.verbose = True
+    station.dispense()
+    station.cancel()
+    station.insert_money(100)
+    log.close()
+
+    recovery = recover(path)
+    stock = {product: info["stock"] for product, info in recovery.inventory.items()}
+    print(f"\nHersteld uit {recovery.records} transacties, voorraad: {stock}")
+    for machine_id, saved in sorted(recovery.machines.items()):
+        print(f"  Automaat {machine_id}: {saved.state.name}, saldo {saved.balance}")
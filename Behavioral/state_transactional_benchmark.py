@@ -0,0 +1,121 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from Behavioral.state_pattern import VendingMachine
+from Behavioral.state_transactional import (
+    SharedInventory,
+    TransactionalVendingMachine,
+    TransactionLog,
+    recover,
+)
+
+THREADS = 32
+PURCHASES = 2_000  # Per thread
+PRICE = 250
+STOCK = THREADS * PURCHASES * 2  # Ruim genoeg: alleen de locks tellen
+
+
+def _inventory() -> dict:
+    return {
+        "Cola": {"price": PRICE, "stock": STOCK},
+        "Water": {"price": PRICE, "stock": STOCK},
+    }
+
+
+def _buy(machine, product: str, errors: list) -> None:
+    for _ in range(PURCHASES):
+        try:
+            machine.insert_money(PRICE)
+            machine.select_product(product)
+            machine.dispense()
+        except Exception:
+            errors.append(1)  # Bv. een selectie die een andere thread net wiste
+
+
+def _run_threads(targets) -> float:
+    threads = [threading.Thread(target=target) for target in targets]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def one_machine(machine) -> tuple[float, int, int]:
+    """32 threads op één automaat: (tijd, gratis producten, fouten)"""
+    errors: list = []
+    elapsed = _run_threads(
+        lambda: _buy(machine, "Cola", errors) for _ in range(THREADS)
+    )
+    sold = STOCK - machine.inventory["Cola"]["stock"]
+    paid = THREADS * PURCHASES  # Elke aankoop stopt precies de prijs erin
+    return elapsed, max(0, sold - paid), len(errors)
+
+
+def shared_stock(fine_grained: bool, log: TransactionLog | None) -> float:
+    """32 automaten, elk in een eigen thread, op één gedeelde voorraad"""
+    inventory = SharedInventory(_inventory(), fine_grained=fine_grained)
+    machines = [
+        TransactionalVendingMachine(number, inventory, log) for number in range(THREADS)
+    ]
+    errors: list = []
+    products = inventory.products
+    elapsed = _run_threads(
+        (lambda m=machine: _buy(m, products[m.machine_id % 2], errors))
+        for machine in machines
+    )
+    sold = sum(STOCK - info["stock"] for _, info in inventory.items())
+    assert sold == THREADS * PURCHASES and not errors
+    return elapsed
+
+
+def main():
+    # Een korte switch interval maakt races tussen threads veel waarschijnlijker
+    sys.setswitchinterval(1e-5)
+    transactions = THREADS * PURCHASES * 3
+    print(f"{THREADS} threads x {PURCHASES:,} aankopen (3 gebeurtenissen per aankoop)")
+
+    print(f"\n{'één automaat':<28} | {'tps':>9} | {'gratis':>6} | {'fouten':>6}")
+    print("-" * 58)
+    for name, machine in (
+        ("VendingMachine", VendingMachine(_inventory(), verbose=False)),
+        (
+            "TransactionalVendingMachine",
+            TransactionalVendingMachine(0, SharedInventory(_inventory())),
+        ),
+    ):
+        elapsed, free, errors = one_machine(machine)
+        print(f"{name:<28} | {transactions / elapsed:>9,.0f} | {free:>6} | {errors:>6}")
+
+    directory = tempfile.mkdtemp()
+    print(f"\n{'gedeelde voorraad':<28} | {'tps':>9}")
+    print("-" * 40)
+    variants = [
+        ("één lock, geen log", False, None),
+        ("lock per product, geen log", True, None),
+        ("lock per product, log", True, 256),
+        ("lock per product, fsync/tx", True, 1),
+    ]
+    for name, fine_grained, sync_every in variants:
+        log = None
+        if sync_every is not None:
+            path = os.path.join(directory, f"tx-{sync_every}.log")
+            log = TransactionLog(path, sync_every=sync_every, sync_interval=1.0)
+        elapsed = shared_stock(fine_grained, log)
+        print(f"{name:<28} | {transactions / elapsed:>9,.0f}")
+        if log is not None:
+            log.close()
+
+    path = os.path.join(directory, "tx-256.log")
+    start = time.perf_counter()
+    recovery = recover(path, _inventory())
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n{recovery.records:,} transacties hersteld in {elapsed:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
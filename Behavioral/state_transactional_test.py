@@ -0,0 +1,127 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import TestCase
+
+from Behavioral.state_compiled import STATE_CODES, State
+from Behavioral.state_transactional import (
+    SharedInventory,
+    TransactionalVendingMachine,
+    TransactionLog,
+    checkpoint,
+    recover,
+)
+
+INVENTORY = {
+    "Cola": {"price": 250, "stock": 1},
+    "Water": {"price": 150, "stock": 400},
+}
+
+
+class TestTransactionalVendingMachine(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tx.log")
+
+    def test_second_machine_loses_race_for_last_item(self):
+        shared = SharedInventory(INVENTORY)
+        first = TransactionalVendingMachine(1, shared)
+        second = TransactionalVendingMachine(2, shared)
+        for machine in (first, second):
+            machine.insert_money(300)
+            machine.select_product("Cola")
+        first.dispense()
+        second.dispense()
+        self.assertEqual(shared["Cola"]["stock"], 0)
+        self.assertEqual(STATE_CODES[second._state], State.OUT_OF_STOCK)
+        self.assertEqual(second.balance, 300)  # Niet afgeschreven
+
+    def test_threads_on_one_machine_never_get_free_products(self):
+        paid = []  # Saldo op het moment van elke geslaagde uitgifte
+
+        class CountingMachine(TransactionalVendingMachine):
+            def take_product(self, product: str) -> bool:
+                taken = super().take_product(product)
+                if taken:
+                    paid.append(self.balance)
+                return taken
+
+        shared = SharedInventory(INVENTORY)
+        machine = CountingMachine(1, shared)
+
+        def buy():
+            for _ in range(25):
+                machine.insert_money(150)
+                machine.select_product("Water")
+                machine.dispense()
+
+        threads = [threading.Thread(target=buy) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sold = 400 - shared["Water"]["stock"]
+        self.assertEqual(sold, len(paid))
+        self.assertGreater(sold, 0)
+        self.assertTrue(all(balance >= 150 for balance in paid))
+        # Elke ingeworpen cent is betaald, als wisselgeld terug of nog saldo
+        self.assertEqual(16 * 25 * 150, sum(paid) + machine.balance)
+
+    def test_recover_from_snapshot_and_log_tail(self):
+        shared = SharedInventory(INVENTORY)
+        log = TransactionLog(self.path, sync_every=8)
+        machines = [TransactionalVendingMachine(i, shared, log) for i in range(3)]
+        for round_number in range(10):
+            for machine in machines:
+                machine.insert_money(100)
+                machine.select_product("Water")
+                if round_number % 3 == 0:
+                    machine.dispense()
+            if round_number == 4:
+                log.flush()
+                checkpoint(self.path, INVENTORY)
+        log.close()
+        with open(self.path, "ab") as f:
+            f.write(b"\x01\x02\x03")  # Half geschreven record na een crash
+
+        recovery = recover(self.path, INVENTORY)
+        self.assertEqual(recovery.records, log.records)
+        self.assertEqual(recovery.inventory["Water"]["stock"], shared["Water"]["stock"])
+        for machine in machines:
+            saved = recovery.machines[machine.machine_id]
+            self.assertEqual(saved.state, STATE_CODES[machine._state])
+            self.assertEqual(saved.balance, machine.balance)
+            self.assertEqual(saved.selected_product, machine.selected_product)
+
+        # Verder schrijven na de afgekapte staart, daarna opnieuw herstellen
+        log = TransactionLog(self.path, offset=recovery.offset)
+        restored = TransactionalVendingMachine(
+            0, SharedInventory(recovery.inventory), log, restored=recovery.machines[0]
+        )
+        restored.insert_money(150)
+        restored.select_product("Water")
+        restored.dispense()
+        log.close()
+        self.assertEqual(restored.inventory["Water"]["stock"], 400 - 3 * 3 - 1)
+        again = recover(self.path, INVENTORY)
+        self.assertEqual(again.records, recovery.records + log.records)
+        self.assertEqual(again.inventory["Water"]["stock"], 400 - 3 * 3 - 1)
+        self.assertEqual(again.machines[0].state, STATE_CODES[restored._state])
+        self.assertEqual(again.machines[0].balance, restored.balance)
+
+        # Zonder offset zoekt het log zelf de laatste recordgrens
+        with open(self.path, "ab") as f:
+            f.write(b"\x04\x05")
+        log = TransactionLog(self.path)
+        restored.log = log
+        restored.insert_money(50)
+        log.close()
+        final = recover(self.path, INVENTORY)
+        self.assertEqual(final.records, again.records + log.records)
+        self.assertEqual(final.machines[0].balance, restored.balance)
+
+
+if __name__ == "__main__":
+    unittest.main()
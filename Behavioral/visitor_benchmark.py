@@ -0,0 +1,184 @@
+import os
+import time
+import tracemalloc
+
+from Behavioral.visitor_columnar import ColumnarDocument
+from Behavioral.visitor_composite import CompositeVisitor
+from Behavioral.visitor_fixtures import all_visitors, make_document
+from Behavioral.visitor_incremental import (
+    IncrementalDocument,
+    IncrementalExporter,
+    RunningWordCount,
+)
+from Behavioral.visitor_parallel import ParallelExporter
+from Behavioral.visitor_pattern import (
+    Document,
+    HTMLExportVisitor,
+    MarkdownExportVisitor,
+    Table,
+)
+from Behavioral.visitor_streaming import (
+    StreamingHTMLExportVisitor,
+    StreamingMarkdownExportVisitor,
+    export,
+)
+
+ELEMENTS = 1_000_000
+TABLE_ROWS = 100_000
+
+
+def make_table_document(rows: int) -> Document:
+    data = [["Meting", "Waarde"]] + [[f"#{i}", str(i * i)] for i in range(rows)]
+    doc = Document(f"Tabel van {rows} rijen")
+    doc.add_element(Table(len(data), 2, data))
+    return doc
+
+
+def buffered(doc: Document, visitor_class, get) -> None:
+    visitor = visitor_class()
+    doc.accept(visitor)
+    with open(os.devnull, "w") as output:
+        output.write(get(visitor))
+
+
+def streamed(doc: Document, visitor_class) -> None:
+    with open(os.devnull, "w") as output:
+        export(doc, visitor_class(output))
+
+
+def measure(function, *args) -> tuple[float, int]:
+    """(seconden, piekgeheugen in bytes); de tijd wordt zonder tracemalloc gemeten"""
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def export_memory(doc: Document) -> None:
+    documents = {
+        f"{len(doc.elements):,} elementen": doc,
+        f"tabel, {TABLE_ROWS:,} rijen": make_table_document(TABLE_ROWS),
+    }
+    exports = {
+        "HTML, get_html()": lambda doc: buffered(
+            doc, HTMLExportVisitor, HTMLExportVisitor.get_html
+        ),
+        "HTML, streaming": lambda doc: streamed(doc, StreamingHTMLExportVisitor),
+        "Markdown, get_markdown()": lambda doc: buffered(
+            doc, MarkdownExportVisitor, MarkdownExportVisitor.get_markdown
+        ),
+        "Markdown, streaming": lambda doc: streamed(
+            doc, StreamingMarkdownExportVisitor
+        ),
+    }
+    for title, doc in documents.items():
+        print(f"\n{title}")
+        print(f"{'export':<26}{'tijd':>10}{'piekgeheugen':>16}")
+        for name, function in exports.items():
+            elapsed, peak = measure(function, doc)
+            print(f"{name:<26}{elapsed:>9.2f}s{peak / 2**20:>13.1f} MiB")
+
+
+def separate_passes(doc: Document, visitors: list) -> None:
+    for visitor in visitors:
+        doc.accept(visitor)
+
+
+def fused(doc: Document, visitors: list) -> None:
+    CompositeVisitor(*visitors).traverse(doc)
+
+
+def fusion(doc: Document) -> None:
+    print(f"\n{len(doc.elements):,} elementen, HTML + Markdown + tekst + woorden")
+    results = {}
+    for name, function in (
+        ("4 x doc.accept()", separate_passes),
+        ("CompositeVisitor.traverse()", fused),
+    ):
+        # Beste van drie, met verse visitors zodat de lijsten niet doorgroeien
+        results[name] = min(timed(function, doc, all_visitors()) for _ in range(3))
+    baseline = results["4 x doc.accept()"]
+    for name, elapsed in results.items():
+        print(f"{name:<30}{elapsed:>7.2f}s{baseline / elapsed:>8.2f}x")
+
+
+def sequential_html(doc: Document) -> None:
+    visitor = HTMLExportVisitor()
+    doc.accept(visitor)
+    visitor.get_html()
+
+
+def parallel(doc: Document) -> None:
+    print(f"\n{len(doc.elements):,} elementen, HTML-export ({os.cpu_count()} cores)")
+    baseline = min(timed(sequential_html, doc) for _ in range(3))
+    print(f"{'sequentieel':<30}{baseline:>7.2f}s{1:>8.2f}x")
+    for workers in (1, 2, 4, 8):
+        # Pool eenmaal starten (document gaat bij het forken mee), dan meten
+        with ParallelExporter(doc, workers) as exporter:
+            elapsed = min(timed(exporter.export, HTMLExportVisitor) for _ in range(3))
+        name = f"{workers} processen"
+        print(f"{name:<30}{elapsed:>7.2f}s{baseline / elapsed:>8.2f}x")
+
+
+def incremental(count: int = 100_000) -> None:
+    doc = make_document(count, document_class=IncrementalDocument)
+    print(f"\n{count:,} elementen, HTML opnieuw exporteren na één edit")
+    full = min(timed(sequential_html, doc) for _ in range(3))
+    exporter = IncrementalExporter(doc, HTMLExportVisitor)
+    stats = RunningWordCount(doc)
+    first = timed(exporter.export)
+    paragraphs = [
+        index for index, element in enumerate(doc.elements) if hasattr(element, "text")
+    ]
+    edits = []
+    for index in paragraphs[:: len(paragraphs) // 20][:20]:
+        doc.edit(index, text="Herschreven na de review.")
+        edits.append(timed(exporter.export))
+    again = sorted(edits)[len(edits) // 2]
+    for name, elapsed in (
+        ("volledige export", full),
+        ("IncrementalExporter, eerste", first),
+        ("IncrementalExporter, na edit", again),
+    ):
+        print(f"{name:<30}{elapsed * 1000:>8.2f} ms{full / elapsed:>8.1f}x")
+    print(f"woorden bijgehouden: {stats.word_count:,}")
+
+
+def columnar(count: int = ELEMENTS) -> None:
+    print(f"\n{count:,} elementen, objecten vs ColumnarDocument")
+    print(f"{'opslag':<22}{'bytes/element':>15}{'HTML-export':>14}")
+    for name, document_class in (
+        ("Document", Document),
+        ("ColumnarDocument", ColumnarDocument),
+    ):
+        tracemalloc.start()
+        doc = make_document(count, document_class=document_class)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        elapsed = timed(sequential_html, doc)
+        print(f"{name:<22}{size / count:>15.1f}{elapsed:>13.2f}s")
+        del doc
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    doc = make_document(ELEMENTS)
+    fusion(doc)
+    parallel(doc)
+    incremental()
+    export_memory(doc)
+    del doc
+    columnar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+from array import array
+from enum import IntEnum
+
+from Behavioral.visitor_pattern import (
+    DocumentElement,
+    DocumentVisitor,
+    Heading,
+    Image,
+    Paragraph,
+    Table,
+)
+
+# Recent geziene strings die hergebruikt worden (tabelkoppen, alt-teksten, ...);
+# een volledige dict zou elke string als str-object vasthouden
+INTERN_CACHE = 4096
+
+
+class ElementType(IntEnum):
+    PARAGRAPH = 0
+    HEADING = 1
+    IMAGE = 2
+    TABLE = 3
+
+
+# Views: elementen die hun velden uit de kolommen van het document lezen. Geen
+# __slots__: de elementklassen hebben een __dict__, dus dat zou niets besparen.
+# Elke opvraging geeft een nieuwe view; identiteit zegt niets over het element.
+class ParagraphView(Paragraph):
+    def __init__(self, document: "ColumnarDocument", index: int):
+        self._document = document
+        self._index = index
+
+    @property
+    def text(self) -> str:
+        return self._document.string(self._document._first[self._index])
+
+
+class HeadingView(Heading):
+    def __init__(self, document: "ColumnarDocument", index: int):
+        self._document = document
+        self._index = index
+
+    @property
+    def text(self) -> str:
+        return self._document.string(self._document._first[self._index])
+
+    @property
+    def level(self) -> int:
+        return self._document._second[self._index]
+
+
+class ImageView(Image):
+    def __init__(self, document: "ColumnarDocument", index: int):
+        self._document = document
+        self._index = index
+
+    @property
+    def url(self) -> str:
+        return self._document.string(self._document._first[self._index])
+
+    @property
+    def alt_text(self) -> str:
+        return self._document.string(self._document._second[self._index])
+
+
+class TableView(Table):
+    def __init__(self, document: "ColumnarDocument", index: int):
+        self._document = document
+        self._index = index
+
+    def _field(self, offset: int) -> int:
+        return self._document._tables[4 * self._document._first[self._index] + offset]
+
+    @property
+    def data(self) -> "RowsView":
+        first_row = self._field(0)
+        return RowsView(self._document, range(first_row, first_row + self._field(1)))
+
+    @property
+    def rows(self) -> int:
+        return self._field(2)
+
+    @property
+    def columns(self) -> int:
+        return self._field(3)
+
+
+# Rijen van een tabel als reeks; een rij wordt pas bij opvragen een lijst
+class RowsView:
+    __slots__ = ("_document", "_rows")
+
+    def __init__(self, document: "ColumnarDocument", rows: range):
+        self._document = document
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowsView(self._document, self._rows[index])
+        return self._row(self._rows[index])
+
+    def __iter__(self):
+        for row in self._rows:
+            yield self._row(row)
+
+    def _row(self, row: int) -> list[str]:
+        document = self._document
+        starts = document._row_starts
+        string = document.string
+        return [string(cell) for cell in document._cells[starts[row] : starts[row + 1]]]
+
+
+VIEWS = (ParagraphView, HeadingView, ImageView, TableView)
+
+
+# Elementen van een ColumnarDocument als reeks views (ook slices)
+class ElementsView:
+    __slots__ = ("_document", "_indexes")
+
+    def __init__(self, document: "ColumnarDocument", indexes: range):
+        self._document = document
+        self._indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ElementsView(self._document, self._indexes[index])
+        return self._document.element(self._indexes[index])
+
+    def __iter__(self):
+        document = self._document
+        types = document._types
+        for index in self._indexes:
+            yield VIEWS[types[index]](document, index)
+
+
+# Document als kolommen: geen object per element, strings in één buffer
+class ColumnarDocument:
+    """
+    Zelfde interface als Document (title, elements, add_element, accept).
+    Per element een typecode en twee uint32 velden:
+      PARAGRAPH: tekst | HEADING: tekst, niveau | IMAGE: url, alt-tekst
+      TABLE: tabelnummer -> (eerste rij, aantal rijen, rows, columns)
+    Strings staan UTF-8 achter elkaar in een bytearray met offsets; een
+    string-id is een index in die offsets. Tabelcellen zijn string-ids in
+    één platte array, met per rij een startoffset.
+
+    elements[i] en accept() maken telkens nieuwe views: een cache die op het
+    element-object sleutelt, raakt hier nooit (IncrementalExporter gebruikt
+    daarom de index). Views zijn alleen-lezen.
+    """
+
+    def __init__(self, title: str):
+        self.title = title
+        self._types = array("B")
+        self._first = array("I")
+        self._second = array("I")
+        self._text = bytearray()
+        self._offsets = array("Q", [0])
+        self._recent: dict[str, int] = {}
+        self._tables = array("I")
+        self._cells = array("I")
+        self._row_starts = array("Q", [0])
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    @property
+    def elements(self) -> ElementsView:
+        return ElementsView(self, range(len(self._types)))
+
+    def element(self, index: int) -> DocumentElement:
+        return VIEWS[self._types[index]](self, index)
+
+    def string(self, string_id: int) -> str:
+        offsets = self._offsets
+        return self._text[offsets[string_id] : offsets[string_id + 1]].decode()
+
+    def intern(self, text: str) -> int:
+        string_id = self._recent.get(text)
+        if string_id is None:
+            self._text += text.encode()
+            self._offsets.append(len(self._text))
+            string_id = len(self._offsets) - 2
+            if len(self._recent) >= INTERN_CACHE:
+                self._recent.clear()
+            self._recent[text] = string_id
+        return string_id
+
+    def _append(self, code: ElementType, first: int, second: int = 0) -> None:
+        self._types.append(code)
+        self._first.append(first)
+        self._second.append(second)
+
+    def add_paragraph(self, text: str) -> None:
+        self._append(ElementType.PARAGRAPH, self.intern(text))
+
+    def add_heading(self, text: str, level: int) -> None:
+        self._append(ElementType.HEADING, self.intern(text), level)
+
+    def add_image(self, url: str, alt_text: str) -> None:
+        self._append(ElementType.IMAGE, self.intern(url), self.intern(alt_text))
+
+    def add_table(self, rows: int, columns: int, data) -> None:
+        table = len(self._tables) // 4
+        self._tables.extend((len(self._row_starts) - 1, len(data), rows, columns))
+        for row in data:
+            self._cells.extend(self.intern(cell) for cell in row)
+            self._row_starts.append(len(self._cells))
+        self._append(ElementType.TABLE, table)
+
+    def add_element(self, element: DocumentElement) -> None:
+        """Kopieert de velden; het element zelf wordt niet bewaard"""
+        if isinstance(element, Paragraph):
+            self.add_paragraph(element.text)
+        elif isinstance(element, Heading):
+            self.add_heading(element.text, element.level)
+        elif isinstance(element, Image):
+            self.add_image(element.url, element.alt_text)
+        elif isinstance(element, Table):
+            self.add_table(element.rows, element.columns, element.data)
+        else:
+            raise TypeError(f"Onbekend element: {type(element).__name__}")
+
+    def accept(self, visitor: DocumentVisitor) -> None:
+        visits = (
+            visitor.visit_paragraph,
+            visitor.visit_heading,
+            visitor.visit_image,
+            visitor.visit_table,
+        )
+        for index, code in enumerate(self._types):
+            visits[code](VIEWS[code](self, index))
+
+    def nbytes(self) -> int:
+        """Bytes in de kolommen en de stringbuffer (zonder de intern-cache)"""
+        columns = (
+            self._types,
+            self._first,
+            self._second,
+            self._offsets,
+            self._tables,
+            self._cells,
+            self._row_starts,
+        )
+        return len(self._text) + sum(
+            len(column) * column.itemsize for column in columns
+        )
+
+
+# Gebruik
+if __name__ == "__main__":
+    from Behavioral.visitor_pattern import MarkdownExportVisitor, WordCountVisitor
+
+    doc = ColumnarDocument("Kolommen")
+    doc.add_element(Heading("Compacte opslag", 1))
+    doc.add_paragraph("Geen object per element, alleen arrays en één stringbuffer.")
+    doc.add_image("https://example.com/kolommen.png", "Kolommen")
+    doc.add_table(2, 2, [["Pattern", "Type"], ["Visitor", "Behavioral"]])
+
+    markdown = MarkdownExportVisitor()
+    doc.accept(markdown)
+    print(markdown.get_markdown())
+    stats = WordCountVisitor()
+    doc.accept(stats)
+    print(stats.get_statistics())
+    print(f"{len(doc)} elementen in {doc.nbytes()} bytes")
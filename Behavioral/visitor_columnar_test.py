@@ -0,0 +1,51 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.visitor_columnar import ColumnarDocument, TableView
+from Behavioral.visitor_composite import CompositeVisitor
+from Behavioral.visitor_fixtures import all_visitors, make_document
+from Behavioral.visitor_pattern import Document, Table
+
+
+class TestColumnarDocument(TestCase):
+    def setUp(self):
+        self.objects = make_document(2_000, seed=13)
+        self.columns = make_document(2_000, seed=13, document_class=ColumnarDocument)
+
+    def test_visitors_give_the_same_results_through_views(self):
+        expected, actual = all_visitors(), all_visitors()
+        for visitor in expected:
+            self.objects.accept(visitor)
+        CompositeVisitor(*actual).traverse(self.columns)
+        for visitor, reference in zip(actual, expected):
+            self.assertEqual(vars(visitor), vars(reference))
+
+    def test_views_and_slices(self):
+        self.columns.add_element(Table(3, 2, [["a", "b"], ["c", "d"], ["a", "b"]]))
+        table = self.columns.elements[-1]
+        self.assertIsInstance(table, TableView)
+        self.assertEqual((table.rows, table.columns, len(table.data)), (3, 2, 3))
+        self.assertEqual(list(table.data[1:]), [["c", "d"], ["a", "b"]])
+        self.assertEqual(table.data[-1], ["a", "b"])
+
+        chunk = self.columns.elements[10:20]
+        self.assertEqual(len(chunk), 10)
+        self.assertEqual(
+            [vars(element) for element in self.objects.elements[10:20]],
+            [
+                {name: getattr(view, name) for name in vars(element)}
+                for view, element in zip(chunk, self.objects.elements[10:20])
+            ],
+        )
+
+    def test_repeated_strings_are_stored_once(self):
+        doc = ColumnarDocument("Herhaling")
+        for _ in range(100):
+            doc.add_table(1, 2, [["Kolom A", "Kolom B"]])
+        self.assertEqual(len(doc._offsets) - 1, 2)
+        with self.assertRaises(TypeError):
+            doc.add_element(Document("Geen element"))
+
+
+if __name__ == "__main__":
+    unittest.main()
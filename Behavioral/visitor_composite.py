@@ -0,0 +1,85 @@
+from Behavioral.visitor_pattern import (
+    Document,
+    DocumentElement,
+    Heading,
+    Image,
+    Paragraph,
+    Table,
+)
+
+# Welke visit-methode bij welk elementtype hoort (wat accept() anders doet)
+VISIT_METHODS: dict[type, str] = {
+    Paragraph: "visit_paragraph",
+    Heading: "visit_heading",
+    Image: "visit_image",
+    Table: "visit_table",
+}
+
+
+# Composite Visitor: meerdere visitors in één doorloop van het document
+class CompositeVisitor:
+    """
+    Per elementtype ligt vooraf een tuple van gebonden visit-methodes klaar,
+    van alle visitors in volgorde. traverse() zoekt per element één keer het
+    type op en roept die methodes aan, zonder accept() en zonder getattr.
+    Het is zelf ook een DocumentVisitor, dus document.accept() werkt ook.
+    """
+
+    def __init__(self, *visitors):
+        self.visitors = visitors
+        self._dispatch: dict[type, tuple] = {
+            element_type: self._bind(name)
+            for element_type, name in VISIT_METHODS.items()
+        }
+
+    def _bind(self, name: str) -> tuple:
+        return tuple(getattr(visitor, name) for visitor in self.visitors)
+
+    def _methods_for(self, element_type: type) -> tuple:
+        # Subklasse van een bekend element: eerste match in de MRO, daarna gecached
+        for base in element_type.__mro__:
+            if base in VISIT_METHODS:
+                methods = self._dispatch[element_type] = self._dispatch[base]
+                return methods
+        raise TypeError(f"Geen visit-methode voor {element_type.__name__}")
+
+    def visit_element(self, element: DocumentElement) -> None:
+        methods = self._dispatch.get(element.__class__)
+        if methods is None:
+            methods = self._methods_for(element.__class__)
+        for method in methods:
+            method(element)
+
+    visit_paragraph = visit_heading = visit_image = visit_table = visit_element
+
+    def traverse(self, document: Document) -> None:
+        dispatch = self._dispatch
+        for element in document.elements:
+            methods = dispatch.get(element.__class__)
+            if methods is None:
+                methods = self._methods_for(element.__class__)
+            for method in methods:
+                method(element)
+
+
+# Gebruik
+if __name__ == "__main__":
+    from Behavioral.visitor_pattern import (
+        HTMLExportVisitor,
+        MarkdownExportVisitor,
+        WordCountVisitor,
+    )
+
+    doc = Document("Eén doorloop")
+    doc.add_element(Heading("Fusie", 1))
+    doc.add_element(Paragraph("Drie visitors, elk element maar één keer bezocht."))
+    doc.add_element(Image("https://example.com/fusie.png", "Fusie"))
+
+    html = HTMLExportVisitor()
+    markdown = MarkdownExportVisitor()
+    stats = WordCountVisitor()
+    CompositeVisitor(html, markdown, stats).traverse(doc)
+    print(html.get_html())
+    print()
+    print(markdown.get_markdown())
+    print(stats.get_statistics())
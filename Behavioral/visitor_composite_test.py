@@ -0,0 +1,46 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.visitor_composite import CompositeVisitor
+from Behavioral.visitor_fixtures import all_visitors, make_document
+from Behavioral.visitor_pattern import (
+    Document,
+    Paragraph,
+    WordCountVisitor,
+)
+
+
+class Quote(Paragraph):
+    pass
+
+
+class TestCompositeVisitor(TestCase):
+    def test_one_pass_matches_separate_passes(self):
+        doc = make_document(3_000, seed=5)
+        separate, fused = all_visitors(), all_visitors()
+        for visitor in separate:
+            doc.accept(visitor)
+        CompositeVisitor(*fused).traverse(doc)
+
+        html, markdown, text, words = separate
+        fused_html, fused_markdown, fused_text, fused_words = fused
+        self.assertEqual(fused_html.get_html(), html.get_html())
+        self.assertEqual(fused_markdown.get_markdown(), markdown.get_markdown())
+        self.assertEqual(fused_text.get_text(), text.get_text())
+        self.assertEqual(fused_words.get_statistics(), words.get_statistics())
+
+    def test_element_subclasses_and_accept(self):
+        doc = Document("Citaten")
+        doc.add_element(Quote("twee woorden"))
+        first, second = WordCountVisitor(), WordCountVisitor()
+        composite = CompositeVisitor(first, second)
+        composite.traverse(doc)
+        doc.accept(composite)
+        self.assertEqual((first.word_count, second.word_count), (4, 4))
+
+        with self.assertRaises(TypeError):
+            composite.visit_element(object())
+
+
+if __name__ == "__main__":
+    unittest.main()
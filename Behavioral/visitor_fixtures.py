@@ -0,0 +1,46 @@
+import random
+
+from Behavioral.visitor_pattern import (
+    Document,
+    Heading,
+    HTMLExportVisitor,
+    Image,
+    MarkdownExportVisitor,
+    Paragraph,
+    PlainTextVisitor,
+    Table,
+    WordCountVisitor,
+)
+
+# Willekeurige documenten voor de tests en benchmarks van de visitors
+_WORDS = ["visitor", "pattern", "document", "export", "element", "tabel", "data"]
+
+
+def make_document(count: int, seed: int = 1, document_class=Document) -> Document:
+    """Vooral paragrafen, af en toe een kop, afbeelding of kleine tabel"""
+    rng = random.Random(seed)
+    doc = document_class(f"{count} elementen")
+    for index in range(count):
+        kind = rng.random()
+        if kind < 0.7:
+            doc.add_element(Paragraph(" ".join(rng.choices(_WORDS, k=12))))
+        elif kind < 0.85:
+            doc.add_element(Heading(f"Sectie {index}", rng.randint(1, 3)))
+        elif kind < 0.95:
+            url = f"https://example.com/{index}.png"
+            doc.add_element(Image(url, f"Figuur {index}"))
+        else:
+            data = [["Kolom A", "Kolom B"]]
+            data += [[str(index), str(row)] for row in range(3)]
+            doc.add_element(Table(len(data), 2, data))
+    return doc
+
+
+def all_visitors() -> list:
+    """Een verse instantie van elke visitor uit visitor_pattern, in vaste volgorde"""
+    return [
+        HTMLExportVisitor(),
+        MarkdownExportVisitor(),
+        PlainTextVisitor(),
+        WordCountVisitor(),
+    ]
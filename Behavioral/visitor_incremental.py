@@ -0,0 +1,188 @@
+import inspect
+from collections import OrderedDict
+from functools import cache
+
+from Behavioral.visitor_parallel import parts_attribute
+from Behavioral.visitor_pattern import Document, DocumentElement, WordCountVisitor
+
+BLOCK_SIZE = 1024  # Elementen per samengevoegd stuk uitvoer
+CACHE_SIZE = 2**20  # Gerenderde fragmenten in de LRU cache
+_MISSING = object()
+_FIELD_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+@cache
+def data_fields(element_type: type) -> frozenset[str]:
+    """Velden die edit() mag wijzigen: de parameters van de constructor"""
+    parameters = inspect.signature(element_type).parameters.values()
+    return frozenset(p.name for p in parameters if p.kind in _FIELD_KINDS)
+
+
+# Document dat luisteraars op de hoogte houdt van toevoegingen en wijzigingen
+class IncrementalDocument(Document):
+    """
+    Wijzig elementen via edit(): dat verhoogt element.version en laat de
+    luisteraars het verschil verwerken. Een luisteraar heeft element_added,
+    element_changing (vóór de wijziging) en element_changed (erna). Alleen
+    de datavelden uit de constructor zijn te wijzigen, niet version, accept
+    of andere methodes.
+    """
+
+    def __init__(self, title: str):
+        super().__init__(title)
+        self._listeners: list = []
+
+    def subscribe(self, listener) -> None:
+        self._listeners.append(listener)
+        for index, element in enumerate(self.elements):
+            listener.element_added(index, element)
+
+    def add_element(self, element: DocumentElement) -> None:
+        super().add_element(element)
+        index = len(self.elements) - 1
+        for listener in self._listeners:
+            listener.element_added(index, element)
+
+    def edit(self, index: int, **changes) -> None:
+        element = self.elements[index]
+        fields = data_fields(type(element))
+        for name in changes:
+            if name not in fields:
+                raise AttributeError(
+                    f"{type(element).__name__} heeft geen dataveld {name}"
+                )
+        for listener in self._listeners:
+            listener.element_changing(index, element)
+        for name, value in changes.items():
+            setattr(element, name, value)
+        element.version += 1
+        for listener in self._listeners:
+            listener.element_changed(index, element)
+
+
+# Woordtelling die bij elke toevoeging en wijziging wordt bijgewerkt
+class RunningWordCount(WordCountVisitor):
+    def __init__(self, document: IncrementalDocument):
+        super().__init__()
+        document.subscribe(self)
+
+    def element_added(self, index: int, element: DocumentElement) -> None:
+        element.accept(self)
+
+    def element_changing(self, index: int, element: DocumentElement) -> None:
+        # Oude bijdrage eraf, element_changed telt de nieuwe erbij
+        old = WordCountVisitor()
+        element.accept(old)
+        self.word_count -= old.word_count
+        self.heading_count -= old.heading_count
+        self.image_count -= old.image_count
+        self.table_count -= old.table_count
+
+    element_changed = element_added
+
+
+# Export die alleen gewijzigde elementen opnieuw rendert
+class IncrementalExporter:
+    """
+    Fragmenten per element staan in een LRU cache op (index, version): de
+    index en niet het element zelf, want een document mag zijn elementen per
+    opvraging als nieuwe view-objecten geven (zie ColumnarDocument).
+    Daarboven houdt de exporter per blok van BLOCK_SIZE elementen de
+    samengevoegde tekst bij; een wijziging maakt alleen dat blok vuil. Na één
+    edit() rendert export() dus één element, voegt één blok opnieuw samen
+    (de rest uit de cache) en plakt de blokken aan elkaar.
+    """
+
+    def __init__(
+        self,
+        document: IncrementalDocument,
+        visitor_class: type,
+        cache_size: int = CACHE_SIZE,
+        block_size: int = BLOCK_SIZE,
+    ):
+        self.document = document
+        self._visitor = visitor_class()
+        self._parts = getattr(self._visitor, parts_attribute(visitor_class))
+        self._cache: OrderedDict[tuple, str | None] = OrderedDict()
+        self.cache_size = cache_size
+        self.block_size = block_size
+        self._blocks: list[str | None] = []
+        self._dirty: set[int] = set()
+        self.hits = self.misses = 0
+        document.subscribe(self)
+
+    def element_added(self, index: int, element: DocumentElement) -> None:
+        self._dirty.add(index // self.block_size)
+
+    def element_changing(self, index: int, element: DocumentElement) -> None:
+        pass
+
+    element_changed = element_added
+
+    def _render(self, index: int, element: DocumentElement) -> str | None:
+        key = (index, element.version)
+        fragment = self._cache.get(key, _MISSING)
+        if fragment is not _MISSING:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return fragment
+        self._parts.clear()
+        element.accept(self._visitor)
+        # None: het element levert geen delen op (bv. een lege Markdown-tabel)
+        fragment = "\n".join(self._parts) if self._parts else None
+        self._cache[key] = fragment
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        self.misses += 1
+        return fragment
+
+    def export(self) -> str:
+        """Zelfde string als een volledige export met de gewone visitor"""
+        elements = self.document.elements
+        for block in sorted(self._dirty):
+            start = block * self.block_size
+            fragments = [
+                fragment
+                for fragment in map(
+                    self._render,
+                    range(start, start + self.block_size),
+                    elements[start : start + self.block_size],
+                )
+                if fragment is not None
+            ]
+            text = "\n".join(fragments) if fragments else None
+            if block < len(self._blocks):
+                self._blocks[block] = text
+            else:
+                self._blocks.append(text)
+        self._dirty.clear()
+        return "\n".join([text for text in self._blocks if text is not None])
+
+
+# Gebruik
+if __name__ == "__main__":
+    import time
+
+    from Behavioral.visitor_fixtures import make_document
+    from Behavioral.visitor_pattern import HTMLExportVisitor
+
+    doc = make_document(100_000, document_class=IncrementalDocument)
+    exporter = IncrementalExporter(doc, HTMLExportVisitor)
+    stats = RunningWordCount(doc)
+
+    start = time.perf_counter()
+    exporter.export()
+    first = time.perf_counter() - start
+
+    doc.edit(50_000, text="Eén paragraaf herschreven na de review.")
+    start = time.perf_counter()
+    html = exporter.export()
+    again = time.perf_counter() - start
+
+    print(f"Eerste export: {first * 1000:.1f} ms, na één edit: {again * 1000:.2f} ms")
+    print(f"Opnieuw gerenderd: {exporter.misses - len(doc.elements)} element(en)")
+    print(f"HTML: {len(html):,} tekens")
+    print(stats.get_statistics())
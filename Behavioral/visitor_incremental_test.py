@@ -0,0 +1,75 @@
+import unittest
+from unittest import TestCase
+
+from Behavioral.visitor_fixtures import make_document
+from Behavioral.visitor_incremental import (
+    IncrementalDocument,
+    IncrementalExporter,
+    RunningWordCount,
+)
+from Behavioral.visitor_pattern import (
+    HTMLExportVisitor,
+    MarkdownExportVisitor,
+    Paragraph,
+    Table,
+    WordCountVisitor,
+)
+
+
+class TestIncrementalExport(TestCase):
+    def setUp(self):
+        self.doc = make_document(500, seed=11, document_class=IncrementalDocument)
+
+    def full_export(self, visitor_class, get) -> str:
+        visitor = visitor_class()
+        self.doc.accept(visitor)
+        return get(visitor)
+
+    def test_only_edited_elements_are_rendered_again(self):
+        exporter = IncrementalExporter(self.doc, HTMLExportVisitor, block_size=64)
+        exporter.export()
+        misses = exporter.misses
+
+        index = next(
+            i for i, element in enumerate(self.doc.elements) if hasattr(element, "text")
+        )
+        version = self.doc.elements[index].version
+        self.doc.edit(index, text="Nieuwe tekst")
+        self.doc.add_element(Paragraph("Achteraan toegevoegd"))
+        self.assertEqual(self.doc.elements[index].version, version + 1)
+        self.assertEqual(
+            exporter.export(),
+            self.full_export(HTMLExportVisitor, HTMLExportVisitor.get_html),
+        )
+        self.assertEqual(exporter.misses, misses + 2)
+
+        for name in ("colour", "version", "accept", "__class__"):
+            with self.subTest(name=name), self.assertRaises(AttributeError):
+                self.doc.edit(index, **{name: "rood"})
+        self.assertEqual(self.doc.elements[index].version, version + 1)
+
+    def test_small_cache_and_empty_fragments_give_same_output(self):
+        exporter = IncrementalExporter(
+            self.doc, MarkdownExportVisitor, cache_size=10, block_size=3
+        )
+        for _ in range(3):
+            self.doc.add_element(Table(0, 0, []))  # Levert in Markdown niets op
+        self.doc.edit(0, text="Eerste")
+        expected = self.full_export(
+            MarkdownExportVisitor, MarkdownExportVisitor.get_markdown
+        )
+        self.assertEqual(exporter.export(), expected)
+
+    def test_running_word_count_follows_edits(self):
+        stats = RunningWordCount(self.doc)
+        tables = [isinstance(element, Table) for element in self.doc.elements]
+        table = tables.index(True)
+        self.doc.edit(table, data=[["een twee drie"]])
+        self.doc.add_element(Paragraph("vier vijf"))
+        reference = WordCountVisitor()
+        self.doc.accept(reference)
+        self.assertEqual(stats.get_statistics(), reference.get_statistics())
+
+
+if __name__ == "__main__":
+    unittest.main()
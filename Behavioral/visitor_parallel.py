@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import TextIO
+
+from Behavioral.visitor_pattern import (
+    Document,
+    HTMLExportVisitor,
+    MarkdownExportVisitor,
+    PlainTextVisitor,
+    WordCountVisitor,
+)
+
+# Waar elke export-visitor zijn delen bewaart; een chunk wordt "\n".join(delen)
+FRAGMENT_PARTS: dict[type, str] = {
+    HTMLExportVisitor: "html_parts",
+    MarkdownExportVisitor: "markdown_parts",
+    PlainTextVisitor: "text_parts",
+}
+
+# Het document van deze worker, één keer meegegeven bij het starten
+_document: Document | None = None
+
+
+def _init_worker(document: Document) -> None:
+    global _document
+    _document = document
+
+
+def parts_attribute(visitor_class: type) -> str:
+    """Naam van de lijst met delen van een export-visitor (ook voor subklassen)"""
+    for base in visitor_class.__mro__:
+        if base in FRAGMENT_PARTS:
+            return FRAGMENT_PARTS[base]
+    raise TypeError(f"{visitor_class.__name__} is geen export-visitor")
+
+
+def _visit_chunk(visitor_class: type, start: int, stop: int):
+    visitor = visitor_class()
+    for element in _document.elements[start:stop]:
+        element.accept(visitor)
+    return visitor
+
+
+def _export_chunk(visitor_class: type, start: int, stop: int) -> str | None:
+    visitor = _visit_chunk(visitor_class, start, stop)
+    parts = getattr(visitor, parts_attribute(visitor_class))
+    # None i.p.v. "": een leeg stuk (bv. alleen lege tabellen) krijgt geen "\n"
+    return "\n".join(parts) if parts else None
+
+
+def merge_word_counts(
+    total: WordCountVisitor, part: WordCountVisitor
+) -> WordCountVisitor:
+    """Reduce-stap: de tellers van twee stukken document optellen"""
+    merged = WordCountVisitor()
+    merged.word_count = total.word_count + part.word_count
+    merged.heading_count = total.heading_count + part.heading_count
+    merged.image_count = total.image_count + part.image_count
+    merged.table_count = total.table_count + part.table_count
+    return merged
+
+
+# Export over een process pool, in stukken van opeenvolgende elementen
+class ParallelExporter:
+    """
+    De workers krijgen het document één keer bij het starten; per opdracht
+    gaan alleen (start, stop) grenzen heen en fragmenten terug. executor.map()
+    levert ze in de volgorde van de stukken. Elementen die na het starten
+    worden toegevoegd, zien de workers niet.
+
+    Standaard start de pool met fork waar dat kan (Linux, macOS), zodat de
+    workers het document zonder pickelen erven; vanaf Python 3.14 is fork
+    niet meer de standaard. Met spawn of forkserver (bv. op Windows, of via
+    mp_context) wordt het document één keer per worker gepickeld.
+    """
+
+    def __init__(
+        self,
+        document: Document,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        mp_context=None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.size = len(document.elements)
+        # Een paar stukken per worker, zodat een trage chunk de rest niet ophoudt
+        self.chunk_size = chunk_size or max(1, -(-self.size // (self.workers * 4)))
+        if mp_context is None and "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        self._executor = ProcessPoolExecutor(
+            self.workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(document,),
+        )
+
+    def _map(self, function, visitor_class: type):
+        starts = range(0, self.size, self.chunk_size)
+        stops = [min(start + self.chunk_size, self.size) for start in starts]
+        return self._executor.map(
+            function, [visitor_class] * len(starts), starts, stops
+        )
+
+    def fragments(self, visitor_class: type):
+        """Niet-lege fragmenten, in documentvolgorde, zodra ze klaar zijn"""
+        parts_attribute(visitor_class)  # Fout meteen, niet pas in de worker
+        for fragment in self._map(_export_chunk, visitor_class):
+            if fragment is not None:
+                yield fragment
+
+    def export(self, visitor_class: type) -> str:
+        """Zelfde string als get_html()/get_markdown()/get_text()"""
+        return "\n".join(self.fragments(visitor_class))
+
+    def write(self, visitor_class: type, output: TextIO) -> None:
+        separator = ""
+        for fragment in self.fragments(visitor_class):
+            output.write(separator)
+            output.write(fragment)
+            separator = "\n"
+
+    def word_count(self) -> WordCountVisitor:
+        counts = self._map(_visit_chunk, WordCountVisitor)
+        return reduce(merge_word_counts, counts, WordCountVisitor())
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Gebruik
+if __name__ == "__main__":
+    from Behavioral.visitor_fixtures import make_document
+
+    doc = make_document(200_000)
+    with ParallelExporter(doc) as exporter:
+        html = exporter.export(HTMLExportVisitor)
+        stats = exporter.word_count()
+
+    print(f"{len(doc.elements):,} elementen in {exporter.workers} processen")
+    print(f"HTML: {len(html):,} tekens, begint met {html[:30]!r}")
+    print(stats.get_statistics())
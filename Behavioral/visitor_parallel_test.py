@@ -0,0 +1,69 @@
+import io
+import multiprocessing
+import unittest
+from unittest import TestCase
+
+from Behavioral.visitor_fixtures import make_document
+from Behavioral.visitor_parallel import ParallelExporter
+from Behavioral.visitor_pattern import (
+    HTMLExportVisitor,
+    MarkdownExportVisitor,
+    PlainTextVisitor,
+    Table,
+    WordCountVisitor,
+)
+
+
+class TestParallelExporter(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.doc = make_document(1_000, seed=9)
+        # Een chunk met alleen lege tabellen levert in Markdown geen delen op
+        for _ in range(7):
+            cls.doc.add_element(Table(0, 0, []))
+        cls.exporter = ParallelExporter(cls.doc, workers=2, chunk_size=7)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exporter.close()
+
+    def test_fragments_are_joined_in_document_order(self):
+        for visitor_class, get in (
+            (HTMLExportVisitor, HTMLExportVisitor.get_html),
+            (MarkdownExportVisitor, MarkdownExportVisitor.get_markdown),
+            (PlainTextVisitor, PlainTextVisitor.get_text),
+        ):
+            visitor = visitor_class()
+            self.doc.accept(visitor)
+            self.assertEqual(self.exporter.export(visitor_class), get(visitor))
+
+        output = io.StringIO()
+        self.exporter.write(MarkdownExportVisitor, output)
+        self.assertEqual(output.getvalue(), self.exporter.export(MarkdownExportVisitor))
+
+    def test_word_counts_are_reduced(self):
+        visitor = WordCountVisitor()
+        self.doc.accept(visitor)
+        self.assertEqual(
+            self.exporter.word_count().get_statistics(), visitor.get_statistics()
+        )
+        with self.assertRaises(TypeError):
+            self.exporter.export(WordCountVisitor)
+
+    def test_spawn_and_forkserver_pickle_the_document(self):
+        doc = make_document(50, seed=3)
+        visitor = HTMLExportVisitor()
+        doc.accept(visitor)
+        for method in ("spawn", "forkserver"):
+            if method not in multiprocessing.get_all_start_methods():
+                continue
+            with self.subTest(method=method):
+                context = multiprocessing.get_context(method)
+                with ParallelExporter(doc, 2, 8, mp_context=context) as exporter:
+                    self.assertEqual(
+                        exporter.export(HTMLExportVisitor), visitor.get_html()
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
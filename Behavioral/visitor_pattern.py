@@ -15,6 +15,8 @@ class DocumentVisitor(Protocol):
 
 # Element interface
 class DocumentElement(ABC):
+    version = 0  # Hoger na elke wijziging, zie IncrementalDocument.edit()
+
     @abstractmethod
     def accept(self, visitor: DocumentVisitor) -> None:
         """Accept a visitor"""
@@ -77,24 +79,30 @@ class HTMLExportVisitor:
     def __init__(self):
         self.html_parts: list[str] = []
 
+    def _emit(self, part: str) -> None:
+        self.html_parts.append(part)
+
     def visit_paragraph(self, paragraph: Paragraph) -> None:
-        self.html_parts.append(f"<p>{paragraph.text}</p>")
+        self._emit(f"<p>{paragraph.text}</p>")
 
     def visit_heading(self, heading: Heading) -> None:
-        self.html_parts.append(f"<h{heading.level}>{heading.text}</h{heading.level}>")
+        self._emit(f"<h{heading.level}>{heading.text}</h{heading.level}>")
 
     def visit_image(self, image: Image) -> None:
-        self.html_parts.append(f'<img src="{image.url}" alt="{image.alt_text}" />')
+        self._emit(f'<img src="{image.url}" alt="{image.alt_text}" />')
 
-    def visit_table(self, table: Table) -> None:
-        html = "<table>\n"
+    @staticmethod
+    def _table_lines(table: Table):
+        # Per rij één stuk: samengevoegd met "\n" geeft het de hele tabel
+        yield "<table>"
         for row in table.data:
-            html += "  <tr>\n"
-            for cell in row:
-                html += f"    <td>{cell}</td>\n"
-            html += "  </tr>\n"
-        html += "</table>"
-        self.html_parts.append(html)
+            cells = "\n".join([f"    <td>{cell}</td>" for cell in row])
+            yield f"  <tr>\n{cells}\n  </tr>" if row else "  <tr>\n  </tr>"
+        yield "</table>"
+
+    def visit_table(self, table: Table) -> None:
+        # Eén join i.p.v. herhaald html += ...: lineair in de grootte van de tabel
+        self._emit("\n".join(self._table_lines(table)))
 
     def get_html(self) -> str:
         return "\n".join(self.html_parts)
@@ -139,15 +147,18 @@ class MarkdownExportVisitor:
     def __init__(self):
         self.markdown_parts: list[str] = []
 
+    def _emit(self, part: str) -> None:
+        self.markdown_parts.append(part)
+
     def visit_paragraph(self, paragraph: Paragraph) -> None:
-        self.markdown_parts.append(f"{paragraph.text}\n")
+        self._emit(f"{paragraph.text}\n")
 
     def visit_heading(self, heading: Heading) -> None:
         prefix = "#" * heading.level
-        self.markdown_parts.append(f"{prefix} {heading.text}\n")
+        self._emit(f"{prefix} {heading.text}\n")
 
     def visit_image(self, image: Image) -> None:
-        self.markdown_parts.append(f"![{image.alt_text}]({image.url})\n")
+        self._emit(f"![{image.alt_text}]({image.url})\n")
 
     def visit_table(self, table: Table) -> None:
         if not table.data:
@@ -156,15 +167,15 @@ class MarkdownExportVisitor:
         # Header row
         header = "| " + " | ".join(table.data[0]) + " |"
         separator = "|" + "|".join([" --- " for _ in table.data[0]]) + "|"
-        self.markdown_parts.append(header)
-        self.markdown_parts.append(separator)
+        self._emit(header)
+        self._emit(separator)
 
         # Data rows
         for row in table.data[1:]:
             row_str = "| " + " | ".join(row) + " |"
-            self.markdown_parts.append(row_str)
+            self._emit(row_str)
 
-        self.markdown_parts.append("")
+        self._emit("")
 
     def get_markdown(self) -> str:
         return "\n".join(self.markdown_parts)
@@ -175,23 +186,26 @@ class PlainTextVisitor:
     def __init__(self):
         self.text_parts: list[str] = []
 
+    def _emit(self, part: str) -> None:
+        self.text_parts.append(part)
+
     def visit_paragraph(self, paragraph: Paragraph) -> None:
-        self.text_parts.append(paragraph.text)
-        self.text_parts.append("")
+        self._emit(paragraph.text)
+        self._emit("")
 
     def visit_heading(self, heading: Heading) -> None:
-        self.text_parts.append(heading.text.upper())
-        self.text_parts.append("=" * len(heading.text))
-        self.text_parts.append("")
+        self._emit(heading.text.upper())
+        self._emit("=" * len(heading.text))
+        self._emit("")
 
     def visit_image(self, image: Image) -> None:
-        self.text_parts.append(f"[Afbeelding: {image.alt_text}]")
-        self.text_parts.append("")
+        self._emit(f"[Afbeelding: {image.alt_text}]")
+        self._emit("")
 
     def visit_table(self, table: Table) -> None:
         for row in table.data:
-            self.text_parts.append(" | ".join(row))
-        self.text_parts.append("")
+            self._emit(" | ".join(row))
+        self._emit("")
 
     def get_text(self) -> str:
         return "\n".join(self.text_parts)
@@ -0,0 +1,139 @@
+from typing import Callable, TextIO
+
+from Behavioral.visitor_pattern import (
+    Document,
+    HTMLExportVisitor,
+    MarkdownExportVisitor,
+    PlainTextVisitor,
+    Table,
+)
+
+BUFFER_SIZE = 64 * 1024  # Tekens per write() naar de onderliggende stream
+
+
+# Verzamelt kleine stukjes tekst en schrijft ze in blokken door
+class BufferedWriter:
+    """
+    `write` is de write-methode van een tekststream, of van een bytestream
+    (socket, asyncio.StreamWriter) als `encoding` gezet is. Er staan nooit
+    meer dan ongeveer `buffer_size` tekens in het geheugen.
+    """
+
+    def __init__(
+        self,
+        write: Callable,
+        buffer_size: int = BUFFER_SIZE,
+        encoding: str | None = None,
+    ):
+        self._write = write
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self._parts: list[str] = []
+        self._size = 0
+        self.flushes = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._parts:
+            return
+        data = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self.flushes += 1
+        self._write(data if self.encoding is None else data.encode(self.encoding))
+
+
+# Gedeeld stuk: elk deel direct naar de stream, met dezelfde "\n" als get_*()
+class _StreamingExport:
+    def __init__(
+        self,
+        output: TextIO,
+        buffer_size: int = BUFFER_SIZE,
+        encoding: str | None = None,
+    ):
+        super().__init__()
+        self.writer = BufferedWriter(output.write, buffer_size, encoding)
+        self._separator = ""  # Vóór het eerste deel geen "\n"
+
+    def _emit(self, part: str) -> None:
+        self.writer.write(self._separator + part)
+        self._separator = "\n"
+
+    def flush(self) -> None:
+        self.writer.flush()
+
+
+# Concrete Visitors: zelfde uitvoer als de gewone exports, zonder parts-lijst
+class StreamingHTMLExportVisitor(_StreamingExport, HTMLExportVisitor):
+    def visit_table(self, table: Table) -> None:
+        # Rij per rij, zodat ook een tabel van 100k rijen niet in één string
+        # hoeft te passen
+        for line in self._table_lines(table):
+            self._emit(line)
+
+
+class StreamingMarkdownExportVisitor(_StreamingExport, MarkdownExportVisitor):
+    pass
+
+
+class StreamingPlainTextVisitor(_StreamingExport, PlainTextVisitor):
+    pass
+
+
+def export(document: Document, visitor: _StreamingExport) -> None:
+    document.accept(visitor)
+    visitor.flush()
+
+
+async def export_async(
+    document: Document,
+    visitor_class: type[_StreamingExport],
+    writer,
+    buffer_size: int = BUFFER_SIZE,
+    encoding: str = "utf-8",
+) -> None:
+    """
+    Export naar een asyncio.StreamWriter. Na elke volle buffer wacht drain() tot
+    de transportbuffer weer onder de high-water mark zit; een grote tabel gaat
+    wel eerst helemaal naar de transport.
+    """
+    visitor = visitor_class(writer, buffer_size, encoding)
+    flushes = 0
+    for element in document.elements:
+        element.accept(visitor)
+        if visitor.writer.flushes != flushes:
+            flushes = visitor.writer.flushes
+            await writer.drain()
+    visitor.flush()
+    await writer.drain()
+
+
+# Gebruik
+if __name__ == "__main__":
+    import os
+    import sys
+    import tracemalloc
+
+    from Behavioral.visitor_pattern import Heading, Paragraph
+
+    doc = Document("Klein")
+    doc.add_element(Heading("Streaming", 2))
+    doc.add_element(Paragraph("Rechtstreeks naar stdout."))
+    doc.add_element(Table(2, 2, [["Pattern", "Type"], ["Visitor", "Behavioral"]]))
+    export(doc, StreamingMarkdownExportVisitor(sys.stdout))
+    print()
+
+    rows = [["Meting", "Waarde"]] + [[f"#{i}", str(i * i)] for i in range(100_000)]
+    big = Document("Groot rapport")
+    big.add_element(Table(len(rows), 2, rows))
+    tracemalloc.start()
+    with open(os.devnull, "w") as output:
+        export(big, StreamingHTMLExportVisitor(output))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\nTabel van {len(rows):,} rijen geëxporteerd, piek {peak / 1024:.0f} KiB")
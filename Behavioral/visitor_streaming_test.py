@@ -0,0 +1,70 @@
+import asyncio
+import io
+import unittest
+from unittest import TestCase
+
+from Behavioral.visitor_fixtures import make_document
+from Behavioral.visitor_pattern import (
+    HTMLExportVisitor,
+    MarkdownExportVisitor,
+    PlainTextVisitor,
+    Table,
+)
+from Behavioral.visitor_streaming import (
+    StreamingHTMLExportVisitor,
+    StreamingMarkdownExportVisitor,
+    StreamingPlainTextVisitor,
+    export,
+    export_async,
+)
+
+
+class RecordingStreamWriter:
+    """Gedraagt zich als asyncio.StreamWriter: write(bytes) en drain()"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+
+class TestStreamingVisitors(TestCase):
+    def setUp(self):
+        self.doc = make_document(2_000, seed=3)
+        self.doc.add_element(Table(0, 0, []))
+        self.pairs = [
+            (HTMLExportVisitor, HTMLExportVisitor.get_html, StreamingHTMLExportVisitor),
+            (
+                MarkdownExportVisitor,
+                MarkdownExportVisitor.get_markdown,
+                StreamingMarkdownExportVisitor,
+            ),
+            (PlainTextVisitor, PlainTextVisitor.get_text, StreamingPlainTextVisitor),
+        ]
+
+    def test_same_output_as_buffered_visitors(self):
+        for visitor_class, get, streaming_class in self.pairs:
+            visitor = visitor_class()
+            self.doc.accept(visitor)
+            output = io.StringIO()
+            export(self.doc, streaming_class(output, buffer_size=100))
+            self.assertEqual(output.getvalue(), get(visitor))
+
+    def test_async_export_encodes_and_drains(self):
+        visitor = HTMLExportVisitor()
+        self.doc.accept(visitor)
+        writer = RecordingStreamWriter()
+        asyncio.run(
+            export_async(self.doc, StreamingHTMLExportVisitor, writer, buffer_size=512)
+        )
+        self.assertEqual(writer.data.decode("utf-8"), visitor.get_html())
+        self.assertGreater(writer.drains, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+# Frame: lengte en crc32 van de payload, daarna de payload zelf
+_FRAME = struct.Struct("<II")
+
+
+def frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_frames(data, offset: int = 0, end: int | None = None):
+    """(einde, payload) per geldig frame vanaf offset, tot het eerste foute"""
+    if end is None:
+        end = len(data)
+    while offset + _FRAME.size <= end:
+        size, crc = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        if start + size > end:
+            return  # Half geschreven frame na een crash
+        payload = data[start : start + size]
+        if zlib.crc32(payload) != crc:
+            return
+        offset = start + size
+        yield offset, payload
+
+
+def scan(path: str, offset: int = 0):
+    """read_frames over een bestand via mmap; een ontbrekend bestand is leeg"""
+    if not os.path.exists(path) or os.path.getsize(path) <= offset:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from read_frames(mm, offset)
+
+
+def valid_end(path: str, offset: int = 0) -> int:
+    """Einde van het laatste geldige frame vanaf offset (op een framegrens)"""
+    for offset, _ in scan(path, offset):
+        pass
+    if os.path.exists(path):
+        offset = min(offset, os.path.getsize(path))
+    return offset
+
+
+# Append-only log van frames met gebatchte fsync
+class AppendLog:
+    """
+    Een frame staat uiterlijk `sync_interval` seconden na append() op schijf:
+    komt er daarna niets meer binnen, dan synct een timer de laatste batch.
+    flush() en close() syncen meteen. Bij het openen wordt alles na `offset`
+    afgekapt (standaard het einde van het laatste geldige frame), zodat nieuwe
+    frames niet achter een half geschreven staartje van een crash belanden.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sync_every: int = 64,
+        sync_interval: float = 0.05,
+        offset: int | None = None,
+    ):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        if offset is None:
+            offset = valid_end(path)
+        if os.path.exists(path) and os.path.getsize(path) > offset:
+            os.truncate(path, offset)
+        self._file = open(path, "ab")
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending = bytearray()
+        self._pending_records = 0
+        self._last_sync = time.monotonic()
+        self.records = 0  # Frames in deze sessie
+
+    def append(self, payload: bytes) -> None:
+        with self._lock:
+            self._pending += frame(payload)
+            self._pending_records += 1
+            self.records += 1
+            if (
+                self._pending_records >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval
+            ):
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.sync_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Schrijf gebufferde frames weg en fsync in één keer"""
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+
+    def tell(self) -> int:
+        """Einde van het log na flush(), bv. als offset voor een snapshot"""
+        with self._lock:
+            return self._file.tell() + len(self._pending)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            self._file.write(self._pending)
+            self._pending.clear()
+            self._pending_records = 0
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._file.close()
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+from append_log import AppendLog, frame, read_frames, scan, valid_end
+
+
+class TestAppendLog(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "frames.log")
+
+    def test_frames_round_trip_until_first_bad_one(self):
+        data = bytearray(frame(b"een") + frame(b"") + frame(b"drie"))
+        self.assertEqual(
+            [payload for _, payload in read_frames(data)], [b"een", b"", b"drie"]
+        )
+        data[-1] ^= 0xFF  # Corrupte payload: CRC klopt niet meer
+        self.assertEqual([payload for _, payload in read_frames(data)], [b"een", b""])
+
+    def test_torn_tail_is_cut_before_appending(self):
+        log = AppendLog(self.path)
+        log.append(b"eerste")
+        log.close()
+        with open(self.path, "ab") as f:
+            f.write(frame(b"half")[:-2])  # Crash midden in een frame
+        end = valid_end(self.path)
+        self.assertEqual(end, len(frame(b"eerste")))
+
+        log = AppendLog(self.path)
+        log.append(b"tweede")
+        log.close()
+        self.assertEqual(
+            [payload for _, payload in scan(self.path)], [b"eerste", b"tweede"]
+        )
+        self.assertEqual(
+            list(scan(self.path, offset=end)), [(os.path.getsize(self.path), b"tweede")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import random
+import time
+
+from command_2_pattern import (
+    DeleteCommand,
+    InsertCommand,
+    MacroCommand,
+    PieceTableBuffer,
+    StringBuffer,
+    TextEditor,
+)
+
+SIZES = [1_000, 100_000, 10_000_000]
+EDITS = 1_000
+MACRO_SIZE = 10_000
+MACRO_DOCUMENT = 1_000_000
+
+
+def run_edits(editor: TextEditor, edits: int, seed: int) -> float:
+    """Voer willekeurige insert/delete/replace bewerkingen uit, geef duur terug"""
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(edits):
+        size = len(editor.buffer)
+        position = rng.randint(0, size)
+        action = rng.random()
+        if action < 0.6:
+            editor.insert(position, "x")
+        elif action < 0.9:
+            editor.delete(position, 1)
+        else:
+            editor.replace(position, 3, "abc")
+    editor.get_text()  # De tekst lui opbouwen hoort bij de meting
+    return time.perf_counter() - start
+
+
+def build_macro(editor: TextEditor, count: int, size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    commands = []
+    for _ in range(count):
+        position = rng.randint(0, size)
+        if rng.random() < 0.6:
+            commands.append(InsertCommand(editor, position, "ab"))
+            size += 2
+        else:
+            commands.append(DeleteCommand(editor, position, 1))
+            size = max(position, size - 1)
+    return commands
+
+
+def macro_benchmark():
+    """Macro van MACRO_SIZE sub-commands: per sub-command of gecompileerd"""
+    document = "a" * MACRO_DOCUMENT
+    editor = TextEditor(StringBuffer(document), verbose=False)
+    macro = MacroCommand(build_macro(editor, MACRO_SIZE, len(document), seed=1))
+
+    start = time.perf_counter()
+    macro.execute()
+    macro.undo()
+    plain_time = time.perf_counter() - start
+    expected = editor.get_text()
+
+    start = time.perf_counter()
+    compiled = macro.compile(editor)
+    compiled.execute()
+    compiled.undo()
+    compiled_time = time.perf_counter() - start
+    assert editor.get_text() == expected == document
+
+    print(
+        f"\nMacro met {MACRO_SIZE:,} sub-commands op {MACRO_DOCUMENT:,} tekens "
+        f"(execute + undo):"
+    )
+    print(f"  per sub-command: {plain_time:.4f} s")
+    print(f"  gecompileerd:    {compiled_time:.4f} s")
+    print(f"  factor:          {plain_time / compiled_time:.1f}x")
+
+
+def main():
+    print(f"{'tekens':>12} | {'string (s)':>11} | {'piece table (s)':>15} | factor")
+    print("-" * 56)
+    for size in SIZES:
+        document = "a" * size
+        string_editor = TextEditor(StringBuffer(document), verbose=False)
+        piece_editor = TextEditor(PieceTableBuffer(document, seed=1), verbose=False)
+
+        string_time = run_edits(string_editor, EDITS, seed=size)
+        piece_time = run_edits(piece_editor, EDITS, seed=size)
+        assert string_editor.get_text() == piece_editor.get_text()
+
+        print(
+            f"{size:>12,} | {string_time:>11.4f} | {piece_time:>15.4f} | "
+            f"{string_time / piece_time:.1f}x"
+        )
+
+    macro_benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+import random
+import sys
+import time
+from collections import deque
 from typing import Protocol
 
 
@@ -8,33 +12,249 @@ class Command(Protocol):
     def undo(self) -> None: ...
 
 
-# Receiver - de Teksteditor
-class TextEditor:
-    def __init__(self):
-        self.text = ""
+# Buffer Protocol - opslag achter de TextEditor
+class TextBuffer(Protocol):
+    def insert(self, position: int, content: str) -> None: ...
+
+    def delete(self, position: int, length: int) -> str: ...
+
+    def replace(self, position: int, length: int, new_text: str) -> str: ...
+
+    def get_text(self) -> str: ...
+
+    def apply_edits(self, edits: list[tuple[int, int, str]]) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+# Concrete Buffer 1: één string, elke bewerking kopieert het hele document
+class StringBuffer:
+    def __init__(self, text: str = ""):
+        self.text = text
 
     def insert(self, position: int, content: str) -> None:
         self.text = self.text[:position] + content + self.text[position:]
-        print(f"Tekst ingevoegd: '{content}'")
-        print(f"Huidige tekst: '{self.text}'")
 
     def delete(self, position: int, length: int) -> str:
         deleted = self.text[position : position + length]
         self.text = self.text[:position] + self.text[position + length :]
-        print(f"Tekst verwijderd: '{deleted}'")
-        print(f"Huidige tekst: '{self.text}'")
         return deleted
 
     def replace(self, position: int, length: int, new_text: str) -> str:
         old_text = self.text[position : position + length]
         self.text = self.text[:position] + new_text + self.text[position + length :]
-        print(f"Tekst vervangen: '{old_text}' -> '{new_text}'")
-        print(f"Huidige tekst: '{self.text}'")
         return old_text
 
     def get_text(self) -> str:
         return self.text
 
+    def apply_edits(self, edits: list[tuple[int, int, str]]) -> None:
+        """Pas gesorteerde (positie, lengte, tekst) bewerkingen toe in één kopie"""
+        parts = []
+        cursor = 0
+        for position, length, new_text in edits:
+            parts.append(self.text[cursor:position])
+            parts.append(new_text)
+            cursor = position + length
+        parts.append(self.text[cursor:])
+        self.text = "".join(parts)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+
+# Piece table knoop: verwijst naar een stuk van een bronstring (geen kopie)
+class _Piece:
+    __slots__ = ("source", "start", "length", "priority", "size", "left", "right")
+
+    def __init__(self, source: str, start: int, length: int, priority: float):
+        self.source = source
+        self.start = start
+        self.length = length
+        self.priority = priority
+        self.size = length
+        self.left: "_Piece | None" = None
+        self.right: "_Piece | None" = None
+
+    def update(self) -> None:
+        self.size = (
+            self.length
+            + (self.left.size if self.left else 0)
+            + (self.right.size if self.right else 0)
+        )
+
+
+# Concrete Buffer 2: piece table, geïndexeerd met een treap op positie
+class PieceTableBuffer:
+    """Piece table met O(log n) bewerkingen; de tekst wordt lui opgebouwd"""
+
+    def __init__(self, text: str = "", seed: int | None = None):
+        self._random = random.Random(seed)
+        self._root: _Piece | None = None
+        self._cache: str | None = text
+        if text:
+            self._root = self._new_piece(text, 0, len(text))
+
+    def _new_piece(self, source: str, start: int, length: int) -> _Piece:
+        return _Piece(source, start, length, self._random.random())
+
+    def _split(self, node: _Piece | None, position: int):
+        """Splits in (eerste `position` tekens, rest)"""
+        if node is None:
+            return None, None
+        left_size = node.left.size if node.left else 0
+        if position <= left_size:
+            left, node.left = self._split(node.left, position)
+            node.update()
+            return left, node
+        piece_end = left_size + node.length
+        if position >= piece_end:
+            node.right, right = self._split(node.right, position - piece_end)
+            node.update()
+            return node, right
+
+        # Splits binnen dit stuk: beide helften verwijzen naar dezelfde bron
+        offset = position - left_size
+        right = _Piece(
+            node.source, node.start + offset, node.length - offset, node.priority
+        )
+        right.right = node.right
+        right.update()
+        node.length = offset
+        node.right = None
+        node.update()
+        return node, right
+
+    def _merge(self, left: _Piece | None, right: _Piece | None) -> _Piece | None:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
+
+    @staticmethod
+    def _walk(node: _Piece | None):
+        """In-order wandeling zonder recursie"""
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def _collect(self, node: _Piece | None) -> str:
+        return "".join(
+            piece.source[piece.start : piece.start + piece.length]
+            for piece in self._walk(node)
+        )
+
+    def pieces(self):
+        """Geef (bron, start, lengte) van elk stuk in documentvolgorde"""
+        for piece in self._walk(self._root):
+            yield piece.source, piece.start, piece.length
+
+    def _clamp(self, position: int) -> int:
+        return max(0, min(position, len(self)))
+
+    def insert(self, position: int, content: str) -> None:
+        if not content:
+            return
+        left, right = self._split(self._root, self._clamp(position))
+        piece = self._new_piece(content, 0, len(content))
+        self._root = self._merge(self._merge(left, piece), right)
+        self._cache = None
+
+    def _cut(self, position: int, length: int):
+        position = self._clamp(position)
+        left, rest = self._split(self._root, position)
+        middle, right = self._split(rest, max(0, length))
+        return left, middle, right
+
+    def delete(self, position: int, length: int) -> str:
+        left, middle, right = self._cut(position, length)
+        self._root = self._merge(left, right)
+        if middle is not None:
+            self._cache = None
+        return self._collect(middle)
+
+    def replace(self, position: int, length: int, new_text: str) -> str:
+        left, middle, right = self._cut(position, length)
+        if new_text:
+            left = self._merge(left, self._new_piece(new_text, 0, len(new_text)))
+        self._root = self._merge(left, right)
+        self._cache = None
+        return self._collect(middle)
+
+    def get_text(self) -> str:
+        if self._cache is None:
+            self._cache = self._collect(self._root)
+        return self._cache
+
+    def apply_edits(self, edits: list[tuple[int, int, str]]) -> None:
+        # Van achter naar voor, zodat eerdere posities geldig blijven
+        for position, length, new_text in reversed(edits):
+            self.replace(position, length, new_text)
+
+    def piece_count(self) -> int:
+        count = 0
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(child for child in (node.left, node.right) if child)
+        return count
+
+    def __len__(self) -> int:
+        return self._root.size if self._root else 0
+
+
+# Receiver - de Teksteditor
+class TextEditor:
+    def __init__(self, buffer: TextBuffer | None = None, verbose: bool = True):
+        self.buffer = buffer if buffer is not None else StringBuffer()
+        self.verbose = verbose
+
+    @property
+    def text(self) -> str:
+        return self.buffer.get_text()
+
+    def insert(self, position: int, content: str) -> None:
+        self.buffer.insert(position, content)
+        if self.verbose:
+            print(f"Tekst ingevoegd: '{content}'")
+            print(f"Huidige tekst: '{self.text}'")
+
+    def delete(self, position: int, length: int) -> str:
+        deleted = self.buffer.delete(position, length)
+        if self.verbose:
+            print(f"Tekst verwijderd: '{deleted}'")
+            print(f"Huidige tekst: '{self.text}'")
+        return deleted
+
+    def replace(self, position: int, length: int, new_text: str) -> str:
+        old_text = self.buffer.replace(position, length, new_text)
+        if self.verbose:
+            print(f"Tekst vervangen: '{old_text}' -> '{new_text}'")
+            print(f"Huidige tekst: '{self.text}'")
+        return old_text
+
+    def apply_edits(self, edits: list[tuple[int, int, str]]) -> None:
+        self.buffer.apply_edits(edits)
+        if self.verbose:
+            print(f"{len(edits)} bewerking(en) in één keer toegepast")
+            print(f"Huidige tekst: '{self.text}'")
+
+    def get_text(self) -> str:
+        return self.buffer.get_text()
+
 
 # Concrete Commands
 class InsertCommand:
@@ -49,6 +269,20 @@ class InsertCommand:
     def undo(self) -> None:
         self.editor.delete(self.position, len(self.text))
 
+    def merge(self, other: Command) -> bool:
+        """Neem een direct aansluitende insert op (doortypen)"""
+        if (
+            not isinstance(other, InsertCommand)
+            or other.editor is not self.editor
+            or other.position != self.position + len(self.text)
+        ):
+            return False
+        self.text += other.text
+        return True
+
+    def footprint(self) -> int:
+        return sys.getsizeof(self) + sys.getsizeof(self.text)
+
 
 class DeleteCommand:
     def __init__(self, editor: TextEditor, position: int, length: int):
@@ -63,6 +297,25 @@ class DeleteCommand:
     def undo(self) -> None:
         self.editor.insert(self.position, self.deleted_text)
 
+    def merge(self, other: Command) -> bool:
+        """Neem een aansluitende delete op (backspace of delete-toets)"""
+        if not isinstance(other, DeleteCommand) or other.editor is not self.editor:
+            return False
+        if other.position + len(other.deleted_text) == self.position:
+            # Backspace: het nieuwe stuk staat vóór het vorige
+            self.position = other.position
+            self.deleted_text = other.deleted_text + self.deleted_text
+        elif other.position == self.position:
+            # Delete-toets: het nieuwe stuk schoof op dezelfde positie
+            self.deleted_text += other.deleted_text
+        else:
+            return False
+        self.length = len(self.deleted_text)
+        return True
+
+    def footprint(self) -> int:
+        return sys.getsizeof(self) + sys.getsizeof(self.deleted_text)
+
 
 class ReplaceCommand:
     def __init__(self, editor: TextEditor, position: int, length: int, new_text: str):
@@ -78,6 +331,13 @@ class ReplaceCommand:
     def undo(self) -> None:
         self.editor.replace(self.position, len(self.new_text), self.old_text)
 
+    def footprint(self) -> int:
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.new_text)
+            + sys.getsizeof(self.old_text)
+        )
+
 
 # Macro Command - combineert meerdere commands
 class MacroCommand:
@@ -97,24 +357,189 @@ class MacroCommand:
             command.undo()
         print("--- Macro Undo End ---")
 
+    def footprint(self) -> int:
+        return sys.getsizeof(self) + sum(
+            command_footprint(command) for command in self.commands
+        )
+
+    def compile(self, editor: TextEditor) -> "CompiledMacroCommand":
+        return CompiledMacroCommand(editor, self.commands)
+
+
+# Gecompileerde Macro - alle sub-commands samengevoegd tot één edit script
+class CompiledMacroCommand(MacroCommand):
+    """
+    Voert de sub-commands eerst uit op een piece table kopie en leidt daaruit
+    een minimaal edit script af tegenover de oorspronkelijke tekst. De editor
+    wordt daarna één keer herschreven, zowel bij execute als bij undo.
+    """
+
+    def __init__(self, editor: TextEditor, commands: list[Command]):
+        super().__init__(commands)
+        self.editor = editor
+        self.edits: list[tuple[int, int, str]] | None = None
+        self.inverse_edits: list[tuple[int, int, str]] = []
+
+    def execute(self) -> None:
+        if self.edits is None:
+            self._compile()
+        self.editor.apply_edits(self.edits)
+
+    def undo(self) -> None:
+        self.editor.apply_edits(self.inverse_edits)
+
+    def _compile(self) -> None:
+        original = self.editor.get_text()
+        scratch = PieceTableBuffer(original)
+        for command in self.commands:
+            _replay(command, scratch)
+
+        # Stukken uit de oorspronkelijke tekst blijven staan, de rest is nieuw
+        edits = []
+        cursor = 0
+        inserted: list[str] = []
+        for source, start, length in scratch.pieces():
+            if source is original and start >= cursor:
+                if start > cursor or inserted:
+                    edits.append((cursor, start - cursor, "".join(inserted)))
+                    inserted.clear()
+                cursor = start + length
+            else:
+                inserted.append(source[start : start + length])
+        if cursor < len(original) or inserted:
+            edits.append((cursor, len(original) - cursor, "".join(inserted)))
+
+        inverse_edits = []
+        shift = 0
+        for position, length, new_text in edits:
+            old_text = original[position : position + length]
+            inverse_edits.append((position + shift, len(new_text), old_text))
+            shift += len(new_text) - length
+        self.edits = edits
+        self.inverse_edits = inverse_edits
+
+
+def _replay(command: Command, buffer: TextBuffer) -> None:
+    """Voer een command uit op een andere buffer en vul zijn undo-gegevens in"""
+    if isinstance(command, InsertCommand):
+        buffer.insert(command.position, command.text)
+    elif isinstance(command, DeleteCommand):
+        command.deleted_text = buffer.delete(command.position, command.length)
+    elif isinstance(command, ReplaceCommand):
+        command.old_text = buffer.replace(
+            command.position, command.length, command.new_text
+        )
+    elif isinstance(command, MacroCommand):
+        for sub_command in command.commands:
+            _replay(sub_command, buffer)
+    else:
+        raise TypeError(f"Kan {type(command).__name__} niet compileren")
+
+
+def command_footprint(command: Command) -> int:
+    """Geschat geheugengebruik van een command in bytes"""
+    footprint = getattr(command, "footprint", None)
+    return footprint() if footprint else sys.getsizeof(command)
+
 
 # Invoker - Command Manager met undo/redo
 class CommandManager:
-    def __init__(self):
-        self.history: list[Command] = []
+    """
+    Houdt de history bij met optioneel samenvoegen van bewerkingen.
+
+    merge_window: maximaal aantal seconden tussen twee aansluitende bewerkingen
+    om ze samen te voegen tot één command (None = niet samenvoegen).
+    max_entries / max_bytes: limiet op de history; de oudste commands vallen af.
+    Het nieuwste command blijft altijd staan, ook als het alleen al groter is
+    dan max_bytes: anders kan de laatste bewerking niet ongedaan gemaakt worden.
+    """
+
+    def __init__(
+        self,
+        merge_window: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        clock=time.monotonic,
+    ):
+        self.history: deque[Command] = deque()
         self.redo_stack: list[Command] = []
+        self.merge_window = merge_window
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._last_time: float | None = None
+        self._footprints: deque[int] = deque()
+
+        # Tellers
+        self.merged_count = 0
+        self.evicted_count = 0
+        self.history_bytes = 0
 
     def execute(self, command: Command) -> None:
         command.execute()
-        self.history.append(command)
         # Clear redo stack na nieuwe actie
         self.redo_stack.clear()
 
+        now = self._clock()
+        if self._try_merge(command, now):
+            self.merged_count += 1
+        else:
+            self._push(command)
+        self._last_time = now
+        self._evict()
+
+    def _try_merge(self, command: Command, now: float) -> bool:
+        if self.merge_window is None or not self.history or self._last_time is None:
+            return False
+        if now - self._last_time > self.merge_window:
+            return False
+        last = self.history[-1]
+        merge = getattr(last, "merge", None)
+        if merge is None or not merge(command):
+            return False
+        # Footprint van het samengevoegde command opnieuw berekenen
+        self.history_bytes -= self._footprints.pop()
+        size = command_footprint(last)
+        self._footprints.append(size)
+        self.history_bytes += size
+        return True
+
+    def _push(self, command: Command) -> None:
+        size = command_footprint(command)
+        self.history.append(command)
+        self._footprints.append(size)
+        self.history_bytes += size
+
+    def _pop(self) -> Command:
+        self.history_bytes -= self._footprints.pop()
+        return self.history.pop()
+
+    def _evict(self) -> None:
+        """Verwijder de oudste commands tot de history binnen de limieten valt"""
+        while len(self.history) > 1 and (
+            (self.max_entries is not None and len(self.history) > self.max_entries)
+            or (self.max_bytes is not None and self.history_bytes > self.max_bytes)
+        ):
+            self.history.popleft()
+            self.history_bytes -= self._footprints.popleft()
+            self.evicted_count += 1
+
+    def get_statistics(self) -> dict:
+        return {
+            "entries": len(self.history),
+            "history_bytes": self.history_bytes,
+            "merged": self.merged_count,
+            "evicted": self.evicted_count,
+            "redo_entries": len(self.redo_stack),
+        }
+
     def undo(self) -> None:
         if self.history:
-            command = self.history.pop()
+            command = self._pop()
             command.undo()
             self.redo_stack.append(command)
+            # Na een undo niet meer samenvoegen met het vorige command
+            self._last_time = None
             print("✓ Undo uitgevoerd")
         else:
             print("✗ Geen acties om ongedaan te maken")
@@ -123,7 +548,9 @@ class CommandManager:
         if self.redo_stack:
             command = self.redo_stack.pop()
             command.execute()
-            self.history.append(command)
+            self._push(command)
+            self._last_time = None
+            self._evict()
             print("✓ Redo uitgevoerd")
         else:
             print("✗ Geen acties om opnieuw te doen")
@@ -0,0 +1,148 @@
+import random
+import unittest
+from unittest import TestCase
+
+from command_2_pattern import (
+    CommandManager,
+    DeleteCommand,
+    InsertCommand,
+    MacroCommand,
+    PieceTableBuffer,
+    ReplaceCommand,
+    StringBuffer,
+    TextEditor,
+)
+
+
+class TestPieceTableBuffer(TestCase):
+    def test_matches_string_buffer(self):
+        rng = random.Random(42)
+        reference = StringBuffer("Hello World")
+        buffer = PieceTableBuffer("Hello World", seed=7)
+        for _ in range(2_000):
+            position = rng.randint(0, len(reference))
+            action = rng.random()
+            if action < 0.5:
+                text = rng.choice(["a", "bc", "def", "\n"])
+                reference.insert(position, text)
+                buffer.insert(position, text)
+            elif action < 0.8:
+                length = rng.randint(0, 4)
+                self.assertEqual(
+                    reference.delete(position, length), buffer.delete(position, length)
+                )
+            else:
+                length = rng.randint(0, 4)
+                self.assertEqual(
+                    reference.replace(position, length, "XY"),
+                    buffer.replace(position, length, "XY"),
+                )
+            self.assertEqual(len(reference), len(buffer))
+        self.assertEqual(reference.get_text(), buffer.get_text())
+
+    def test_get_text_is_cached_until_edit(self):
+        buffer = PieceTableBuffer("abc")
+        self.assertIs(buffer.get_text(), buffer.get_text())
+        buffer.insert(3, "d")
+        self.assertEqual(buffer.get_text(), "abcd")
+
+
+class TestCommandManagerMerging(TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.editor = TextEditor(verbose=False)
+        self.manager = CommandManager(merge_window=1.0, clock=lambda: self.now)
+
+    def type(self, position, text, delay=0.1):
+        self.now += delay
+        self.manager.execute(InsertCommand(self.editor, position, text))
+
+    def test_typing_is_merged_into_one_command(self):
+        for i, char in enumerate("Hello"):
+            self.type(i, char)
+        self.assertEqual(len(self.manager.history), 1)
+        self.assertEqual(self.manager.merged_count, 4)
+        self.manager.undo()
+        self.assertEqual(self.editor.get_text(), "")
+        self.manager.redo()
+        self.assertEqual(self.editor.get_text(), "Hello")
+
+    def test_pause_outside_window_starts_new_command(self):
+        self.type(0, "a")
+        self.type(1, "b", delay=5.0)
+        self.assertEqual(len(self.manager.history), 2)
+
+    def test_backspaces_are_merged(self):
+        self.type(0, "Hello")
+        for position in (4, 3, 2):
+            self.now += 0.1
+            self.manager.execute(DeleteCommand(self.editor, position, 1))
+        self.assertEqual(self.editor.get_text(), "He")
+        self.assertEqual(len(self.manager.history), 2)
+        self.manager.undo()
+        self.assertEqual(self.editor.get_text(), "Hello")
+
+    def test_history_is_bounded(self):
+        manager = CommandManager(max_entries=3)
+        for i in range(10):
+            manager.execute(InsertCommand(self.editor, i, "x"))
+        self.assertEqual(len(manager.history), 3)
+        self.assertEqual(manager.evicted_count, 7)
+
+        manager = CommandManager(max_bytes=500)
+        for i in range(50):
+            manager.execute(InsertCommand(self.editor, 0, "x" * 100))
+        self.assertLessEqual(manager.history_bytes, 500)
+        self.assertEqual(manager.get_statistics()["entries"], len(manager.history))
+
+    def test_oversized_command_is_kept_and_can_be_undone(self):
+        manager = CommandManager(max_bytes=500)
+        manager.execute(InsertCommand(self.editor, 0, "kort"))
+        manager.execute(InsertCommand(self.editor, 4, "x" * 1_000))
+        self.assertEqual(len(manager.history), 1)
+        self.assertEqual(manager.evicted_count, 1)
+        manager.undo()
+        self.assertEqual(self.editor.get_text(), "kort")
+
+
+class TestCompiledMacroCommand(TestCase):
+    def random_commands(self, editor, count, size, rng):
+        commands = []
+        for _ in range(count):
+            position = rng.randint(0, size)
+            action = rng.random()
+            if action < 0.5:
+                commands.append(InsertCommand(editor, position, "ab"))
+                size += 2
+            elif action < 0.8:
+                commands.append(DeleteCommand(editor, position, 3))
+                size = max(position, size - 3)
+            else:
+                commands.append(ReplaceCommand(editor, position, 2, "XYZ"))
+                size = max(position, size - 2) + 3
+        return commands
+
+    def test_matches_macro_command(self):
+        rng = random.Random(3)
+        for buffer_type in (StringBuffer, PieceTableBuffer):
+            original = "The quick brown fox jumps over the lazy dog"
+            expected_editor = TextEditor(StringBuffer(original), verbose=False)
+            editor = TextEditor(buffer_type(original), verbose=False)
+            commands = self.random_commands(editor, 200, len(original), rng)
+            for command in commands:
+                command.editor = expected_editor
+            MacroCommand(commands).execute()
+            for command in commands:
+                command.editor = editor
+
+            compiled = MacroCommand(commands).compile(editor)
+            compiled.execute()
+            self.assertEqual(editor.get_text(), expected_editor.get_text())
+            compiled.undo()
+            self.assertEqual(editor.get_text(), original)
+            compiled.execute()
+            self.assertEqual(editor.get_text(), expected_editor.get_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
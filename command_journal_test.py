@@ -0,0 +1,104 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import TestCase
+
+from command_2_pattern import (
+    DeleteCommand,
+    InsertCommand,
+    MacroCommand,
+    ReplaceCommand,
+    TextEditor,
+)
+from command_journal import CommandJournal, JournaledCommandManager, recover
+
+
+class TestCommandJournal(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "editor.journal")
+        self.editor = TextEditor(verbose=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_session(self, snapshot_every):
+        journal = CommandJournal(self.path, snapshot_every=snapshot_every)
+        manager = JournaledCommandManager(self.editor, journal)
+        manager.execute(InsertCommand(self.editor, 0, "Hello World"))
+        manager.execute(DeleteCommand(self.editor, 5, 6))
+        manager.execute(ReplaceCommand(self.editor, 0, 5, "Hallo"))
+        manager.undo()
+        manager.redo()
+        manager.execute(
+            MacroCommand(
+                [
+                    InsertCommand(self.editor, 5, " wereld"),
+                    DeleteCommand(self.editor, 0, 1),
+                ]
+            )
+        )
+        manager.undo()
+        manager.execute(InsertCommand(self.editor, 0, "Ça va? "))
+        journal.close()
+
+    def test_replay_from_journal(self):
+        self.run_session(snapshot_every=1_000)
+        self.assertEqual(recover(self.path).editor.get_text(), self.editor.get_text())
+
+    def test_replay_from_snapshot_and_tail(self):
+        self.run_session(snapshot_every=3)
+        self.assertTrue(os.path.exists(self.path + ".snap"))
+        self.assertEqual(recover(self.path).editor.get_text(), self.editor.get_text())
+
+    def test_torn_record_is_ignored(self):
+        journal = CommandJournal(self.path)
+        manager = JournaledCommandManager(self.editor, journal)
+        manager.execute(InsertCommand(self.editor, 0, "kept"))
+        journal.flush()
+        manager.execute(InsertCommand(self.editor, 4, " lost"))
+        journal.close()
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 2)
+        self.assertEqual(recover(self.path).editor.get_text(), "kept")
+
+    def test_append_after_torn_tail_survives_next_recovery(self):
+        journal = CommandJournal(self.path)
+        manager = JournaledCommandManager(self.editor, journal)
+        manager.execute(InsertCommand(self.editor, 0, "kept"))
+        manager.execute(InsertCommand(self.editor, 4, " lost"))
+        journal.close()
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 2)  # Crash midden in een record
+
+        recovery = recover(self.path)
+        editor = recovery.editor
+        journal = CommandJournal(self.path, offset=recovery.offset)
+        manager = JournaledCommandManager(editor, journal)
+        manager.execute(InsertCommand(editor, 4, " en nieuw"))
+        journal.close()
+        self.assertEqual(recover(self.path).editor.get_text(), "kept en nieuw")
+
+        # Zonder offset bepaalt het journal zelf het geldige einde
+        with open(self.path, "ab") as f:
+            f.write(b"\x00\x01")
+        journal = CommandJournal(self.path)
+        JournaledCommandManager(editor, journal).execute(InsertCommand(editor, 0, ">"))
+        journal.close()
+        self.assertEqual(recover(self.path).editor.get_text(), ">kept en nieuw")
+
+    def test_idle_journal_syncs_within_interval(self):
+        journal = CommandJournal(self.path, sync_every=1_000, sync_interval=0.2)
+        self.addCleanup(journal.close)
+        journal.flush()
+        journal.record(InsertCommand(self.editor, 0, "idle"))
+        self.assertEqual(os.path.getsize(self.path), 0)
+        deadline = time.monotonic() + 2
+        while os.path.getsize(self.path) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertGreater(os.path.getsize(self.path), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()